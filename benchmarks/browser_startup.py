@@ -0,0 +1,79 @@
+"""
+Browser start-up time with the default and the fast startup profile.
+
+Each iteration times `BrowserSettings.get_driver()` plus one `about:blank` navigation, then
+quits. Browsers that are not installed are reported as skipped.
+
+    python -m benchmarks.browser_startup                          # chrome, firefox, edge x 5
+    python -m benchmarks.browser_startup -b chrome -n 10 -o startup.json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from selenium.common import WebDriverException
+
+from core.browser.browser import BrowserSettings
+from core.browser.browser_type import BrowserType
+from core.browser.startup_profile_type import StartupProfile
+
+
+def measure(browser: BrowserType, profile: StartupProfile, iterations: int) -> dict:
+    samples = []
+    for _ in range(iterations):
+        settings = BrowserSettings(browser_type=browser, startup_profile=profile)
+        started = time.perf_counter()
+        try:
+            driver = settings.get_driver()
+            driver.get("about:blank")
+            samples.append(time.perf_counter() - started)
+        except WebDriverException as e:
+            return {"browser": browser.value, "profile": profile.value, "skipped": e.msg}
+        finally:
+            settings.quit_driver()
+    return {
+        "browser": browser.value,
+        "profile": profile.value,
+        "iterations": iterations,
+        "mean_seconds": round(statistics.fmean(samples), 3),
+        "median_seconds": round(statistics.median(samples), 3),
+        "min_seconds": round(min(samples), 3),
+        "max_seconds": round(max(samples), 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-b", "--browsers", nargs="+", default=[b.value for b in BrowserType],
+                        choices=[b.value for b in BrowserType])
+    parser.add_argument("-n", "--iterations", type=int, default=5)
+    parser.add_argument("-o", "--output", type=Path, help="Write the JSON results to this file.")
+    args = parser.parse_args()
+
+    results = []
+    for browser in map(BrowserType, args.browsers):
+        by_profile = {}
+        for profile in StartupProfile:
+            result = measure(browser, profile, args.iterations)
+            by_profile[profile] = result
+            results.append(result)
+        default, fast = by_profile[StartupProfile.DEFAULT], by_profile[StartupProfile.FAST]
+        if "mean_seconds" in default and "mean_seconds" in fast:
+            saved = default["mean_seconds"] - fast["mean_seconds"]
+            print(f"{browser.value}: default {default['mean_seconds']}s, fast {fast['mean_seconds']}s "
+                  f"-> {saved:.3f}s saved per launch", file=sys.stderr)
+        else:
+            print(f"{browser.value}: skipped ({default.get('skipped') or fast.get('skipped')})", file=sys.stderr)
+
+    payload = json.dumps({"benchmark": "browser_startup", "results": results}, indent=2)
+    if args.output:
+        args.output.write_text(payload, encoding="utf-8")
+    print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Wall time to log in K demo users: a sequential loop over `LoginPage` vs concurrent sessions
+driven from one event loop through `core.actions.async_actions.AsyncBrowsers`.
+
+Each login starts a browser, opens the login page, submits the credentials, waits for the
+inventory page or the error banner, and quits. Runs against the local Sauce Demo copy
+(`benchmarks/local_site.py`) unless `--url` is given.
+
+    python -m benchmarks.concurrent_logins                        # 6 users, pool = browser capacity
+    python -m benchmarks.concurrent_logins -k 12 -w 6 --url https://www.saucedemo.com -o logins.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import sys
+import time
+from pathlib import Path
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from benchmarks.local_site import LocalSite
+from core.actions.async_actions import AsyncBrowsers
+from core.browser.browser import BrowserSettings
+from core.browser.browser_slots import browser_capacity
+from pages.login_page import LoginPage
+
+USERS = ("standard_user", "problem_user", "performance_glitch_user", "error_user", "visual_user", "locked_out_user")
+PASSWORD = "secret_sauce"
+_OUTCOME_TIMEOUT = 10
+
+
+def login_outcome(driver: WebDriver) -> str:
+    """Waits for the inventory title or the login error; returns `inventory` or `error`."""
+    return LoginPage(driver).wait_for_outcome(_OUTCOME_TIMEOUT).value
+
+
+def sequential(base_url: str, users: list[str]) -> list[str]:
+    outcomes = []
+    for user in users:
+        settings = BrowserSettings()
+        driver = settings.get_driver()
+        try:
+            LoginPage(driver).open(base_url).login(user, PASSWORD)
+            outcomes.append(login_outcome(driver))
+        finally:
+            settings.quit_driver()
+    return outcomes
+
+
+async def concurrent(base_url: str, users: list[str], workers: int) -> list[str]:
+    async with AsyncBrowsers(max_workers=workers) as browsers:
+        async def login(user: str) -> str:
+            async with browsers.session() as session:
+                page = await session.page(LoginPage).open(base_url)
+                await page.login(user, PASSWORD)
+                return await session.run(login_outcome)
+
+        return await asyncio.gather(*(login(user) for user in users))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", "--users", type=int, default=len(USERS), help="Logins per run (cycles the demo users).")
+    parser.add_argument("-w", "--workers", type=int, default=0, help="Concurrent sessions; 0 = browser capacity.")
+    parser.add_argument("--url", help="Site to log in to; defaults to the local Sauce Demo copy.")
+    parser.add_argument("-o", "--output", type=Path, help="Write the JSON results to this file.")
+    args = parser.parse_args()
+
+    users = [USERS[i % len(USERS)] for i in range(args.users)]
+    workers = args.workers or browser_capacity()
+    with contextlib.ExitStack() as stack:
+        base_url = args.url or stack.enter_context(LocalSite()).url
+        started = time.perf_counter()
+        sequential_outcomes = sequential(base_url, users)
+        sequential_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        concurrent_outcomes = asyncio.run(concurrent(base_url, users, workers))
+        concurrent_seconds = time.perf_counter() - started
+
+    print(f"{len(users)} logins: sequential {sequential_seconds:.2f}s, concurrent ({workers} sessions) "
+          f"{concurrent_seconds:.2f}s -> {sequential_seconds / concurrent_seconds:.1f}x", file=sys.stderr)
+    payload = json.dumps({
+        "benchmark": "concurrent_logins",
+        "users": len(users),
+        "workers": workers,
+        "sequential_seconds": round(sequential_seconds, 3),
+        "concurrent_seconds": round(concurrent_seconds, 3),
+        "speedup": round(sequential_seconds / concurrent_seconds, 2),
+        "outcomes": [{"user": user, "outcome": outcome} for user, outcome in zip(users, concurrent_outcomes)],
+        "outcomes_match": sequential_outcomes == list(concurrent_outcomes),
+    }, indent=2)
+    if args.output:
+        args.output.write_text(payload, encoding="utf-8")
+    print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+End-to-end login time in a headless browser against the local Sauce Demo copy
+(`benchmarks/local_site.py`), so no network is needed.
+
+Each iteration is one login test: open the login page, sign in as `standard_user` and wait for
+the inventory page. By default one browser is reused and its cookies cleared between tests (as
+the browser pool does); `--fresh-browser` starts and quits a browser per test instead.
+
+    python -m benchmarks.e2e_login                                # configured browser, 20 tests
+    python -m benchmarks.e2e_login -b firefox -n 50 --fresh-browser -o e2e.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from benchmarks.local_site import PASSWORD, LocalSite
+from benchmarks.stats import latency_summary, tests_per_minute
+from core.browser.browser import BrowserSettings
+from core.browser.browser_type import BrowserType
+from core.config.browser_config import browser_config
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+
+
+def _settings(browser: BrowserType, headless: bool) -> BrowserSettings:
+    settings = BrowserSettings(browser_type=browser)
+    settings.headless = headless
+    return settings
+
+
+def _timed(samples: dict[str, list[float]], name: str, call):
+    started = time.perf_counter()
+    result = call()
+    samples.setdefault(name, []).append(time.perf_counter() - started)
+    return result
+
+
+def run(site: LocalSite, browser: BrowserType, iterations: int, fresh_browser: bool = False,
+        headless: bool = True) -> dict:
+    """Runs `iterations` login tests and summarises every step and the whole test."""
+    samples: dict[str, list[float]] = {}
+    shared = None if fresh_browser else _settings(browser, headless)
+    if shared:
+        shared.get_driver()
+    started = time.perf_counter()
+    try:
+        for _ in range(iterations):
+            test_started = time.perf_counter()
+            settings = shared or _settings(browser, headless)
+            if shared:
+                _timed(samples, "reset_state", settings.driver.delete_all_cookies)
+            else:
+                _timed(samples, "start_browser", settings.get_driver)
+            try:
+                login = _timed(samples, "open_login", lambda: LoginPage(settings.driver).open(site.url))
+                _timed(samples, "login", lambda: login.login("standard_user", PASSWORD))
+                loaded = _timed(samples, "inventory_is_loaded", InventoryPage(settings.driver).is_loaded)
+                assert loaded, "Inventory page did not load after login"
+            finally:
+                if not shared:
+                    _timed(samples, "quit_browser", settings.quit_driver)
+            samples.setdefault("test", []).append(time.perf_counter() - test_started)
+    finally:
+        if shared:
+            shared.quit_driver()
+    wall = time.perf_counter() - started
+    return {
+        "browser": browser.value,
+        "fresh_browser": fresh_browser,
+        "headless": headless,
+        "tests": iterations,
+        "wall_seconds": round(wall, 3),
+        "tests_per_minute": tests_per_minute(iterations, wall),
+        "steps": {name: latency_summary(values) for name, values in samples.items()},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-b", "--browser", default=browser_config.browser.value, choices=[b.value for b in BrowserType])
+    parser.add_argument("-n", "--iterations", type=int, default=20)
+    parser.add_argument("--fresh-browser", action="store_true", help="Start a new browser for every test.")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window.")
+    parser.add_argument("-o", "--output", type=Path, help="Write the JSON results to this file.")
+    args = parser.parse_args()
+
+    with LocalSite() as site:
+        result = run(site, BrowserType(args.browser), args.iterations, args.fresh_browser, not args.headed)
+    test = result["steps"]["test"]
+    print(f"{result['tests']} logins: {result['tests_per_minute']} tests/min, "
+          f"p50 {test['p50_ms']} ms, p95 {test['p95_ms']} ms per test", file=sys.stderr)
+
+    payload = json.dumps({"benchmark": "e2e_login", "results": result}, indent=2)
+    if args.output:
+        args.output.write_text(payload, encoding="utf-8")
+    print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Time spent in the framework itself (`Actions`, the wait engine, page objects, step timing and
+logging) per action, measured against `SauceDemoWebDriver` (`tests/fake_webdriver.py`) instead of a browser.
+
+Each iteration is one login test: open the login page, check that no error is shown, type the
+username, fill both credentials, submit, and check the inventory page. Every driver command
+costs `latency` ms; the overhead of an action is its time minus the time spent in those commands.
+No browser or network is needed.
+
+    python -m benchmarks.framework_overhead                       # 0, 1 and 5 ms per command
+    python -m benchmarks.framework_overhead -l 0 2 -n 500 -o overhead.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from loguru import logger
+
+from benchmarks.stats import latency_summary, tests_per_minute
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+from tests.fake_webdriver import PASSWORD, SauceDemoWebDriver
+
+
+def _steps(driver: SauceDemoWebDriver):
+    """The login test as (name, call) pairs; later calls use the pages opened by earlier ones."""
+    pages = {}
+
+    def open_login():
+        pages["login"] = LoginPage(driver).open(driver.base_url)
+
+    def inventory_loaded():
+        pages["inventory"] = InventoryPage(driver)
+        assert pages["inventory"].is_loaded()
+
+    return [
+        ("open_login", open_login),
+        ("error_message_absent", lambda: pages["login"].error_message.absent),
+        ("type_username", lambda: pages["login"].username.type("standard_user")),
+        ("fill_credentials", lambda: pages["login"].fill_credentials("standard_user", PASSWORD)),
+        ("click_login", lambda: pages["login"].login_button.click()),
+        ("inventory_is_loaded", inventory_loaded),
+        ("title_text", lambda: pages["inventory"].title.text),
+    ]
+
+
+def run(latency_ms: float, iterations: int) -> dict:
+    """Runs `iterations` login tests on one fake driver and summarises every step."""
+    driver = SauceDemoWebDriver(latency=latency_ms / 1000)
+    elapsed: dict[str, list[float]] = {}
+    overhead: dict[str, list[float]] = {}
+    commands: dict[str, int] = {}
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for name, call in _steps(driver):
+            count, waited = len(driver.commands), driver.command_seconds
+            step_started = time.perf_counter()
+            call()
+            took = time.perf_counter() - step_started
+            elapsed.setdefault(name, []).append(took)
+            overhead.setdefault(name, []).append(took - (driver.command_seconds - waited))
+            commands[name] = commands.get(name, 0) + len(driver.commands) - count
+    wall = time.perf_counter() - started
+    return {
+        "latency_ms": latency_ms,
+        "tests": iterations,
+        "wall_seconds": round(wall, 3),
+        "tests_per_minute": tests_per_minute(iterations, wall),
+        "actions": {
+            name: {
+                **latency_summary(samples),
+                "commands": round(commands[name] / iterations, 2),
+                "overhead_p50_ms": latency_summary(overhead[name])["p50_ms"],
+                "overhead_p95_ms": latency_summary(overhead[name])["p95_ms"],
+            }
+            for name, samples in elapsed.items()
+        },
+    }
+
+
+def quiet_logging() -> None:
+    """Keeps formatting every log record (part of the overhead) but drops the output."""
+    logger.remove()
+    logger.add(lambda message: None, level="INFO")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-l", "--latency-ms", type=float, nargs="+", default=[0, 1, 5],
+                        help="Delay per WebDriver command, in milliseconds.")
+    parser.add_argument("-n", "--iterations", type=int, default=100)
+    parser.add_argument("-o", "--output", type=Path, help="Write the JSON results to this file.")
+    args = parser.parse_args()
+
+    quiet_logging()
+    results = [run(latency, args.iterations) for latency in args.latency_ms]
+    for result in results:
+        print(f"{result['latency_ms']} ms/command: {result['tests_per_minute']} tests/min", file=sys.stderr)
+        for name, stats in result["actions"].items():
+            print(f"  {name}: p50 {stats['p50_ms']} ms, p95 {stats['p95_ms']} ms, "
+                  f"{stats['commands']} commands, overhead p50 {stats['overhead_p50_ms']} ms", file=sys.stderr)
+
+    payload = json.dumps({"benchmark": "framework_overhead", "results": results}, indent=2)
+    if args.output:
+        args.output.write_text(payload, encoding="utf-8")
+    print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Local, offline stand-in for Sauce Demo: the pages in `benchmarks/site` plus synthetic images and
+fonts, served on 127.0.0.1 with a byte counter so benchmarks can report bytes transferred.
+
+    with LocalSite() as site:
+        driver.get(site.url)
+"""
+
+import random
+import struct
+import threading
+import zlib
+from functools import lru_cache
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+SITE_DIR = Path(__file__).parent / "site"
+# The password every demo user of the local site signs in with (see `site/static/js/app.js`).
+PASSWORD = "secret_sauce"
+
+# Synthetic asset sizes: product photos dominate the real page weight.
+_IMAGE_SIDE = 160
+_FONT_BYTES = 60_000
+
+
+@lru_cache(maxsize=None)
+def _noise_png(seed: int, side: int = _IMAGE_SIDE) -> bytes:
+    """A valid, poorly compressible PNG, so image bytes resemble real product photos."""
+    rng = random.Random(seed)
+    raw = b"".join(b"\x00" + rng.randbytes(side * 3) for _ in range(side))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    header = struct.pack(">IIBBBBB", side, side, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b"")
+
+
+@lru_cache(maxsize=None)
+def _fake_font(seed: int) -> bytes:
+    return b"wOF2" + random.Random(seed).randbytes(_FONT_BYTES)
+
+
+class _Handler(SimpleHTTPRequestHandler):
+    site: "LocalSite"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=str(SITE_DIR), **kwargs)
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path.startswith("/static/img/"):
+            return self._send(_noise_png(zlib.crc32(path.encode())), "image/png")
+        if path.startswith("/static/fonts/"):
+            return self._send(_fake_font(zlib.crc32(path.encode())), "font/woff2")
+        return super().do_GET()
+
+    def _send(self, body: bytes, content_type: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def end_headers(self):
+        self.send_header("Cache-Control", "no-store")
+        super().end_headers()
+
+    def send_header(self, keyword, value):
+        if keyword.lower() == "content-length":
+            self.site.bytes_served += int(value)
+        super().send_header(keyword, value)
+
+    def log_request(self, code="-", size="-"):
+        self.site.requests += 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalSite:
+    """Serves the local Sauce Demo copy on an ephemeral port for the duration of a `with` block."""
+
+    def __init__(self, port: int = 0):
+        handler = type("Handler", (_Handler,), {"site": self})
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self.bytes_served = 0
+        self.requests = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def reset_counters(self) -> None:
+        self.bytes_served = 0
+        self.requests = 0
+
+    def __enter__(self) -> "LocalSite":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
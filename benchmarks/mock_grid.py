@@ -0,0 +1,116 @@
+"""
+Local, offline stand-in for a Selenium Grid hub: answers the W3C WebDriver HTTP protocol on
+127.0.0.1 without a browser, counting TCP connections and commands so tests and benchmarks can
+see what the client side of a remote session costs.
+
+    with MockGrid(handshake_delay=0.02) as grid:
+        driver = webdriver.Remote(command_executor=grid.url, options=ChromeOptions())
+
+`handshake_delay` is slept once per new connection, standing in for the TCP/TLS handshake to a
+real hub; `refusals` makes the next N new-session requests fail as a saturated grid would.
+"""
+
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; with Nagle on, keep-alive replies stall on delayed ACKs.
+    disable_nagle_algorithm = True
+    grid: "MockGrid"
+
+    def setup(self):
+        super().setup()
+        with self.grid.lock:
+            self.grid.connections += 1
+        if self.grid.handshake_delay:
+            time.sleep(self.grid.handshake_delay)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}") if length else {}
+        parts = self.path.strip("/").split("/")
+        with self.grid.lock:
+            self.grid.commands += 1
+            if parts == ["session"] and method == "POST":
+                return self._new_session(payload)
+            session_id = parts[1] if len(parts) > 1 else ""
+            if session_id not in self.grid.sessions:
+                return self._reply(404, {"error": "invalid session id", "message": session_id, "stacktrace": ""})
+            if len(parts) == 2 and method == "DELETE":
+                del self.grid.sessions[session_id]
+                return self._reply(200, None)
+            if parts[2:] == ["url"]:
+                if method == "POST":
+                    self.grid.sessions[session_id] = payload.get("url", "")
+                    return self._reply(200, None)
+                return self._reply(200, self.grid.sessions[session_id])
+        return self._reply(200, None)
+
+    def _new_session(self, payload: dict) -> None:
+        if self.grid.refusals > 0:
+            self.grid.refusals -= 1
+            return self._reply(500, {"error": "session not created",
+                                     "message": "No free slots on the grid", "stacktrace": ""})
+        session_id = uuid.uuid4().hex
+        self.grid.sessions[session_id] = "about:blank"
+        capabilities = payload.get("capabilities", {}).get("alwaysMatch", {})
+        return self._reply(200, {"sessionId": session_id, "capabilities": capabilities})
+
+    def _reply(self, status: int, value) -> None:
+        body = json.dumps({"value": value}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockGrid:
+    """Serves the mock hub on an ephemeral port for the duration of a `with` block."""
+
+    def __init__(self, handshake_delay: float = 0.0, refusals: int = 0, port: int = 0):
+        handler = type("Handler", (_Handler,), {"grid": self})
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self.handshake_delay = handshake_delay
+        self.refusals = refusals
+        self.lock = threading.Lock()
+        self.sessions: dict[str, str] = {}
+        self.connections = 0
+        self.commands = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def reset_counters(self) -> None:
+        with self.lock:
+            self.connections = 0
+            self.commands = 0
+
+    def __enter__(self) -> "MockGrid":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
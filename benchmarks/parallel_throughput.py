@@ -0,0 +1,65 @@
+"""
+Tests-per-minute at 1, 2, 4 and 8 pytest-xdist workers.
+
+Runs the selected tests once per worker count in a subprocess and reads the JUnit XML report
+to count executed tests. Needs the same browser / .env setup as a normal test run.
+
+    python -m benchmarks.parallel_throughput                      # whole suite
+    python -m benchmarks.parallel_throughput -w 1 4 -- -m smoke   # extra args go to pytest
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+
+def run_once(workers: int, pytest_args: list[str]) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        report = Path(tmp) / "junit.xml"
+        command = [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider",
+                   "-n", str(workers), f"--junitxml={report}", *pytest_args]
+        started = time.perf_counter()
+        completed = subprocess.run(command, capture_output=True, text=True)
+        elapsed = time.perf_counter() - started
+        tests = failures = 0
+        if report.exists():
+            for suite in ET.parse(report).getroot().iter("testsuite"):
+                tests += int(suite.get("tests", 0)) - int(suite.get("skipped", 0))
+                failures += int(suite.get("failures", 0)) + int(suite.get("errors", 0))
+    return {
+        "workers": workers,
+        "tests": tests,
+        "failures": failures,
+        "wall_seconds": round(elapsed, 2),
+        "tests_per_minute": round(tests / elapsed * 60, 2) if elapsed else 0.0,
+        "exit_code": completed.returncode,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-w", "--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("-o", "--output", type=Path, help="Write the JSON results to this file.")
+    parser.add_argument("pytest_args", nargs="*", help="Arguments passed through to pytest (after --).")
+    args = parser.parse_args()
+
+    results = []
+    for workers in args.workers:
+        result = run_once(workers, args.pytest_args)
+        print(f"{workers:>2} worker(s): {result['tests']} tests in {result['wall_seconds']}s "
+              f"-> {result['tests_per_minute']} tests/min", file=sys.stderr)
+        results.append(result)
+
+    payload = json.dumps({"benchmark": "parallel_throughput", "results": results}, indent=2)
+    if args.output:
+        args.output.write_text(payload, encoding="utf-8")
+    print(payload)
+
+
+if __name__ == "__main__":
+    main()
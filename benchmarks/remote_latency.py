@@ -0,0 +1,87 @@
+"""
+Client-side cost of remote WebDriver sessions against a mock Grid hub (no browser needed).
+
+Runs the same sessions (new session, N `current_url` commands, quit) through three HTTP clients:
+the shared keep-alive pool of `core.browser.remote` (`grid_pool`), Selenium's default per-session
+pool (`per_session`) and a client without keep-alive (`no_keep_alive`). The mock hub sleeps
+`--handshake-ms` on every new connection to stand in for TCP/TLS set-up with a real hub.
+
+    python -m benchmarks.remote_latency                        # 5 sessions x 100 commands, 20 ms handshake
+    python -m benchmarks.remote_latency -s 10 -c 200 --handshake-ms 50 -o remote.json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.remote.client_config import ClientConfig
+
+from benchmarks.mock_grid import MockGrid
+from core.browser.remote import close_connection_pools, start_remote_driver
+
+
+def _start(client: str, hub_url: str):
+    match client:
+        case "grid_pool":
+            return start_remote_driver(ChromeOptions(), hub_url)
+        case "per_session":
+            return webdriver.Remote(command_executor=hub_url, options=ChromeOptions())
+        case "no_keep_alive":
+            return webdriver.Remote(command_executor=hub_url, options=ChromeOptions(),
+                                    client_config=ClientConfig(remote_server_addr=hub_url, keep_alive=False))
+
+
+def measure(client: str, sessions: int, commands: int, handshake_delay: float) -> dict:
+    close_connection_pools()
+    starts, latencies = [], []
+    with MockGrid(handshake_delay=handshake_delay) as grid:
+        for _ in range(sessions):
+            started = time.perf_counter()
+            driver = _start(client, grid.url)
+            starts.append(time.perf_counter() - started)
+            for _ in range(commands):
+                started = time.perf_counter()
+                driver.current_url
+                latencies.append(time.perf_counter() - started)
+            driver.quit()
+        connections = grid.connections
+    return {
+        "client": client,
+        "sessions": sessions,
+        "commands_per_session": commands,
+        "connections_opened": connections,
+        "session_start_mean_ms": round(statistics.fmean(starts) * 1000, 3),
+        "command_p50_ms": round(statistics.median(latencies) * 1000, 3),
+        "command_p95_ms": round(statistics.quantiles(latencies, n=20)[-1] * 1000, 3),
+        "command_mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-s", "--sessions", type=int, default=5)
+    parser.add_argument("-c", "--commands", type=int, default=100)
+    parser.add_argument("--handshake-ms", type=float, default=20.0)
+    parser.add_argument("-o", "--output", type=Path, help="Write the JSON results to this file.")
+    args = parser.parse_args()
+
+    results = [measure(client, args.sessions, args.commands, args.handshake_ms / 1000)
+               for client in ("grid_pool", "per_session", "no_keep_alive")]
+    for result in results:
+        print(f"{result['client']}: {result['connections_opened']} connection(s), "
+              f"session start {result['session_start_mean_ms']} ms, command p50 {result['command_p50_ms']} ms "
+              f"/ p95 {result['command_p95_ms']} ms", file=sys.stderr)
+
+    payload = json.dumps({"benchmark": "remote_latency", "results": results}, indent=2)
+    if args.output:
+        args.output.write_text(payload, encoding="utf-8")
+    print(payload)
+
+
+if __name__ == "__main__":
+    main()
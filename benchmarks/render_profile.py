@@ -0,0 +1,87 @@
+"""
+`Actions.click` / `Actions.is_visible` latency with the default and the fast render profile,
+against the local Sauce Demo copy (`benchmarks/local_site.py`), whose burger menu slides in and
+fades its links in like the real site.
+
+Each iteration clicks the burger button, checks that a menu link is visible, clicks
+"Reset App State" (which closes the menu) and waits for the menu to be hidden again.
+
+    python -m benchmarks.render_profile                        # configured browser, 10 iterations
+    python -m benchmarks.render_profile -b firefox -n 20 -o render.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from selenium.webdriver.common.by import By
+
+from benchmarks.local_site import LocalSite
+from benchmarks.stats import latency_summary
+from core.actions.actions import Actions
+from core.browser.browser import BrowserSettings
+from core.browser.browser_type import BrowserType
+from core.browser.render_profile_type import RenderProfile
+from core.config.browser_config import browser_config
+
+MENU_BUTTON = (By.ID, "react-burger-menu-btn")
+ALL_ITEMS_LINK = (By.ID, "inventory_sidebar_link")
+RESET_LINK = (By.ID, "reset_sidebar_link")
+MENU = (By.CSS_SELECTOR, ".bm-menu-wrap")
+_TIMEOUT = 10
+
+
+def measure(site: LocalSite, browser: BrowserType, profile: RenderProfile, iterations: int) -> dict:
+    settings = BrowserSettings(browser_type=browser, render_profile=profile)
+    driver = settings.get_driver()
+    samples = {"click_menu": [], "is_visible_link": [], "click_reset": []}
+    try:
+        driver.get(site.url)
+        driver.add_cookie({"name": "session-username", "value": "standard_user", "path": "/"})
+        driver.get(site.url + "/inventory.html")
+        actions = Actions(driver)
+        for _ in range(iterations):
+            for name, call in (
+                ("click_menu", lambda: actions.click(MENU_BUTTON, _TIMEOUT)),
+                ("is_visible_link", lambda: actions.is_visible(ALL_ITEMS_LINK, _TIMEOUT)),
+                ("click_reset", lambda: actions.click(RESET_LINK, _TIMEOUT)),
+            ):
+                started = time.perf_counter()
+                call()
+                samples[name].append(time.perf_counter() - started)
+            actions.waits.until(lambda d: not d.find_element(*MENU).is_displayed(), _TIMEOUT, label="menu closed")
+    finally:
+        settings.quit_driver()
+    return {name: latency_summary(values) for name, values in samples.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-b", "--browser", default=browser_config.browser.value, choices=[b.value for b in BrowserType])
+    parser.add_argument("-n", "--iterations", type=int, default=10)
+    parser.add_argument("-o", "--output", type=Path, help="Write the JSON results to this file.")
+    args = parser.parse_args()
+
+    browser = BrowserType(args.browser)
+    with LocalSite() as site:
+        results = {profile.value: measure(site, browser, profile, args.iterations) for profile in RenderProfile}
+    for step in results[RenderProfile.DEFAULT.value]:
+        default, fast = results[RenderProfile.DEFAULT.value][step], results[RenderProfile.FAST.value][step]
+        print(f"{step}: default p50 {default['p50_ms']} / p95 {default['p95_ms']} ms, "
+              f"fast p50 {fast['p50_ms']} / p95 {fast['p95_ms']} ms", file=sys.stderr)
+
+    payload = json.dumps({
+        "benchmark": "render_profile",
+        "browser": browser.value,
+        "iterations": args.iterations,
+        "results": results,
+    }, indent=2)
+    if args.output:
+        args.output.write_text(payload, encoding="utf-8")
+    print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Page load time and bytes transferred with and without the resource policy, against the local
+Sauce Demo copy (`benchmarks/local_site.py`), so results do not depend on the public site.
+
+    python -m benchmarks.resource_blocking                 # configured browser, 5 loads per page
+    python -m benchmarks.resource_blocking -b firefox -n 10 -o blocking.json
+
+With the default `eager` page load strategy `driver.get` returns at DOMContentLoaded, before
+images, fonts and analytics arrive, so each load is timed until `document.readyState` is
+`complete` and the bytes are read once the site has served no new request for `_QUIET` seconds.
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from benchmarks.local_site import LocalSite
+from core.browser.browser import BrowserSettings
+from core.browser.browser_type import BrowserType
+from core.browser.resource_policy import ResourcePolicy
+from core.config.browser_config import browser_config
+
+BLOCKING = ResourcePolicy(
+    block_resources=["image", "media", "font", "tracker"],
+    block_url_patterns=["*/static/js/analytics.js*"],
+    stubs_enabled=False,
+)
+NO_BLOCKING = ResourcePolicy(block_resources=[], block_url_patterns=[], stubs_enabled=False)
+PAGES = {"login": "/", "inventory": "/inventory.html"}
+_QUIET = 0.25
+_TIMEOUT = 30
+
+
+def _load(driver, site: LocalSite, url: str) -> float:
+    """Loads `url` and returns the seconds until the load event; returns once requests stop."""
+    started = time.perf_counter()
+    driver.get(url)
+    while driver.execute_script("return document.readyState") != "complete":
+        if time.perf_counter() - started > _TIMEOUT:
+            raise TimeoutError(f"{url} did not finish loading within {_TIMEOUT}s")
+        time.sleep(0.01)
+    loaded = time.perf_counter() - started
+    requests, quiet_since = site.requests, time.perf_counter()
+    while time.perf_counter() - quiet_since < _QUIET:
+        time.sleep(0.05)
+        if site.requests != requests:
+            requests, quiet_since = site.requests, time.perf_counter()
+    return loaded
+
+
+def measure(site: LocalSite, browser: BrowserType, policy: ResourcePolicy, iterations: int) -> dict:
+    settings = BrowserSettings(browser_type=browser, resource_policy=policy)
+    driver = settings.get_driver()
+    results = {}
+    try:
+        driver.get(site.url)
+        driver.add_cookie({"name": "session-username", "value": "standard_user", "path": "/"})
+        for page, path in PAGES.items():
+            seconds, transferred = [], []
+            for _ in range(iterations):
+                driver.get("about:blank")
+                site.reset_counters()
+                seconds.append(_load(driver, site, site.url + path))
+                transferred.append(site.bytes_served)
+            results[page] = {
+                "median_seconds": round(statistics.median(seconds), 4),
+                "mean_seconds": round(statistics.fmean(seconds), 4),
+                "bytes": round(statistics.fmean(transferred)),
+            }
+    finally:
+        settings.quit_driver()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-b", "--browser", default=browser_config.browser.value, choices=[b.value for b in BrowserType])
+    parser.add_argument("-n", "--iterations", type=int, default=5)
+    parser.add_argument("-o", "--output", type=Path, help="Write the JSON results to this file.")
+    args = parser.parse_args()
+
+    browser = BrowserType(args.browser)
+    with LocalSite() as site:
+        baseline = measure(site, browser, NO_BLOCKING, args.iterations)
+        blocked = measure(site, browser, BLOCKING, args.iterations)
+    for page in PAGES:
+        print(f"{page}: {baseline[page]['median_seconds']}s / {baseline[page]['bytes']} B without blocking, "
+              f"{blocked[page]['median_seconds']}s / {blocked[page]['bytes']} B with blocking", file=sys.stderr)
+
+    payload = json.dumps({
+        "benchmark": "resource_blocking",
+        "browser": browser.value,
+        "iterations": args.iterations,
+        "results": {"no_blocking": baseline, "blocking": blocked},
+    }, indent=2)
+    if args.output:
+        args.output.write_text(payload, encoding="utf-8")
+    print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2 @@
+// Stand-in for a third-party tracker: one beacon per page view.
+new Image().src = "/static/img/beacon.gif?page=" + encodeURIComponent(location.pathname);
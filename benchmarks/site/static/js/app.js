@@ -0,0 +1,64 @@
+// Minimal Sauce Demo (Swag Labs) behaviour: same element ids / data-test hooks, cookie-based session.
+(function () {
+  const USERS = ["standard_user", "problem_user", "performance_glitch_user", "error_user", "visual_user"];
+  const PASSWORD = "secret_sauce";
+  const ITEMS = ["Backpack", "Bike Light", "Bolt T-Shirt", "Fleece Jacket", "Onesie", "Red T-Shirt"];
+
+  const session = () => (document.cookie.match(/(?:^|; )session-username=([^;]*)/) || [])[1];
+
+  const showError = (message) => {
+    const container = document.querySelector(".error-message-container");
+    container.innerHTML = '<h3 data-test="error"></h3>';
+    container.firstChild.textContent = "Epic sadface: " + message;
+  };
+
+  const form = document.getElementById("login_form");
+  if (form) {
+    form.addEventListener("submit", (event) => {
+      event.preventDefault();
+      const user = document.getElementById("user-name").value;
+      const password = document.getElementById("password").value;
+      if (!user) return showError("Username is required");
+      if (!password) return showError("Password is required");
+      if (user === "locked_out_user" && password === PASSWORD) {
+        return showError("Sorry, this user has been locked out.");
+      }
+      if (!USERS.includes(user) || password !== PASSWORD) {
+        return showError("Username and password do not match any user in this service");
+      }
+      const delay = user === "performance_glitch_user" ? 2500 : 0;
+      setTimeout(() => {
+        document.cookie = "session-username=" + user + "; path=/";
+        location.href = "/inventory.html";
+      }, delay);
+    });
+  }
+
+  const list = document.querySelector(".inventory_list");
+  if (list) {
+    if (!session()) {
+      location.href = "/";
+      return;
+    }
+    ITEMS.forEach((name, index) => {
+      const item = document.createElement("div");
+      item.className = "inventory_item";
+      item.innerHTML = '<img alt=""><div class="inventory_item_name" data-test="inventory-item-name"></div>';
+      item.querySelector("img").src = "/static/img/item-" + index + ".png";
+      item.querySelector(".inventory_item_name").textContent = "Sauce Labs " + name;
+      list.appendChild(item);
+    });
+
+    const menu = document.querySelector(".bm-menu-wrap");
+    const setMenuOpen = (open) => {
+      menu.classList.toggle("open", open);
+      menu.setAttribute("aria-hidden", String(!open));
+    };
+    document.getElementById("react-burger-menu-btn").addEventListener("click", () => setMenuOpen(true));
+    document.getElementById("react-burger-cross-btn").addEventListener("click", () => setMenuOpen(false));
+    document.getElementById("reset_sidebar_link").addEventListener("click", (event) => {
+      event.preventDefault();
+      setMenuOpen(false);
+    });
+  }
+})();
@@ -0,0 +1,20 @@
+"""Latency summaries shared by the benchmark suite, so every result file reports the same keys."""
+
+import statistics
+
+from core.instrumentation.percentiles import percentile
+
+
+def latency_summary(samples: list[float]) -> dict:
+    """p50 / p95 / mean / max of durations in seconds, reported in milliseconds."""
+    return {
+        "count": len(samples),
+        "p50_ms": round(percentile(samples, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(samples, 0.95) * 1000, 3),
+        "mean_ms": round(statistics.fmean(samples) * 1000, 3),
+        "max_ms": round(max(samples) * 1000, 3),
+    }
+
+
+def tests_per_minute(tests: int, seconds: float) -> float:
+    return round(tests / seconds * 60, 2) if seconds else 0.0
@@ -0,0 +1,103 @@
+"""
+Offline benchmark suite: worker start-up (imports and collection), framework overhead against
+the fake WebDriver and, unless `--no-browser`, end-to-end logins in a headless browser against the
+local site.
+
+Writes one JSON file tagged with the git commit, so two runs can be compared; `--baseline`
+prints the change in tests/min and in p50 / p95 per action against an earlier result file.
+
+    python -m benchmarks.suite -o bench.json
+    git checkout other-branch && python -m benchmarks.suite -o new.json --baseline bench.json
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from benchmarks import e2e_login, framework_overhead, worker_startup
+from benchmarks.local_site import LocalSite
+from core.browser.browser_type import BrowserType
+from core.config.browser_config import browser_config
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _series(payload: dict) -> dict[str, dict]:
+    """Flattens a suite result into `name -> {tests_per_minute | p50_ms | p95_ms}` for comparison."""
+    series = {}
+    if payload.get("worker_startup"):
+        series["startup"] = {"import_ms": payload["worker_startup"]["imports"]["median_ms"],
+                             "collect_ms": payload["worker_startup"]["collection"]["median_ms"]}
+    for result in payload["framework_overhead"]:
+        prefix = f"overhead@{result['latency_ms']}ms"
+        series[prefix] = {"tests_per_minute": result["tests_per_minute"]}
+        for name, stats in result["actions"].items():
+            series[f"{prefix}.{name}"] = {"p50_ms": stats["p50_ms"], "p95_ms": stats["p95_ms"]}
+    if payload.get("e2e_login"):
+        series["e2e"] = {"tests_per_minute": payload["e2e_login"]["tests_per_minute"]}
+        for name, stats in payload["e2e_login"]["steps"].items():
+            series[f"e2e.{name}"] = {"p50_ms": stats["p50_ms"], "p95_ms": stats["p95_ms"]}
+    return series
+
+
+def compare(baseline: dict, current: dict) -> list[str]:
+    """One line per metric present in both results, with the relative change."""
+    lines = []
+    old, new = _series(baseline), _series(current)
+    for name in new.keys() & old.keys():
+        for metric, value in new[name].items():
+            before = old[name].get(metric)
+            if before:
+                lines.append(f"{name} {metric}: {before} -> {value} ({(value - before) / before:+.1%})")
+    return sorted(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-l", "--latency-ms", type=float, nargs="+", default=[0, 1, 5])
+    parser.add_argument("-n", "--iterations", type=int, default=100, help="Fake-driver login tests per latency.")
+    parser.add_argument("-b", "--browser", default=browser_config.browser.value, choices=[b.value for b in BrowserType])
+    parser.add_argument("-e", "--e2e-iterations", type=int, default=20, help="Headless browser logins.")
+    parser.add_argument("-s", "--startup-iterations", type=int, default=5,
+                        help="Fresh interpreters per start-up metric.")
+    parser.add_argument("--no-browser", action="store_true", help="Only run the fake-driver benchmark.")
+    parser.add_argument("--baseline", type=Path, help="Earlier result file to compare against.")
+    parser.add_argument("-o", "--output", type=Path, help="Write the JSON results to this file.")
+    args = parser.parse_args()
+
+    framework_overhead.quiet_logging()
+    result = {
+        "benchmark": "suite",
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "started": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "worker_startup": worker_startup.run(args.startup_iterations),
+        "framework_overhead": [framework_overhead.run(latency, args.iterations) for latency in args.latency_ms],
+        "e2e_login": None,
+    }
+    if not args.no_browser:
+        with LocalSite() as site:
+            result["e2e_login"] = e2e_login.run(site, BrowserType(args.browser), args.e2e_iterations)
+
+    if args.baseline:
+        for line in compare(json.loads(args.baseline.read_text(encoding="utf-8")), result):
+            print(line, file=sys.stderr)
+    payload = json.dumps(result, indent=2)
+    if args.output:
+        args.output.write_text(payload, encoding="utf-8")
+    print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Worker spin-up cost: what every pytest-xdist worker pays before its first test runs.
+
+Two measurements, each in fresh interpreters so nothing is already imported:
+
+- `python -X importtime -c "import tests.conftest"`: total import time of the conftest (and with
+  it the framework) plus the modules with the largest cumulative import time;
+- `python -m pytest --collect-only -q`: wall time of a full collection of `tests/`.
+
+`--budget-ms` makes the run fail (exit code 1) when the median collection time is over budget,
+so a heavy import slipping back in shows up in CI.
+
+    python -m benchmarks.worker_startup
+    python -m benchmarks.worker_startup -n 10 --top 20 --budget-ms 2500 -o worker_startup.json
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """`-X importtime` output as `module -> cumulative microseconds` (first import of each module)."""
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, module = line[len("import time:"):].split("|")
+        cumulative.setdefault(module.strip(), int(cumulative_us))
+    return cumulative
+
+
+def measure_imports(module: str, iterations: int, top: int) -> dict:
+    totals, modules = [], {}
+    for _ in range(iterations):
+        completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], cwd=ROOT,
+                                   capture_output=True, text=True, check=True)
+        cumulative = parse_importtime(completed.stderr)
+        totals.append(cumulative[module] / 1000)
+        for name, microseconds in cumulative.items():
+            modules.setdefault(name, []).append(microseconds / 1000)
+    heaviest = sorted(((name, statistics.median(ms)) for name, ms in modules.items() if name != module),
+                      key=lambda item: item[1], reverse=True)[:top]
+    return {
+        "module": module,
+        "iterations": iterations,
+        "median_ms": round(statistics.median(totals), 1),
+        "min_ms": round(min(totals), 1),
+        "heaviest": [{"module": name, "cumulative_ms": round(ms, 1)} for name, ms in heaviest],
+    }
+
+
+def measure_collection(path: str, iterations: int) -> dict:
+    samples, collected = [], ""
+    command = [sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider", path]
+    for _ in range(iterations):
+        started = time.perf_counter()
+        completed = subprocess.run(command, cwd=ROOT, capture_output=True, text=True)
+        samples.append((time.perf_counter() - started) * 1000)
+        if completed.returncode != 0:
+            raise RuntimeError(f"Collection failed:\n{completed.stdout}{completed.stderr}")
+        collected = completed.stdout.strip().splitlines()[-1]
+    return {
+        "path": path,
+        "iterations": iterations,
+        "collected": collected,
+        "median_ms": round(statistics.median(samples), 1),
+        "min_ms": round(min(samples), 1),
+        "max_ms": round(max(samples), 1),
+    }
+
+
+def run(iterations: int = 5, top: int = 10, module: str = "tests.conftest", path: str = "tests") -> dict:
+    return {
+        "benchmark": "worker_startup",
+        "imports": measure_imports(module, iterations, top),
+        "collection": measure_collection(path, iterations),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--iterations", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="Heaviest imports to list.")
+    parser.add_argument("-m", "--module", default="tests.conftest", help="Module whose import is timed.")
+    parser.add_argument("-p", "--path", default="tests", help="Test path to collect.")
+    parser.add_argument("--budget-ms", type=float, help="Fail when the median collection time exceeds this.")
+    parser.add_argument("-o", "--output", type=Path, help="Write the JSON results to this file.")
+    args = parser.parse_args()
+
+    result = run(args.iterations, args.top, args.module, args.path)
+    imports, collection = result["imports"], result["collection"]
+    print(f"import {imports['module']}: {imports['median_ms']}ms median; "
+          f"collection: {collection['median_ms']}ms median ({collection['collected']})", file=sys.stderr)
+    for entry in imports["heaviest"]:
+        print(f"{entry['cumulative_ms']:>9.1f}ms  {entry['module']}", file=sys.stderr)
+
+    payload = json.dumps(result, indent=2)
+    if args.output:
+        args.output.write_text(payload, encoding="utf-8")
+    print(payload)
+    if args.budget_ms is not None and collection["median_ms"] > args.budget_ms:
+        print(f"worker start-up over budget: {collection['median_ms']}ms > {args.budget_ms}ms", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,56 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from loguru import logger
 from selenium.common import ElementNotInteractableException, StaleElementReferenceException, TimeoutException, \
     NoSuchElementException, ElementNotVisibleException
-from selenium.webdriver import ActionChains
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait, Select
 
+from core.actions import scripts
+from core.actions.element_cache import ElementCache
+from core.actions.element_state import ElementState
+from core.actions.wait_engine import WaitEngine
+from core.instrumentation.step_timings import timed
 
-class Actions:
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
 
-    def __init__(self, driver: WebDriver):
-        self.driver = driver
 
-    def _wait_for_visible(self, locator: tuple[str, str], timeout: int):
-        return WebDriverWait(self.driver, timeout).until(EC.visibility_of_element_located(locator))
+class Actions:
 
-    def _wait_for_clickable(self, locator: tuple[str, str], timeout: int):
-        return WebDriverWait(self.driver, timeout).until(EC.element_to_be_clickable(locator))
+    def __init__(self, driver: WebDriver, waits: WaitEngine | None = None):
+        self.driver = driver
+        self.waits = waits or WaitEngine(driver)
+        self.element_cache = ElementCache(driver)
+
+    def _resolve(self, locator: tuple[str, str], timeout: int, clickable: bool):
+        """Returns the cached element when it is still ready, otherwise waits for (and caches) a fresh one."""
+        element = self.element_cache.get(locator)
+        if element is not None:
+            try:
+                if element.is_displayed() and (not clickable or element.is_enabled()):
+                    return element
+            except StaleElementReferenceException:
+                self.element_cache.drop(locator)
+        element = self.waits.element(locator, timeout, clickable=clickable)
+        self.element_cache.put(locator, element)
+        return element
+
+    def _on_element(self, locator: tuple[str, str], timeout: int, operation, clickable: bool = False):
+        """Runs `operation(element)`; if the element went stale, resolves the locator again and retries once."""
+        try:
+            return operation(self._resolve(locator, timeout, clickable))
+        except StaleElementReferenceException:
+            self.element_cache.drop(locator)
+            logger.debug("Element {!r} went stale; resolving it again.", locator)
+            return operation(self._resolve(locator, timeout, clickable))
 
+    @timed
     def click(self, locator: tuple[str, str], timeout: int) -> None:
         """
         Clicks on a web element after waiting for it to be clickable.
 
-        This method uses WebDriverWait to wait for the element to be in a clickable state
+        This method uses the wait engine to wait for the element to be in a clickable state
         for a specified timeout before attempting to interact with it.
 
         Args:
@@ -33,22 +61,23 @@ class Actions:
         Raises:
             NoSuchElementException: If the element is not found within the specified timeout.
             ElementNotInteractableException: If the element is visible but not interactable.
-            StaleElementReferenceException: If the element reference is no longer valid.
+            StaleElementReferenceException: If the element is still stale after one re-resolve.
             TimeoutException: If the element is not clickable within the specified timeout.
         """
         try:
-            element = self._wait_for_clickable(locator, timeout)
-            element.click()
+            self._on_element(locator, timeout, lambda element: element.click(), clickable=True)
+            self.element_cache.after_click()
             logger.info(f"Clicked on element: '{locator}'")
         except Exception as e:
             logger.error(f"Click on element '{locator}' failed:  {e}")
             raise
 
+    @timed
     def send_text(self, locator: tuple[str, str], text: str, timeout: int) -> None:
         """
         Sends a specified text to a web element after waiting for it to be visible.
 
-        This method uses WebDriverWait to wait for the element to be visible within a
+        This method uses the wait engine to wait for the element to be visible within a
         specified timeout before attempting to interact with it. It then clears the
         element (if it's an input field) and sends the provided text. Logs success
         and error messages.
@@ -66,19 +95,22 @@ class Actions:
             TimeoutException: If the element is not visible within the specified timeout.
         """
         try:
-            element = self._wait_for_visible(locator, timeout)
-            element.clear()
-            element.send_keys(text)
+            def _type(element):
+                element.clear()
+                element.send_keys(text)
+
+            self._on_element(locator, timeout, _type)
             logger.info(f"Entered '{text}' into '{locator}'")
         except Exception as e:
             logger.error(f"Error writing to '{locator}': {e}")
             raise
 
+    @timed
     def select_value_by_select(self, locator: tuple[str, str], value: str, timeout: int) -> None:
         """
         Selects a specific value from a dropdown (select) element after waiting for it to be visible.
 
-        This method uses WebDriverWait to wait for the element to be visible within a
+        This method uses the wait engine to wait for the element to be visible within a
         specified timeout before attempting to interact with it. Then, it creates a
         Select object from the element and selects the option with the provided
         "value" attribute. Logs success and error messages.
@@ -95,20 +127,21 @@ class Actions:
             ElementNotInteractableException: If the element is visible but not interactable.
             TimeoutException: If the element is not visible within the specified timeout.
         """
+        from selenium.webdriver.support.select import Select  # deferred: rarely used, costly to import
+
         try:
-            select_element = self._wait_for_visible(locator, timeout)
-            select = Select(select_element)
-            select.select_by_value(value)
+            self._on_element(locator, timeout, lambda element: Select(element).select_by_value(value))
             logger.info(f"Value '{value}' selected from '{locator}'")
         except Exception as e:
             logger.error(f"Error selecting value: {e}")
             raise
 
+    @timed
     def select_value_by_visible_text(self, locator: tuple[str, str], value: str, timeout: int) -> None:
         """
         Selects a specific value from a dropdown (select) element after waiting for it to be visible.
 
-        This method uses WebDriverWait to wait for the element to be visible within a
+        This method uses the wait engine to wait for the element to be visible within a
         specified timeout before attempting to interact with it. Then, it creates a
         Select object from the element and selects the option with the provided
         "visible_text" attribute. Logs success and error messages.
@@ -125,15 +158,16 @@ class Actions:
             ElementNotInteractableException: If the element is visible but not interactable.
             TimeoutException: If the element is not visible within the specified timeout.
         """
+        from selenium.webdriver.support.select import Select  # deferred: rarely used, costly to import
+
         try:
-            select_element = self._wait_for_visible(locator, timeout)
-            select = Select(select_element)
-            select.select_by_visible_text(value)
+            self._on_element(locator, timeout, lambda element: Select(element).select_by_visible_text(value))
             logger.info(f"Value '{value}' selected from '{locator}'")
         except Exception as e:
             logger.error(f"Error selecting value: {e}")
             raise
 
+    @timed
     def get_text(self, locator: tuple[str, str], timeout: int) -> str:
         """
         Retrieves the text content of a web element after waiting for it to be visible.
@@ -147,11 +181,10 @@ class Actions:
 
         Raises:
             TimeoutException: If the element does not become visible within the timeout.
-            Exception: Other Selenium errors (e.g. stale element), re-raised after logging.
+            Exception: Other Selenium errors (e.g. still stale after one retry), re-raised after logging.
         """
         try:
-            element = self._wait_for_visible(locator, timeout)
-            text = element.text
+            text = self._on_element(locator, timeout, lambda element: element.text)
             logger.info(f"Captured text '{text}' from element '{locator}'")
             return text
         except TimeoutException as e:
@@ -165,14 +198,15 @@ class Actions:
             logger.error(f"get_text failed for element {locator}: {e}")
             raise
 
+    @timed
     def is_visible(self, locator: tuple[str, str], timeout: int) -> bool:
         """
         Returns whether the element is visible within the given timeout.
 
-        If the wait times out, distinguishes between:
-        - No matching nodes in the DOM (locator did not match any element after the wait).
-        - At least one node exists but did not satisfy visibility within the timeout
-          (e.g. hidden, not yet rendered, or still loading).
+        If the wait times out, one `element_state` call tells whether no node matches the
+        locator or the node exists but is hidden, and why (e.g. `display: none`). To assert that
+        an element is *not* visible, use `is_visible_now`, `is_absent` or `wait_until_invisible`,
+        which return as soon as the answer is known instead of waiting out the timeout.
 
         Args:
             locator (tuple[str, str]): Locator tuple (e.g. By.ID, value).
@@ -182,33 +216,214 @@ class Actions:
             bool: True if the element is visible; False if not visible after the scenarios above.
         """
         try:
-            element = self._wait_for_visible(locator, timeout)
-            return element.is_displayed()
+            return self._on_element(locator, timeout, lambda element: element.is_displayed())
+        except TimeoutException:
+            state = self.element_state(locator)
+            logger.warning("Visibility wait timed out after {}s: {}.", timeout, state)
+            return state.visible
+        except Exception as e:
+            logger.error("Unexpected error checking visibility of {!r}: {}", locator, e)
+            raise
+
+    @timed
+    def element_state(self, locator: tuple[str, str]) -> ElementState:
+        """
+        Checks existence and display of an element in a single `execute_script` call, without waiting.
+
+        Args:
+            locator (tuple[str, str]): Locator tuple (e.g. By.ID, value).
+
+        Returns:
+            ElementState: `visible`, `hidden` or `absent`, with the reason when not visible.
+        """
+        return ElementState.from_script(locator, self.driver.execute_script(scripts.ELEMENT_STATE, *locator))
+
+    @timed
+    def is_visible_now(self, locator: tuple[str, str]) -> bool:
+        """
+        Returns whether the element is visible at this moment, without waiting.
+
+        Args:
+            locator (tuple[str, str]): Locator tuple (e.g. By.ID, value).
+
+        Returns:
+            bool: True if the element exists and is displayed.
+        """
+        return self.element_state(locator).visible
+
+    @timed
+    def is_absent(self, locator: tuple[str, str], timeout: float = 0) -> bool:
+        """
+        Returns whether no element matches the locator, polling until it is gone or the timeout expires.
+
+        With the default `timeout=0` the DOM is checked once, so asserting that an element is
+        not there costs one round-trip instead of a full visibility timeout.
+
+        Args:
+            locator (tuple[str, str]): Locator tuple (e.g. By.ID, value).
+            timeout (float): Maximum wait in seconds for the element to disappear.
+
+        Returns:
+            bool: True as soon as no node matches; False if one is still present after the timeout.
+        """
+        state = None
+
+        def _absent(_driver: WebDriver) -> bool:
+            nonlocal state
+            state = self.element_state(locator)
+            return state.absent
+
+        try:
+            return self.waits.until(_absent, timeout, label=f"absent {locator}")
         except TimeoutException:
-            elements = self.driver.find_elements(*locator)
-            if not elements:
-                logger.warning(
-                    "Element {!r} not present in the DOM after {}s (visibility wait timed out).",
-                    locator,
-                    timeout,
-                )
-                return False
-            logger.warning(
-                "Element {!r} is in the DOM but did not become visible within {}s "
-                "(hidden, zero size, or still loading).",
-                locator,
+            logger.info("Element still present after {}s: {}.", timeout, state)
+            return False
+
+    @timed
+    def wait_until_invisible(self, locator: tuple[str, str], timeout: float) -> ElementState:
+        """
+        Waits until the element is hidden or absent and returns its state as soon as it is.
+
+        Args:
+            locator (tuple[str, str]): Locator tuple (e.g. By.ID, value).
+            timeout (float): Maximum wait in seconds for the element to stop being visible.
+
+        Returns:
+            ElementState: The `hidden` or `absent` state, with the reason.
+
+        Raises:
+            TimeoutException: If the element is still visible after the timeout.
+        """
+        state = None
+
+        def _invisible(_driver: WebDriver) -> ElementState | None:
+            nonlocal state
+            state = self.element_state(locator)
+            return None if state.visible else state
+
+        try:
+            state = self.waits.until(_invisible, timeout, label=f"invisible {locator}")
+            logger.info("Element {}.", state)
+            return state
+        except TimeoutException as e:
+            msg = f"Element {locator!r} was still visible after {timeout}s."
+            logger.error(msg)
+            raise TimeoutException(msg) from e
+
+    @timed
+    def fill_form(self, fields: dict[tuple[str, str], str], timeout: int, native: bool = False) -> None:
+        """
+        Fills several input fields, by default in a single `execute_script` round-trip.
+
+        The script waits (polling through the wait engine) until every field is visible and
+        enabled, then sets all values at once and dispatches `input` / `change` events so
+        framework-bound inputs (e.g. React) pick up the new values. Use `native=True` when a
+        test needs real keyboard input; each field then goes through `send_text`.
+
+        Args:
+            fields (dict[tuple[str, str], str]): Locator tuple -> text to enter, in fill order.
+            timeout (int): Maximum wait in seconds for all fields to become visible and enabled.
+            native (bool): Type into each field with WebDriver key events instead of the script.
+
+        Raises:
+            TimeoutException: If any field is not visible and enabled within the timeout.
+        """
+        if native:
+            for locator, text in fields.items():
+                self.send_text(locator, text, timeout)
+            return
+        payload = [[by, value, text] for (by, value), text in fields.items()]
+        locators = list(fields)
+        pending: list[int] = []
+
+        def _filled(driver: WebDriver) -> bool:
+            nonlocal pending
+            pending = driver.execute_script(scripts.FILL_FORM, payload)
+            return not pending
+
+        try:
+            self.waits.until(_filled, timeout, label=f"fill_form {locators}")
+            logger.info(f"Filled form fields: {locators}")
+        except TimeoutException as e:
+            missing = [locators[i] for i in pending]
+            msg = f"fill_form failed: fields {missing} were not visible and enabled within {timeout}s."
+            logger.error(msg)
+            raise TimeoutException(msg) from e
+        except Exception as e:
+            logger.error(f"fill_form failed for fields {locators}: {e}")
+            raise
+
+    @timed
+    def get_texts(self, locators: list[tuple[str, str]], timeout: int) -> list[str]:
+        """
+        Retrieves the visible text of several elements in a single `execute_script` call.
+
+        Args:
+            locators (list[tuple[str, str]]): Locator tuples, in the order the texts are returned.
+            timeout (int): Maximum wait in seconds for all elements to become visible.
+
+        Returns:
+            list[str]: The text of each element, in the same order as `locators`.
+
+        Raises:
+            TimeoutException: If any element does not become visible within the timeout.
+        """
+        payload = [list(locator) for locator in locators]
+        try:
+            texts = self.waits.until(
+                lambda driver: driver.execute_script(scripts.GET_TEXTS, payload),
                 timeout,
+                label=f"get_texts {locators}",
             )
-            return False
+            logger.info(f"Captured texts {texts} from elements {locators}")
+            return texts
+        except TimeoutException as e:
+            msg = f"get_texts failed: elements {locators} did not all become visible within {timeout}s."
+            logger.error(msg)
+            raise TimeoutException(msg) from e
         except Exception as e:
-            logger.error("Unexpected error checking visibility of {!r}: {}", locator, e)
+            logger.error(f"get_texts failed for elements {locators}: {e}")
             raise
 
+    @timed
+    def are_visible(self, locators: list[tuple[str, str]], timeout: int) -> list[bool]:
+        """
+        Returns the visibility of several elements, evaluated together in one script per poll.
+
+        Polls until every element is visible or the timeout expires, then reports each
+        element's state at that moment instead of raising.
+
+        Args:
+            locators (list[tuple[str, str]]): Locator tuples to check.
+            timeout (int): Maximum wait in seconds for all elements to become visible.
+
+        Returns:
+            list[bool]: One flag per locator, in the same order as `locators`.
+        """
+        payload = [list(locator) for locator in locators]
+        flags: list[bool] = [False] * len(locators)
+
+        def _all_visible(driver: WebDriver) -> bool:
+            nonlocal flags
+            flags = driver.execute_script(scripts.ARE_VISIBLE, payload)
+            return all(flags)
+
+        try:
+            self.waits.until(_all_visible, timeout, label=f"are_visible {locators}")
+        except TimeoutException:
+            hidden = [locator for locator, visible in zip(locators, flags) if not visible]
+            logger.warning("Elements {!r} did not become visible within {}s.", hidden, timeout)
+        except Exception as e:
+            logger.error("Unexpected error checking visibility of {!r}: {}", locators, e)
+            raise
+        return flags
+
+    @timed
     def move_to_element(self, locator: tuple[str, str], timeout: int) -> None:
         """
         Moves the browser's focus to a web element after waiting for it to be visible.
 
-        This method uses WebDriverWait to wait for the element to be visible within a
+        This method uses the wait engine to wait for the element to be visible within a
         specified timeout. If the element is found, it creates an ActionChains object
         and uses it to move the mouse cursor to the center of the element. Logs success
         and error messages.
@@ -223,11 +438,31 @@ class Actions:
             ElementNotVisibleException: If the element is not visible within the timeout.
             TimeoutException: If the element is not visible within the specified timeout.
         """
+        from selenium.webdriver.common.action_chains import ActionChains  # deferred: rarely used, costly to import
+
         try:
-            element = self._wait_for_visible(locator, timeout)
-            actions = ActionChains(self.driver)
-            actions.move_to_element(element).perform()
+            self._on_element(
+                locator, timeout, lambda element: ActionChains(self.driver).move_to_element(element).perform()
+            )
             logger.info("Mouse hover action on element completed successfully.")
         except Exception as e:
             logger.error(f"Failed to move to element: {e}")
             raise
+
+
+_SHARED_ATTRIBUTE = "_pom_actions"
+
+
+def shared_actions(driver: WebDriver) -> Actions:
+    """The `Actions` (and element cache) used by every page object on this driver; created on first use."""
+    actions = getattr(driver, _SHARED_ATTRIBUTE, None)
+    if actions is None:
+        actions = Actions(driver)
+        setattr(driver, _SHARED_ATTRIBUTE, actions)
+    return actions
+
+
+def release_shared_actions(driver: WebDriver) -> None:
+    """Drops the driver's shared `Actions`, so the next test on it starts with an empty element cache."""
+    if hasattr(driver, _SHARED_ATTRIBUTE):
+        delattr(driver, _SHARED_ATTRIBUTE)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable
+
+from core.actions.actions import shared_actions
+from core.actions.element import BoundElement
+from core.browser.browser import BrowserSettings
+from core.browser.browser_slots import browser_capacity
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class AsyncProxy:
+    """
+        Awaitable view of a blocking object such as `Actions` or a page object.
+
+        Every method call runs on the owning `AsyncBrowsers` thread pool and has to be awaited, and
+        so do properties, which may call the driver (`await page.username.text`). Page elements
+        (`BoundElement`) come back as proxies too, so `await page.username.click()` does not block
+        the event loop; other plain attributes are returned as they are. A method that returns
+        the wrapped object itself (e.g. `BasePage.open()`) returns this proxy, so calls can still
+        be chained.
+        """
+
+    def __init__(self, target: Any, browsers: "AsyncBrowsers"):
+        self._target = target
+        self._browsers = browsers
+
+    def __getattr__(self, name: str):
+        if isinstance(getattr(type(self._target), name, None), property):
+            return self._browsers.run(getattr, self._target, name)
+        attribute = getattr(self._target, name)
+        if isinstance(attribute, BoundElement):
+            return AsyncProxy(attribute, self._browsers)
+        if not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        async def call(*args, **kwargs):
+            result = await self._browsers.run(attribute, *args, **kwargs)
+            return self if result is self._target else result
+
+        return call
+
+
+class AsyncSession:
+    """One browser owned by one asyncio task, with awaitable `actions` and page objects bound to it."""
+
+    def __init__(self, driver: WebDriver, browsers: "AsyncBrowsers"):
+        self.driver = driver
+        self.actions = AsyncProxy(shared_actions(driver), browsers)
+        self._browsers = browsers
+
+    def page(self, page_class: type, *args, **kwargs) -> AsyncProxy:
+        """Creates `page_class(driver, *args, **kwargs)` and returns its awaitable proxy."""
+        return AsyncProxy(page_class(self.driver, *args, **kwargs), self._browsers)
+
+    async def run(self, function: Callable, *args, **kwargs):
+        """Runs a blocking `function(driver, *args, **kwargs)` on the thread pool."""
+        return await self._browsers.run(function, self.driver, *args, **kwargs)
+
+
+class AsyncBrowsers:
+    """
+        Drives many browsers from one event loop.
+
+        WebDriver calls block, so they run on a bounded thread pool while the event loop only
+        schedules them. Each task opens its own session (one browser per task) and awaits every
+        call, so a session never uses more than one thread at a time. Open sessions are capped
+        at the pool size, which keeps a thread free for every session even while new ones wait
+        for a browser slot.
+
+            async with AsyncBrowsers() as browsers:
+                async def login(user):
+                    async with browsers.session() as session:
+                        page = await session.page(LoginPage).open(base_url)
+                        await page.login(user, password)
+                        return await session.page(InventoryPage).is_loaded()
+
+                results = await asyncio.gather(*(login(user) for user in users))
+
+        Args:
+            max_workers (int | None): Threads and concurrent sessions; defaults to `browser_capacity()`.
+            settings_factory: Builds the `BrowserSettings` that starts (and quits) each session's browser.
+        """
+
+    def __init__(self, max_workers: int | None = None, settings_factory: Callable[[], BrowserSettings] = BrowserSettings):
+        self.max_workers = max_workers or browser_capacity()
+        self.settings_factory = settings_factory
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="webdriver")
+        self._sessions = asyncio.Semaphore(self.max_workers)
+
+    async def run(self, function: Callable, *args, **kwargs):
+        """Runs a blocking call on the thread pool and returns its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(function, *args, **kwargs))
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """Starts a browser for the calling task and quits it when the block exits."""
+        async with self._sessions:
+            settings = self.settings_factory()
+            driver = await self.run(settings.get_driver)
+            try:
+                yield AsyncSession(driver, self)
+            finally:
+                await self.run(settings.quit_driver)
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._executor.shutdown)
+
+    async def __aenter__(self) -> "AsyncBrowsers":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
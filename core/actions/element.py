@@ -0,0 +1,96 @@
+from core.actions.element_state import ElementState
+from core.actions.selectors import compile_locator
+
+
+class Element(tuple):
+    """
+        Declares a page element once, on the page object class:
+
+            class LoginPage(BasePage):
+                username = Element(By.ID, "user-name")
+
+            page.username.fill("standard_user")
+            page.username.visible
+
+        The locator is checked when the class is defined (see `compile_locator`), so a broken
+        selector fails at import time. On the class (`LoginPage.username`) it is the plain locator
+        tuple; on a page object it is a `BoundElement` that runs its calls through the page's
+        shared `Actions` and `default_timeout`. Resolved elements are cached until the driver
+        navigates unless `cache=False` (use it for nodes the page re-creates, e.g. error banners).
+        """
+
+    def __new__(cls, by: str, value: str, cache: bool = True):
+        element = super().__new__(cls, compile_locator(by, value))
+        element.cacheable = cache
+        element.name = None
+        return element
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        # Aliases such as `READY_LOCATOR = username` keep the first name.
+        if self.name is None:
+            self.name = name
+
+    def __get__(self, page, owner: type | None = None):
+        if page is None:
+            return self
+        bound = BoundElement(self, page)
+        if self.name:
+            # Non-data descriptor: later lookups on this page object hit the instance dict directly.
+            page.__dict__[self.name] = bound
+        return bound
+
+
+class BoundElement(tuple):
+    """
+        An `Element` on one page object. Still the locator tuple, so it can be passed to `Actions`
+        or `find_elements(*element)`; no driver call is made until one of its methods is used.
+        """
+
+    def __new__(cls, element: Element, page):
+        bound = super().__new__(cls, element)
+        bound.element = element
+        bound.cacheable = element.cacheable
+        bound.page = page
+        return bound
+
+    @property
+    def actions(self):
+        return self.page.actions
+
+    def _timeout(self, timeout: float | None) -> float:
+        return self.page.default_timeout if timeout is None else timeout
+
+    def fill(self, text: str) -> None:
+        """Sets the value in one script call (see `Actions.fill_form`); use `type` for real key events."""
+        self.actions.fill_form({self: text}, self.page.default_timeout)
+
+    def type(self, text: str) -> None:
+        self.actions.send_text(self, text, self.page.default_timeout)
+
+    def click(self) -> None:
+        self.actions.click(self, self.page.default_timeout)
+
+    @property
+    def text(self) -> str:
+        return self.actions.get_text(self, self.page.default_timeout)
+
+    @property
+    def visible(self) -> bool:
+        """Visible right now; does not wait (see `wait_visible`)."""
+        return self.actions.is_visible_now(self)
+
+    @property
+    def absent(self) -> bool:
+        """No matching node right now; does not wait."""
+        return self.actions.is_absent(self)
+
+    @property
+    def state(self) -> ElementState:
+        return self.actions.element_state(self)
+
+    def wait_visible(self, timeout: float | None = None) -> bool:
+        """Waits up to `timeout` (default: the page's) for the element to become visible."""
+        return self.actions.is_visible(self, self._timeout(timeout))
+
+    def wait_until_invisible(self, timeout: float | None = None) -> ElementState:
+        return self.actions.wait_until_invisible(self, self._timeout(timeout))
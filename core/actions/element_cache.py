@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+from selenium.webdriver.remote.webelement import WebElement
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+_EPOCH_ATTRIBUTE = "_pom_navigation_epoch"
+_NAVIGATION_COMMANDS = ("get", "back", "forward", "refresh")
+
+
+def track_navigations(driver: WebDriver) -> None:
+    """Counts `get` / `back` / `forward` / `refresh` on this driver so element caches can expire."""
+    setattr(driver, _EPOCH_ATTRIBUTE, 0)
+    for name in _NAVIGATION_COMMANDS:
+        command = getattr(driver, name)
+
+        @functools.wraps(command)
+        def counted_command(*args, _command=command, **kwargs):
+            setattr(driver, _EPOCH_ATTRIBUTE, getattr(driver, _EPOCH_ATTRIBUTE) + 1)
+            return _command(*args, **kwargs)
+
+        setattr(driver, name, counted_command)
+
+
+class ElementCache:
+    """
+        Resolved elements of cacheable `Element`s (the only opt-in) for one `Actions`, keyed by
+        locator tuple.
+
+        Entries expire when the driver navigates (see `track_navigations`) or its URL changes.
+        The URL is not read on every hit: after a click (`after_click`), which may load another
+        page without the driver seeing it, the next hit compares `current_url` with the URL the
+        entries were cached on, once. A click whose navigation has not committed by then, or a
+        page that replaces its DOM without changing the URL, leaves the cached element detached;
+        `Actions` then gets a StaleElementReferenceException, drops the entry and resolves the
+        locator again.
+        """
+
+    def __init__(self, driver: WebDriver):
+        self.driver = driver
+        self._elements: dict[tuple[str, str], WebElement] = {}
+        self._epoch = getattr(driver, _EPOCH_ATTRIBUTE, 0)
+        self._url: str | None = None
+        self._check_url = False
+
+    def get(self, locator: tuple[str, str]) -> WebElement | None:
+        epoch = getattr(self.driver, _EPOCH_ATTRIBUTE, 0)
+        if epoch != self._epoch:
+            self._elements.clear()
+            self._epoch = epoch
+        if self._check_url and self._elements:
+            self._check_url = False
+            if self.driver.current_url != self._url:
+                self._elements.clear()
+        return self._elements.get(locator)
+
+    def put(self, locator: tuple[str, str], element: WebElement) -> None:
+        if getattr(locator, "cacheable", False):
+            if not self._elements:
+                self._url = self.driver.current_url
+                self._check_url = False
+            self._elements[tuple(locator)] = element
+
+    def after_click(self) -> None:
+        """Makes the next hit confirm that the URL has not changed (one `current_url` read)."""
+        self._check_url = True
+
+    def drop(self, locator: tuple[str, str]) -> None:
+        self._elements.pop(locator, None)
+
+    def clear(self) -> None:
+        self._elements.clear()
@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+
+VISIBLE = "visible"
+HIDDEN = "hidden"
+ABSENT = "absent"
+
+
+@dataclass(frozen=True)
+class ElementState:
+    """
+        What one locator matches right now: `visible`, `hidden` (in the DOM but not displayed) or
+        `absent` (no matching node), with the reason it is not visible, e.g. `display: none`.
+        """
+
+    locator: tuple[str, str]
+    state: str
+    reason: str | None = None
+
+    @classmethod
+    def from_script(cls, locator: tuple[str, str], result: dict | None) -> "ElementState":
+        """Builds the state from the `{state, reason}` object returned by `scripts.ELEMENT_STATE`."""
+        result = result or {}
+        return cls(tuple(locator), result.get("state", ABSENT), result.get("reason"))
+
+    @property
+    def visible(self) -> bool:
+        return self.state == VISIBLE
+
+    @property
+    def hidden(self) -> bool:
+        return self.state == HIDDEN
+
+    @property
+    def absent(self) -> bool:
+        return self.state == ABSENT
+
+    def __str__(self) -> str:
+        return f"{self.locator!r} is {self.state}" + (f" ({self.reason})" if self.reason else "")
@@ -0,0 +1,113 @@
+"""
+JavaScript snippets run through `execute_script` by `Actions` batch operations.
+
+Locators are passed as `[by, value]` pairs using Selenium's `By` strings, so page objects can
+hand their existing locator tuples straight to the batch APIs.
+"""
+
+_HELPERS = """
+function resolve(by, value) {
+    switch (by) {
+        case 'id': return document.getElementById(value);
+        case 'css selector': return document.querySelector(value);
+        case 'name': return document.querySelector('[name="' + CSS.escape(value) + '"]');
+        case 'class name': return document.querySelector('.' + CSS.escape(value));
+        case 'tag name': return document.querySelector(value);
+        case 'xpath':
+            return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null)
+                .singleNodeValue;
+        case 'link text':
+        case 'partial link text':
+            for (const link of document.querySelectorAll('a')) {
+                const text = link.innerText.trim();
+                if (by === 'link text' ? text === value : text.includes(value)) return link;
+            }
+            return null;
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+function hiddenReason(el) {
+    const style = window.getComputedStyle(el);
+    if (style.display === 'none') return 'display: none';
+    if (style.visibility === 'hidden') return 'visibility: hidden';
+    if (style.opacity === '0') return 'opacity: 0';
+    if (!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) {
+        return 'not rendered (zero size or hidden ancestor)';
+    }
+    return null;
+}
+function isVisible(el) {
+    return !!el && el.isConnected && hiddenReason(el) === null;
+}
+function setValue(el, text) {
+    // Use the prototype setter so frameworks that track the value property (e.g. React) see the change.
+    let proto = Object.getPrototypeOf(el);
+    let descriptor = null;
+    while (proto && !(descriptor = Object.getOwnPropertyDescriptor(proto, 'value'))) {
+        proto = Object.getPrototypeOf(proto);
+    }
+    el.focus();
+    descriptor ? descriptor.set.call(el, text) : (el.value = text);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+}
+"""
+
+# arguments[0]: [[by, value, text], ...]. Returns the indexes of fields not yet visible and
+# enabled (nothing is written then), or [] once every field has been filled.
+FILL_FORM = _HELPERS + """
+const fields = arguments[0];
+const elements = fields.map(([by, value]) => resolve(by, value));
+const pending = [];
+elements.forEach((el, i) => {
+    if (!isVisible(el) || el.disabled || el.readOnly) pending.push(i);
+});
+if (pending.length) return pending;
+elements.forEach((el, i) => setValue(el, fields[i][2]));
+return [];
+"""
+
+# arguments[0]: [[by, value], ...]. Returns the innerText of every element, or null while any
+# of them is missing or hidden.
+GET_TEXTS = _HELPERS + """
+const elements = arguments[0].map(([by, value]) => resolve(by, value));
+if (!elements.every(isVisible)) return null;
+return elements.map(el => el.innerText.trim());
+"""
+
+# arguments[0]: [[by, value], ...]. Returns one visibility flag per locator.
+ARE_VISIBLE = _HELPERS + """
+return arguments[0].map(([by, value]) => isVisible(resolve(by, value)));
+"""
+
+# arguments: by, value. Existence and display checked in one evaluation; returns
+# {state: 'visible' | 'hidden' | 'absent', reason: string | null}.
+ELEMENT_STATE = _HELPERS + """
+const el = resolve(arguments[0], arguments[1]);
+if (!el) return {state: 'absent', reason: 'no element matches the locator'};
+const reason = hiddenReason(el);
+return {state: reason ? 'hidden' : 'visible', reason: reason};
+"""
+
+# execute_async_script. arguments: by, value, require_enabled, timeout_ms, callback.
+# Resolves with the element as soon as it is visible (and enabled when required), using a
+# MutationObserver instead of fixed-rate polling; resolves with null when the timeout expires first.
+WAIT_FOR_ELEMENT = _HELPERS + """
+const [by, value, requireEnabled, timeoutMs, done] = arguments;
+const ready = () => {
+    const el = resolve(by, value);
+    return isVisible(el) && !(requireEnabled && el.disabled) ? el : null;
+};
+const found = ready();
+if (found) return done(found);
+let observer = null, ticker = null, timer = null;
+const finish = (el) => {
+    observer.disconnect(); clearInterval(ticker); clearTimeout(timer); done(el);
+};
+const check = () => { const el = ready(); if (el) finish(el); };
+observer = new MutationObserver(check);
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true});
+// Safety net for changes that mutate no DOM node (e.g. a stylesheet or image finishing loading).
+ticker = setInterval(check, 250);
+timer = setTimeout(() => finish(null), timeoutMs);
+"""
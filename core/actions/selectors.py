@@ -0,0 +1,100 @@
+from selenium.common import InvalidSelectorException
+from selenium.webdriver.common.by import By
+
+STRATEGIES = frozenset(value for name, value in vars(By).items() if name.isupper() and isinstance(value, str))
+
+_CLOSING = {"[": "]", "(": ")"}
+_CSS_COMBINATORS = frozenset(">+~")
+
+
+def _scan(value: str, backslash_escapes: bool):
+    """
+        Yields `(depth, char)` for every character outside string literals.
+
+        Raises:
+            InvalidSelectorException: On an unterminated string or unbalanced brackets / parentheses.
+        """
+    stack: list[str] = []
+    quote = None
+    escaped = False
+    for char in value:
+        if quote:
+            if escaped:
+                escaped = False
+            elif backslash_escapes and char == "\\":
+                escaped = True
+            elif char == quote:
+                quote = None
+            continue
+        if char in "'\"":
+            quote = char
+        elif char in _CLOSING:
+            stack.append(_CLOSING[char])
+        elif char in "])":
+            if not stack or stack.pop() != char:
+                raise InvalidSelectorException(f"Unbalanced {char!r} in {value!r}")
+        yield len(stack), char
+    if quote:
+        raise InvalidSelectorException(f"Unterminated string in {value!r}")
+    if stack:
+        raise InvalidSelectorException(f"Missing {stack[-1]!r} in {value!r}")
+
+
+def _check_css(value: str) -> None:
+    groups, current = [], []
+    for depth, char in _scan(value, backslash_escapes=True):
+        if depth == 0 and char == ",":
+            groups.append("".join(current))
+            current = []
+        else:
+            # Bracket / parenthesis contents may hold '+', '>' or '~' (2n+1, ~=): mask them.
+            current.append(char if depth == 0 else "_")
+    groups.append("".join(current))
+    for group in groups:
+        tokens = group.replace(">", " > ").replace("+", " + ").replace("~", " ~ ").split()
+        if not tokens:
+            raise InvalidSelectorException(f"Empty selector in {value!r}")
+        if tokens[0] in _CSS_COMBINATORS or tokens[-1] in _CSS_COMBINATORS:
+            raise InvalidSelectorException(f"Dangling combinator in {value!r}")
+        if any(a in _CSS_COMBINATORS and b in _CSS_COMBINATORS for a, b in zip(tokens, tokens[1:])):
+            raise InvalidSelectorException(f"Consecutive combinators in {value!r}")
+
+
+def _check_xpath(value: str) -> None:
+    previous = ""
+    for _, char in _scan(value, backslash_escapes=False):
+        if previous == "[" and char == "]":
+            raise InvalidSelectorException(f"Empty predicate in {value!r}")
+        previous = char if not char.isspace() else previous
+    stripped = value.strip()
+    if stripped != "/" and stripped.endswith(("/", "|")):
+        raise InvalidSelectorException(f"Incomplete expression in {value!r}")
+
+
+def compile_locator(by: str, value: str) -> tuple[str, str]:
+    """
+        Checks a locator once, when the page object is defined, instead of on its first use in a test.
+
+        Catches unknown strategies, empty values and syntax errors a browser would reject
+        (unbalanced brackets or quotes, dangling CSS combinators, empty XPath predicates); it
+        does not check that anything on the page matches.
+
+        Args:
+            by (str): Locator strategy, one of Selenium's `By` values.
+            value (str): Selector, id, name, ... for that strategy.
+
+        Returns:
+            tuple[str, str]: The locator tuple.
+
+        Raises:
+            InvalidSelectorException: If the locator can never be valid.
+        """
+    if by not in STRATEGIES:
+        raise InvalidSelectorException(f"Unknown locator strategy {by!r} (use selenium's By constants)")
+    if not isinstance(value, str) or not value.strip():
+        raise InvalidSelectorException(f"Empty {by} locator")
+    if by == By.CSS_SELECTOR:
+        _check_css(value)
+    elif by == By.XPATH:
+        _check_xpath(value)
+    return by, value
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable
+
+from loguru import logger
+from selenium.common import NoSuchElementException, StaleElementReferenceException, TimeoutException, \
+    WebDriverException
+from selenium.webdriver.remote.webelement import WebElement
+
+from core.actions import scripts
+from core.actions.wait_strategy import WaitStrategy
+from core.config.browser_config import browser_config
+from core.instrumentation.step_timings import step_timings
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+_IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+# Most recent waits kept per engine; step_timings holds the per-test totals.
+_MAX_RECORDS = 1000
+
+
+@dataclass(frozen=True)
+class BackoffSchedule:
+    """Poll intervals: `first` seconds, multiplied by `factor` after every poll, never above `cap`."""
+
+    first: float
+    factor: float
+    cap: float
+
+    def intervals(self):
+        interval = self.first
+        while True:
+            yield min(interval, self.cap)
+            interval *= self.factor
+
+
+@dataclass(frozen=True)
+class WaitRecord:
+    """How long one wait took and how many driver polls it needed; kept for tuning schedules."""
+
+    label: str
+    strategy: str
+    elapsed: float
+    polls: int
+    succeeded: bool
+
+
+class WaitEngine:
+    """
+        Waits for conditions on a WebDriver with a configurable strategy.
+
+        `BACKOFF` polls with a short first interval that grows exponentially up to a cap, so fast
+        elements are picked up almost immediately while slow ones are not hammered. `OBSERVER`
+        waits for elements inside the page with a MutationObserver (`execute_async_script`) and
+        returns the moment the element is ready; it falls back to backoff polling for generic
+        conditions or when the script cannot run. Every wait is added to `step_timings` and to this
+        engine's `records` (the latest waits on its driver only).
+        """
+
+    def __init__(self, driver: WebDriver, strategy: WaitStrategy | None = None,
+                 schedule: BackoffSchedule | None = None):
+        self.driver = driver
+        self.records: deque[WaitRecord] = deque(maxlen=_MAX_RECORDS)
+        self.strategy = strategy or browser_config.wait_strategy
+        self.schedule = schedule or BackoffSchedule(
+            first=browser_config.wait_first_poll,
+            factor=browser_config.wait_backoff_factor,
+            cap=browser_config.wait_max_poll,
+        )
+
+    def until(self, condition: Callable[[WebDriver], Any], timeout: float, label: str = "condition") -> Any:
+        """
+                Polls `condition(driver)` on the backoff schedule until it returns a truthy value.
+
+                Args:
+                    condition (Callable[[WebDriver], Any]): Called with the driver; NoSuchElement and
+                        StaleElementReference errors count as "not yet".
+                    timeout (float): Maximum wait in seconds.
+                    label (str): Name used in records and the timeout message.
+
+                Returns:
+                    Any: The first truthy value returned by `condition`.
+
+                Raises:
+                    TimeoutException: If the condition is still falsy after `timeout` seconds.
+                """
+        started = time.monotonic()
+        deadline = started + timeout
+        polls = 0
+        for interval in self.schedule.intervals():
+            polls += 1
+            try:
+                value = condition(self.driver)
+                if value:
+                    self._record(label, WaitStrategy.BACKOFF, started, polls, True)
+                    return value
+            except _IGNORED_EXCEPTIONS:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
+        self._record(label, WaitStrategy.BACKOFF, started, polls, False)
+        raise TimeoutException(f"Timed out after {timeout}s waiting for {label}")
+
+    def element(self, locator: tuple[str, str], timeout: float, clickable: bool = False) -> WebElement:
+        """
+                Waits until the element is visible (and enabled when `clickable`) and returns it.
+
+                Args:
+                    locator (tuple[str, str]): Locator tuple (e.g. By.ID, value).
+                    timeout (float): Maximum wait in seconds.
+                    clickable (bool): Also require the element to be enabled.
+
+                Raises:
+                    TimeoutException: If the element is not ready within the timeout.
+                """
+        label = f"{'clickable' if clickable else 'visible'} {locator}"
+        if self.strategy is WaitStrategy.OBSERVER:
+            started = time.monotonic()
+            try:
+                element = self.driver.execute_async_script(
+                    scripts.WAIT_FOR_ELEMENT, locator[0], locator[1], clickable, int(timeout * 1000)
+                )
+            except WebDriverException as e:
+                # Navigation mid-wait, script timeout or CSP: keep waiting by polling instead.
+                logger.debug("Observer wait for {} fell back to polling: {}", label, e.msg)
+                remaining = max(0.0, timeout - (time.monotonic() - started))
+                return self.until(self._condition(locator, clickable), remaining, label)
+            self._record(label, WaitStrategy.OBSERVER, started, 1, element is not None)
+            if element is None:
+                raise TimeoutException(f"Timed out after {timeout}s waiting for {label}")
+            return element
+        return self.until(self._condition(locator, clickable), timeout, label)
+
+    @staticmethod
+    def _condition(locator: tuple[str, str], clickable: bool):
+        # Deferred: expected_conditions imports the whole remote WebDriver (and BiDi) stack.
+        from selenium.webdriver.support import expected_conditions as EC
+
+        return EC.element_to_be_clickable(locator) if clickable else EC.visibility_of_element_located(locator)
+
+    def _record(self, label: str, strategy: WaitStrategy, started: float, polls: int, succeeded: bool) -> None:
+        elapsed = time.monotonic() - started
+        self.records.append(WaitRecord(label, strategy.value, elapsed, polls, succeeded))
+        step_timings.add_wait(elapsed)
+        logger.debug("Wait for {} ({}): {:.3f}s over {} poll(s), succeeded={}",
+                     label, strategy.value, elapsed, polls, succeeded)
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class WaitStrategy(Enum):
+    BACKOFF = "backoff"
+    OBSERVER = "observer"
@@ -1,71 +1,221 @@
+import contextlib
+import os
+import shutil
+
 from loguru import logger
 from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.edge.options import Options as EdgeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
 
+from core.actions.element_cache import track_navigations
+from core.browser.browser_slots import BrowserSlot
 from core.browser.browser_type import BrowserType
+from core.browser.render_profile import apply_render_profile, configure_render_options
+from core.browser.render_profile_type import RenderProfile
+from core.browser.resource_policy import ResourcePolicy
+from core.browser.startup_profile import FAST_CHROMIUM_ARGUMENTS, FAST_FIREFOX_PREFERENCES, copy_profile_template, \
+    resolve_binary_paths
+from core.browser.startup_profile_type import StartupProfile
 from core.config.browser_config import browser_config
+from core.instrumentation.step_timings import step_timings
 
 
 class BrowserSettings:
     """
         This class manages browser settings and provides a WebDriver instance.
 
-        It reads browser type and headless configuration from settings and provides methods
-        to get a WebDriver instance for the specified browser and quit the driver properly.
+        It reads browser type, headless and startup profile configuration from settings and provides
+        methods to get a WebDriver instance for the specified browser and quit the driver properly.
+        Browser type, startup and render profile, resource policy and Grid hub URL can be overridden
+        per instance (e.g. by benchmarks).
         """
 
-    def __init__(self):
-        self.browser_type = browser_config.browser
+    def __init__(self, browser_type: BrowserType | None = None, startup_profile: StartupProfile | None = None,
+                 resource_policy: ResourcePolicy | None = None, remote_url: str | None = None,
+                 render_profile: RenderProfile | None = None):
+        self.browser_type = browser_type or browser_config.browser
         self.headless = browser_config.headless
+        self.startup_profile = startup_profile or browser_config.startup_profile
+        self.render_profile = render_profile or browser_config.render_profile
+        self.remote_url = remote_url if remote_url is not None else browser_config.remote_url
         self.driver = None
+        if self.remote_url:
+            from core.browser.remote import remote_session_slot  # Grid client: imported only when used
+
+            self.slot = remote_session_slot()
+        else:
+            self.slot = BrowserSlot()
+        self.profile_dir = None
+        self.resource_policy = resource_policy or ResourcePolicy()
+
+    @property
+    def fast(self) -> bool:
+        # Driver paths, launch flags and profile templates only exist on the local host.
+        return self.startup_profile is StartupProfile.FAST and not self.remote_url
 
     def get_driver(self):
         """
                 Initializes and configures a WebDriver instance based on the browser type.
 
                 Selects the appropriate browser driver (Chrome, Firefox, or Edge) and configures
-                headless mode when enabled (Chrome/Edge: --headless=new; Firefox: -headless).
-                Maximizes the browser window and returns the driver.
-                Driver binaries are resolved via Selenium Manager (built into Selenium 4.6+); no Service/executable_path.
+                headless mode when enabled (Chrome/Edge: --headless=new; Firefox: -headless) and the
+                configured page load strategy (`eager` by default). Waits for a free host browser slot first, so parallel workers never start more
+                browsers than the machine can hold. Maximizes the browser window when running
+                serially with the default profiles; under pytest-xdist, on a Grid or with a fast
+                startup / render profile it sets the configured fixed size instead. The fast render
+                profile also fixes the viewport and device scale factor and turns off animations.
+                With `remote_url` set, a `webdriver.Remote` session is created on the Grid instead of
+                a local browser (see `core.browser.remote`); the slot then caps concurrent Grid
+                sessions at `remote_max_sessions`.
+                Driver binaries are resolved via Selenium Manager (built into Selenium 4.6+). The fast
+                profile caches the resolved paths on disk, passes tuned startup flags and can start
+                from a copy of a pre-warmed profile template. The configured resource policy (blocked
+                resource types / URL patterns) is installed before the driver is returned. If any of
+                that set-up fails, the browser is quit and its slot freed before the error propagates.
 
                 Raises:
                     ValueError: If the provided browser type is not supported.
+                    TimeoutError: If no browser slot frees up within `browser_slot_timeout`.
+                    SessionNotCreatedException: If the Grid stays saturated through every retry.
                 """
-        logger.info(f"Selecting and configuring browser: {self.browser_type.value}")
+        logger.info(f"Selecting and configuring browser: {self.browser_type.value} ({self.startup_profile.value})")
+        with step_timings.step("BrowserSettings.get_driver", self.browser_type.value, category="startup"):
+            self.slot.acquire()
+            try:
+                self.driver = self._start_driver()
+            except Exception:
+                self.slot.release()
+                self._remove_profile_copy()
+                raise
+        try:
+            self._set_up(self.driver)
+        except Exception:
+            # E.g. a CDP / BiDi command the browser or Grid node does not support.
+            with contextlib.suppress(Exception):
+                self.driver.quit()
+            self.driver = None
+            self.slot.release()
+            self._remove_profile_copy()
+            raise
+        return self.driver
+
+    def _set_up(self, driver) -> None:
+        self.resource_policy.apply(driver, self.browser_type)
+        if self.render_profile is RenderProfile.FAST:
+            apply_render_profile(driver)
+        track_navigations(driver)
+        step_timings.instrument_navigation(driver)
+
+        # The fast profile passes the window size as a launch argument instead.
+        if self.fast:
+            return
+        if os.getenv("PYTEST_XDIST_WORKER") or self.remote_url or self.render_profile is RenderProfile.FAST:
+            driver.set_window_size(browser_config.window_width, browser_config.window_height)
+        else:
+            driver.maximize_window()
+
+    def _start_driver(self):
+        options = self._options()
+        if self.remote_url:
+            from core.browser.remote import start_remote_driver
+
+            return start_remote_driver(options, self.remote_url)
+        # Vendor modules are imported per branch: a run only pays for the browser it starts.
         match self.browser_type:
             case BrowserType.CHROME:
+                from selenium.webdriver.chrome.service import Service as ChromeService
+
+                return webdriver.Chrome(options=options, service=self._chromium_setup(options, ChromeService()))
+            case BrowserType.FIREFOX:
+                from selenium.webdriver.firefox.service import Service as FirefoxService
+
+                return webdriver.Firefox(options=options, service=self._firefox_setup(options, FirefoxService()))
+            case BrowserType.EDGE:
+                from selenium.webdriver.edge.service import Service as EdgeService
+
+                return webdriver.Edge(options=options, service=self._chromium_setup(options, EdgeService()))
+
+    def _options(self):
+        match self.browser_type:
+            case BrowserType.CHROME:
+                from selenium.webdriver.chrome.options import Options as ChromeOptions
+
                 options = ChromeOptions()
                 if self.headless:
                     options.add_argument("--headless=new")
-                self.driver = webdriver.Chrome(options=options)
             case BrowserType.FIREFOX:
+                from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
                 options = FirefoxOptions()
                 options.set_preference("app.update.auto", False)
                 options.set_preference("app.update.enabled", False)
                 if self.headless:
                     # Gecko: documented flag is -headless (not Chrome-style --headless).
                     options.add_argument("-headless")
-                self.driver = webdriver.Firefox(options=options)
             case BrowserType.EDGE:
+                from selenium.webdriver.edge.options import Options as EdgeOptions
+
                 options = EdgeOptions()
                 if self.headless:
                     options.add_argument("--headless=new")
-                self.driver = webdriver.Edge(options=options)
             case _:
                 raise ValueError(f"Browser not supported: {self.browser_type}")
+        options.page_load_strategy = browser_config.page_load_strategy
+        if "console" in browser_config.failure_artifacts and self.browser_type is not BrowserType.FIREFOX:
+            # Chromium only keeps console warnings and errors unless every level is requested.
+            vendor = options.KEY.split(":")[0]
+            options.set_capability(f"{vendor}:loggingPrefs", {"browser": "ALL"})
+        self.resource_policy.configure_options(self.browser_type, options, remote=bool(self.remote_url))
+        if self.render_profile is RenderProfile.FAST:
+            configure_render_options(self.browser_type, options, remote=bool(self.remote_url))
+        return options
 
-        self.driver.maximize_window()
-        return self.driver
+    def _chromium_setup(self, options, service):
+        if not self.fast:
+            return service
+        for argument in FAST_CHROMIUM_ARGUMENTS:
+            options.add_argument(argument)
+        options.add_argument(f"--window-size={browser_config.window_width},{browser_config.window_height}")
+        self.profile_dir = copy_profile_template()
+        if self.profile_dir:
+            options.add_argument(f"--user-data-dir={self.profile_dir}")
+        return self._cached_service(options, service)
+
+    def _firefox_setup(self, options, service):
+        if not self.fast:
+            return service
+        for name, value in FAST_FIREFOX_PREFERENCES.items():
+            options.set_preference(name, value)
+        options.add_argument(f"-width={browser_config.window_width}")
+        options.add_argument(f"-height={browser_config.window_height}")
+        self.profile_dir = copy_profile_template()
+        if self.profile_dir:
+            options.add_argument("-profile")
+            options.add_argument(str(self.profile_dir))
+        return self._cached_service(options, service)
+
+    @staticmethod
+    def _cached_service(options, service):
+        paths = resolve_binary_paths(service, options)
+        if paths["browser_path"]:
+            options.binary_location = paths["browser_path"]
+        return type(service)(executable_path=paths["driver_path"])
+
+    def _remove_profile_copy(self):
+        if self.profile_dir:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+            self.profile_dir = None
 
     def quit_driver(self):
         """
                 Quits the currently running WebDriver instance and logs a message.
 
-                This method closes the browser window associated with the WebDriver instance if it exists.
-                It then logs a message indicating that the browser has been closed.
+                This method closes the browser window associated with the WebDriver instance if it exists,
+                frees its host browser slot, removes its profile copy (fast profile with a template),
+                and logs a message indicating that the browser has been closed.
                 """
         if self.driver:
-            self.driver.quit()
+            try:
+                self.driver.quit()
+            finally:
+                self.slot.release()
+                self._remove_profile_copy()
             logger.info(f"Browser {self.browser_type.value} closed.")
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from loguru import logger
+from selenium.common import WebDriverException
+
+from core.actions.actions import release_shared_actions
+from core.browser.browser import BrowserSettings
+from core.config.browser_config import browser_config
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+_CLEAR_WEB_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+@dataclass
+class _PooledDriver:
+    settings: BrowserSettings
+    driver: WebDriver
+    uses: int = field(default=0)
+
+
+class BrowserPool:
+    """
+        Reuses WebDriver sessions across tests, leasing them to tests one at a time.
+
+        Nothing is pre-started: a lease with no idle driver starts a new one, and `size` only caps
+        how many released drivers are kept. A released driver is reset (cookies, web storage,
+        extra windows, about:blank) and kept for the next lease instead of being quit. Drivers
+        that fail the health check, or that reached `max_uses` leases, are quit and replaced by a
+        fresh one on demand.
+        The reset is complete for the current page only: web storage is cleared for the current
+        origin, and outside Chromium (no CDP) so are cookies, since WebDriver's
+        `delete_all_cookies` only covers the current domain. Cookies or storage a test left on
+        other origins survive into the next lease; use `fresh_browser` when that matters.
+        The pool lives in a single process; under pytest-xdist every worker owns its own pool.
+        """
+
+    def __init__(self, size: int | None = None, max_uses: int | None = None, settings_factory=BrowserSettings):
+        self.size = size if size is not None else browser_config.pool_size
+        self.max_uses = max_uses if max_uses is not None else browser_config.pool_max_uses
+        self._settings_factory = settings_factory
+        self._idle: list[_PooledDriver] = []
+        self._leased: dict[int, _PooledDriver] = {}
+
+    def acquire(self) -> WebDriver:
+        """
+                Leases a healthy driver, reusing an idle one when possible.
+
+                Returns:
+                    WebDriver: A driver sitting on about:blank with no cookies or storage.
+                """
+        while self._idle:
+            pooled = self._idle.pop()
+            if self._is_healthy(pooled):
+                return self._lease(pooled)
+            self._discard(pooled, "failed health check")
+        settings = self._settings_factory()
+        return self._lease(_PooledDriver(settings=settings, driver=settings.get_driver()))
+
+    def release(self, driver: WebDriver, discard: bool = False) -> None:
+        """
+                Returns a leased driver to the pool.
+
+                Args:
+                    driver (WebDriver): The driver previously returned by `acquire`.
+                    discard (bool): Quit the driver instead of keeping it for reuse.
+                """
+        pooled = self._leased.pop(id(driver), None)
+        if pooled is None:
+            logger.warning("Driver {!r} was not leased from this pool; quitting it.", driver)
+            driver.quit()
+            return
+        if discard:
+            self._discard(pooled, "discarded by caller")
+        elif pooled.uses >= self.max_uses:
+            self._discard(pooled, f"reached max uses ({self.max_uses})")
+        elif len(self._idle) >= self.size:
+            self._discard(pooled, f"pool already holds {self.size} idle driver(s)")
+        else:
+            try:
+                self._reset(pooled.driver)
+                self._idle.append(pooled)
+            except WebDriverException as e:
+                self._discard(pooled, f"reset failed: {e}")
+
+    def displace(self) -> None:
+        """
+                Quits the idle drivers, freeing their host browser slots.
+
+                Idle drivers keep their slot, so a worker that needs a dedicated browser next to
+                its pool (a `fresh_browser` test) displaces them first instead of waiting for a
+                second slot that a full host may never free. The next `acquire` starts a new one.
+                """
+        for pooled in self._idle:
+            self._discard(pooled, "displaced by a dedicated browser")
+        self._idle.clear()
+
+    def close(self) -> None:
+        """Quits every idle and leased driver owned by the pool."""
+        for pooled in [*self._idle, *self._leased.values()]:
+            self._discard(pooled, "pool closed")
+        self._idle.clear()
+        self._leased.clear()
+
+    def _lease(self, pooled: _PooledDriver) -> WebDriver:
+        pooled.uses += 1
+        self._leased[id(pooled.driver)] = pooled
+        logger.debug("Leased browser (use {}/{}).", pooled.uses, self.max_uses)
+        return pooled.driver
+
+    @staticmethod
+    def _is_healthy(pooled: _PooledDriver) -> bool:
+        try:
+            return bool(pooled.driver.window_handles) and pooled.driver.execute_script("return 1;") == 1
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _reset(driver: WebDriver) -> None:
+        """Clears per-test state (see the class docstring for what survives) and goes to about:blank."""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        # Web storage is per origin, so it must be cleared before leaving the current page.
+        driver.execute_script(_CLEAR_WEB_STORAGE_SCRIPT)
+        if hasattr(driver, "execute_cdp_cmd"):
+            # Chromium: WebDriver's delete_all_cookies only covers the current domain.
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        else:
+            # Other origins' cookies survive (see the class docstring).
+            driver.delete_all_cookies()
+        driver.get("about:blank")
+        release_shared_actions(driver)
+
+    @staticmethod
+    def _discard(pooled: _PooledDriver, reason: str) -> None:
+        logger.info("Discarding pooled browser: {}", reason)
+        try:
+            pooled.settings.quit_driver()
+        except WebDriverException as e:
+            logger.warning("Error quitting pooled browser: {}", e)
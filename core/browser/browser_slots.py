@@ -0,0 +1,133 @@
+import functools
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from loguru import logger
+
+from core.config.browser_config import browser_config
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+_LOCK_DIR = Path(tempfile.gettempdir()) / "selenium_pom_browser_slots"
+# Host capacity of the current run, exported by the first process that computes it (the pytest
+# controller) and inherited by the xdist workers it spawns.
+CAPACITY_ENV = "SELENIUM_POM_BROWSER_CAPACITY"
+_POLL_INTERVAL = 0.2
+
+
+def _available_memory_mb() -> int | None:
+    """Best-effort available RAM in MB (Linux /proc/meminfo, then sysconf); None when unknown."""
+    try:
+        with open("/proc/meminfo", encoding="utf-8") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+@functools.cache
+def host_browser_capacity() -> int:
+    """
+        Returns how many browsers this host can run at once.
+
+        Uses `max_browsers` from the configuration when set; otherwise the smaller of the CPU
+        count and available memory divided by `browser_memory_mb` (never less than 1).
+        The value is computed once per run and exported in `CAPACITY_ENV`: free memory drops as
+        browsers start, so a limit recomputed by a later worker would be smaller than the slots
+        the others already hold.
+        """
+    if browser_config.max_browsers > 0:
+        return browser_config.max_browsers
+    inherited = os.getenv(CAPACITY_ENV)
+    if inherited:
+        return int(inherited)
+    capacity = os.cpu_count() or 1
+    memory_mb = _available_memory_mb()
+    if memory_mb is not None:
+        capacity = min(capacity, memory_mb // browser_config.browser_memory_mb)
+    capacity = max(1, capacity)
+    os.environ[CAPACITY_ENV] = str(capacity)
+    return capacity
+
+
+def browser_capacity() -> int:
+    """Concurrent browsers this host may drive: `remote_max_sessions` on a Grid, else `host_browser_capacity()`."""
+    if browser_config.remote_url:
+        return browser_config.remote_max_sessions
+    return host_browser_capacity()
+
+
+class BrowserSlot:
+    """
+        A cross-process lease on one of the host's browser slots.
+
+        Slots are lock files in a shared temp directory, so every pytest-xdist worker (and any
+        other run on the same host) competes for the same `limit`. Locks are advisory OS file
+        locks, released automatically if the holding process dies.
+        """
+
+    def __init__(self, limit: int | None = None, timeout: int | None = None, lock_dir: Path = _LOCK_DIR):
+        self.limit = limit if limit is not None else host_browser_capacity()
+        self.timeout = timeout if timeout is not None else browser_config.browser_slot_timeout
+        self.lock_dir = lock_dir
+        self.index: int | None = None
+        self._fd: int | None = None
+
+    def acquire(self) -> None:
+        """
+                Blocks until a slot is free and takes it.
+
+                Raises:
+                    TimeoutError: If no slot frees up within `timeout` seconds.
+                """
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+        deadline = time.monotonic() + self.timeout
+        while True:
+            for index in range(self.limit):
+                if self._try_lock(index):
+                    logger.debug("Acquired browser slot {}/{}.", index + 1, self.limit)
+                    return
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"No browser slot free after {self.timeout}s (limit {self.limit}); "
+                    "lower the worker count or raise max_browsers."
+                )
+            time.sleep(_POLL_INTERVAL)
+
+    def release(self) -> None:
+        """Frees the slot held by this lease, if any."""
+        if self._fd is None:
+            return
+        if os.name == "nt":
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        logger.debug("Released browser slot {}/{}.", self.index + 1, self.limit)
+        self._fd = None
+        self.index = None
+
+    def _try_lock(self, index: int) -> bool:
+        fd = os.open(self.lock_dir / f"slot-{index}.lock", os.O_RDWR | os.O_CREAT)
+        try:
+            if os.name == "nt":
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        self.index = index
+        return True
@@ -0,0 +1,100 @@
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import urllib3
+from loguru import logger
+from selenium import webdriver
+from selenium.common import SessionNotCreatedException
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+from core.actions.wait_engine import BackoffSchedule
+from core.browser.browser_slots import BrowserSlot
+from core.config.browser_config import browser_config
+
+_REMOTE_LOCK_DIR = Path(tempfile.gettempdir()) / "selenium_pom_remote_slots"
+_MAX_RETRY_DELAY = 30.0
+
+_pools: dict[str, urllib3.PoolManager] = {}
+_pools_lock = threading.Lock()
+
+
+class GridConnection(RemoteConnection):
+    """
+        RemoteConnection whose keep-alive HTTP pool is shared by every session to the same hub.
+
+        Selenium gives each driver its own urllib3 pool and clears it on quit, so every new
+        session pays fresh TCP (and TLS) handshakes. Here all sessions of the process reuse one
+        pool holding up to `max_connections` idle connections per hub, so commands from pooled
+        or concurrently running drivers go out over already-open sockets.
+        """
+
+    def __init__(self, hub_url: str, max_connections: int | None = None):
+        max_connections = max_connections or browser_config.remote_max_sessions
+        super().__init__(client_config=ClientConfig(
+            remote_server_addr=hub_url,
+            keep_alive=True,
+            init_args_for_pool_manager={"init_args_for_pool_manager": {"maxsize": max_connections}},
+        ))
+
+    def _get_connection_manager(self):
+        hub_url = self._client_config.remote_server_addr
+        with _pools_lock:
+            if hub_url not in _pools:
+                _pools[hub_url] = super()._get_connection_manager()
+            return _pools[hub_url]
+
+    def close(self):
+        """Keeps the shared pool open for the next session; see `close_connection_pools`."""
+
+
+def close_connection_pools() -> None:
+    """Closes every pooled connection to every hub."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.clear()
+        _pools.clear()
+
+
+def remote_session_slot() -> BrowserSlot:
+    """A cross-process lease on one of the `remote_max_sessions` sessions this host may hold on the grid."""
+    return BrowserSlot(limit=browser_config.remote_max_sessions, lock_dir=_REMOTE_LOCK_DIR)
+
+
+def start_remote_driver(options, hub_url: str | None = None):
+    """
+        Starts a `webdriver.Remote` session on the hub, retrying while the grid is saturated.
+
+        The configured `remote_capabilities` are merged into `options`. When the grid refuses a
+        new session (no free node, request queue timed out), creation is retried up to
+        `remote_session_retries` times, waiting `remote_retry_delay` seconds at first and
+        doubling the delay after every attempt (capped at 30 s).
+
+        Args:
+            options: Browser options (Chrome, Firefox or Edge) describing the requested session.
+            hub_url: Grid hub URL; defaults to `remote_url` from the configuration.
+
+        Returns:
+            WebDriver: The remote driver.
+
+        Raises:
+            SessionNotCreatedException: If the grid still refuses after the last retry.
+        """
+    hub_url = hub_url or browser_config.remote_url
+    for name, value in browser_config.remote_capabilities.items():
+        options.set_capability(name, value)
+    delays = BackoffSchedule(browser_config.remote_retry_delay, 2.0, _MAX_RETRY_DELAY).intervals()
+    attempt = 0
+    while True:
+        try:
+            return webdriver.Remote(command_executor=GridConnection(hub_url), options=options)
+        except SessionNotCreatedException as e:
+            attempt += 1
+            if attempt > browser_config.remote_session_retries:
+                raise
+            delay = next(delays)
+            logger.warning("Grid at {} did not create a session ({}); retry {}/{} in {:.1f}s",
+                           hub_url, e.msg, attempt, browser_config.remote_session_retries, delay)
+            time.sleep(delay)
@@ -0,0 +1,73 @@
+import json
+
+from loguru import logger
+
+from core.browser.browser_type import BrowserType
+from core.config.browser_config import browser_config
+
+# Finishes every animation and transition at once and disables smooth scrolling, so elements reach
+# their final position / opacity in the first frame instead of after their CSS duration and delay.
+NO_MOTION_STYLESHEET = (
+    "*, *::before, *::after {"
+    " animation-duration: 0s !important; animation-delay: 0s !important;"
+    " transition-duration: 0s !important; transition-delay: 0s !important;"
+    " scroll-behavior: auto !important; }"
+)
+
+# Runs before any page script; the <html> element may not exist yet, so wait for it if needed.
+NO_MOTION_SCRIPT = """() => {
+  const install = () => {
+    const style = document.createElement("style");
+    style.setAttribute("data-pom", "no-motion");
+    style.textContent = %s;
+    (document.head || document.documentElement).appendChild(style);
+  };
+  if (document.documentElement) {
+    install();
+  } else {
+    new MutationObserver((records, observer) => {
+      if (document.documentElement) {
+        observer.disconnect();
+        install();
+      }
+    }).observe(document, { childList: true });
+  }
+}""" % json.dumps(NO_MOTION_STYLESHEET)
+
+
+def configure_render_options(browser_type: BrowserType, options, remote: bool = False) -> None:
+    """
+        Adds the render profile's launch options: reduced motion and no smooth scrolling.
+
+        Firefox and Grid sessions have no CDP, so WebDriver BiDi is switched on for the
+        viewport and the no-motion preload script (see `apply_render_profile`).
+        """
+    if browser_type is BrowserType.FIREFOX:
+        options.set_preference("general.smoothScroll", False)
+        if browser_config.reduced_motion:
+            options.set_preference("ui.prefersReducedMotion", 1)
+    else:
+        options.add_argument("--disable-smooth-scrolling")
+        if browser_config.reduced_motion:
+            options.add_argument("--force-prefers-reduced-motion")
+    if browser_type is BrowserType.FIREFOX or remote:
+        options.enable_bidi = True
+
+
+def apply_render_profile(driver) -> None:
+    """Fixes the viewport and device scale factor and injects the no-motion stylesheet into every new document."""
+    width, height = browser_config.viewport_width, browser_config.viewport_height
+    scale = browser_config.device_scale_factor
+    if hasattr(driver, "execute_cdp_cmd"):
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": f"({NO_MOTION_SCRIPT})();"})
+        driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+            "width": width, "height": height, "deviceScaleFactor": scale, "mobile": False,
+        })
+    else:
+        driver.script.pin(NO_MOTION_SCRIPT)
+        driver.browsing_context.set_viewport(
+            context=driver.current_window_handle,
+            viewport={"width": width, "height": height},
+            device_pixel_ratio=scale,
+        )
+    logger.info("Render profile: {}x{} viewport at {}x, animations and transitions off", width, height, scale)
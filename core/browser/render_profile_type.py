@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class RenderProfile(Enum):
+    DEFAULT = "default"
+    FAST = "fast"
@@ -0,0 +1,152 @@
+from fnmatch import fnmatch
+
+from loguru import logger
+
+from core.browser.browser_type import BrowserType
+from core.config.browser_config import browser_config
+
+# URL globs per resource type. CDP matches the whole URL, so query-string variants are listed too.
+RESOURCE_TYPE_PATTERNS = {
+    "image": ("*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.avif"),
+    "media": ("*.mp4", "*.webm", "*.mp3", "*.ogg", "*.wav", "*.m4a"),
+    "font": ("*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"),
+    "tracker": (
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*facebook.net*",
+        "*hotjar.com*", "*segment.io*", "*sentry.io*", "*backtrace.io*", "*newrelic.com*", "*nr-data.net*",
+    ),
+}
+
+# Firefox has no CDP; these preferences stop the matching resource types from loading at all.
+_FIREFOX_TYPE_PREFERENCES = {
+    "image": {"permissions.default.image": 2},
+    "font": {"browser.display.use_document_fonts": 0, "gfx.downloadable_fonts.enabled": False},
+    "media": {"media.autoplay.default": 5, "media.preload.default": 0, "media.preload.auto": 0},
+}
+
+
+def has_request_actions() -> bool:
+    """
+        True when Selenium's BiDi `Request` has the public `fail()` / `provide_response()` actions.
+
+        With them, handlers registered through `network.add_request_handler(handler)` only act on
+        the requests they care about and Selenium continues the rest. Older releases only offer the
+        phase-based `add_request_handler("before_request", ...)` form, whose callbacks must fail or
+        continue every request themselves and cannot answer one.
+        """
+    from selenium.webdriver.common.bidi.network import Request  # BiDi is only loaded when interception is used
+
+    return hasattr(Request, "provide_response")
+
+
+class ResourcePolicy:
+    """
+        Blocks resource types / URL patterns and serves per-test stub responses.
+
+        Chromium (Chrome, Edge) blocks through CDP `Network.setBlockedURLs`, entirely inside the
+        browser. Firefox drops images, fonts and media through preferences and fails any other
+        blocked URL through WebDriver BiDi request interception, as do Grid sessions, which have no
+        CDP. Stubs use BiDi interception on every browser, which must be switched on at launch
+        (`network_stubs=true`).
+        """
+
+    def __init__(self, block_resources: list[str] | None = None, block_url_patterns: list[str] | None = None,
+                 stubs_enabled: bool | None = None):
+        self.block_resources = block_resources if block_resources is not None else browser_config.block_resources
+        self.block_url_patterns = (
+            block_url_patterns if block_url_patterns is not None else browser_config.block_url_patterns
+        )
+        self.stubs_enabled = stubs_enabled if stubs_enabled is not None else browser_config.network_stubs
+        unknown = set(self.block_resources) - RESOURCE_TYPE_PATTERNS.keys()
+        if unknown:
+            raise ValueError(f"Unknown resource type(s) to block: {sorted(unknown)}; "
+                             f"supported: {sorted(RESOURCE_TYPE_PATTERNS)}")
+
+    def blocked_patterns(self, browser_type: BrowserType) -> list[str]:
+        """URL globs to block; on Firefox resource types handled by preferences are left out."""
+        patterns = list(self.block_url_patterns)
+        for resource in self.block_resources:
+            if browser_type is BrowserType.FIREFOX and resource in _FIREFOX_TYPE_PREFERENCES:
+                continue
+            for pattern in RESOURCE_TYPE_PATTERNS[resource]:
+                patterns.append(pattern)
+                if pattern.startswith("*.") and browser_type is not BrowserType.FIREFOX:
+                    patterns.append(f"{pattern}?*")
+        return patterns
+
+    def configure_options(self, browser_type: BrowserType, options, remote: bool = False) -> None:
+        """Adjusts launch options before the browser starts; `remote` marks a Grid session."""
+        if browser_type is BrowserType.FIREFOX:
+            for resource in self.block_resources:
+                for name, value in _FIREFOX_TYPE_PREFERENCES.get(resource, {}).items():
+                    options.set_preference(name, value)
+        if (browser_type is BrowserType.FIREFOX or remote) and self.blocked_patterns(browser_type):
+            options.enable_bidi = True
+        if self.stubs_enabled:
+            options.enable_bidi = True
+
+    def apply(self, driver, browser_type: BrowserType) -> None:
+        """Installs URL blocking on a freshly started driver."""
+        patterns = self.blocked_patterns(browser_type)
+        if not patterns:
+            return
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        elif has_request_actions():
+            driver.network.add_request_handler(lambda request: _block(request, patterns))
+        else:
+            def _block_legacy(request):
+                if any(fnmatch(request.url, pattern) for pattern in patterns):
+                    request.fail_request()
+                else:
+                    request.continue_request()
+
+            driver.network.add_request_handler("before_request", _block_legacy)
+        logger.info("Blocking {} URL pattern(s) on {}", len(patterns), browser_type.value)
+
+
+def _block(request, patterns: list[str]) -> None:
+    if any(fnmatch(request.url, pattern) for pattern in patterns):
+        request.fail()
+
+
+class NetworkStubs:
+    """
+        Per-test stub responses: requests whose URL matches a registered glob get the canned
+        response instead of reaching the network. Call `clear()` when the test ends.
+        """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._stubs: list[tuple[str, int, str, str]] = []
+        self._handler_id = None
+
+    def add(self, url_pattern: str, body: str, status: int = 200, content_type: str = "application/json") -> None:
+        """
+                Answers requests matching `url_pattern` (fnmatch glob) with the given response.
+
+                Raises:
+                    RuntimeError: If the driver was started without WebDriver BiDi (`network_stubs`), or
+                        the installed Selenium has no `Request.provide_response()`.
+                """
+        if not self.driver.caps.get("webSocketUrl"):
+            raise RuntimeError("Network stubs need WebDriver BiDi; set network_stubs=true in .env.")
+        if not has_request_actions():
+            raise RuntimeError("Network stubs need a Selenium release whose BiDi Request has provide_response().")
+        self._stubs.append((url_pattern, status, content_type, body))
+        if self._handler_id is None:
+            self._handler_id = self.driver.network.add_request_handler(self._handle)
+
+    def clear(self) -> None:
+        if self._handler_id is not None:
+            self.driver.network.remove_request_handler(self._handler_id)
+            self._handler_id = None
+        self._stubs.clear()
+
+    def _handle(self, request) -> None:
+        """Answers the first matching stub; Selenium continues requests no stub matches."""
+        for url_pattern, status, content_type, body in self._stubs:
+            if fnmatch(request.url, url_pattern):
+                request.provide_response(status=status, headers={"Content-Type": content_type}, body=body,
+                                         reason_phrase="OK" if status < 400 else "Stubbed")
+                return
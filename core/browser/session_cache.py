@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+from urllib.parse import urlsplit
+
+from loguru import logger
+from selenium.common import TimeoutException
+
+from core.actions.wait_engine import WaitEngine
+from core.config.browser_config import browser_config
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+_READ_STORAGE_SCRIPT = """
+const dump = (storage) => Object.fromEntries(Object.keys(storage).map(key => [key, storage.getItem(key)]));
+return {origin: location.origin, local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+# Formatted with the JSON-encoded origin and storage dictionaries.
+_WRITE_STORAGE_SCRIPT = """
+(() => {{
+    if (location.origin !== {origin}) return;
+    for (const [key, value] of Object.entries({local})) window.localStorage.setItem(key, value);
+    for (const [key, value] of Object.entries({session})) window.sessionStorage.setItem(key, value);
+}})();
+"""
+
+
+@dataclass
+class SessionSnapshot:
+    """Cookies and web storage of an authenticated browser, as captured right after login."""
+
+    origin: str
+    cookies: list[dict]
+    local_storage: dict[str, str] = field(default_factory=dict)
+    session_storage: dict[str, str] = field(default_factory=dict)
+    created_at: float = field(default_factory=time.time)
+
+    def storage_script(self) -> str:
+        return _WRITE_STORAGE_SCRIPT.format(
+            origin=json.dumps(self.origin),
+            local=json.dumps(self.local_storage),
+            session=json.dumps(self.session_storage),
+        )
+
+
+def origin_of(url: str) -> str:
+    """`scheme://host[:port]` of `url`, the part of a URL a browser session belongs to."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _safe(text: str) -> str:
+    return "".join(char if char.isalnum() or char in "-_." else "_" for char in text)
+
+
+class SessionCache:
+    """
+        Caches authenticated sessions on disk so tests can skip the UI login.
+
+        The first `authenticate` call for a user logs in through the supplied UI flow and saves
+        the resulting cookies and web storage (one file per user, origin of the target URL and
+        pytest-xdist worker, so a session of one environment is never injected into another). Later
+        calls inject that snapshot into the driver and navigate straight to the target page.
+        Snapshots older than `ttl` seconds, or rejected by the application (the login form shows
+        up again after restoring), are dropped and the UI login runs once more.
+        """
+
+    def __init__(self, cache_dir: str | Path | None = None, ttl: int | None = None):
+        self.cache_dir = Path(cache_dir if cache_dir is not None else browser_config.session_cache_dir)
+        self.ttl = ttl if ttl is not None else browser_config.session_ttl
+        self._worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        self._memory: dict[str, SessionSnapshot] = {}
+
+    def authenticate(
+        self,
+        driver: WebDriver,
+        user: str,
+        url: str,
+        login: Callable[[WebDriver], None],
+        ready_locator: tuple[str, str],
+        login_form_locator: tuple[str, str],
+        timeout: int = 10,
+    ) -> bool:
+        """
+                Leaves `driver` authenticated as `user` on `url`.
+
+                Args:
+                    driver (WebDriver): The browser to authenticate.
+                    user (str): Cache key, usually the username.
+                    url (str): Page to land on, e.g. the inventory URL.
+                    login (Callable[[WebDriver], None]): UI login flow used on a cache miss.
+                    ready_locator (tuple[str, str]): Element that proves the target page loaded.
+                    login_form_locator (tuple[str, str]): Element that proves the session was rejected.
+                    timeout (int): Maximum wait in seconds for either page to show up.
+
+                Returns:
+                    bool: True when a cached session was restored, False when the UI login ran.
+
+                Raises:
+                    TimeoutException: If the target page is not reached after the UI login.
+                """
+        origin = origin_of(url)
+        snapshot = self.load(user, origin)
+        if snapshot is not None:
+            self.restore(driver, snapshot, url)
+            if self._landed_on(driver, ready_locator, login_form_locator, timeout) == "ready":
+                logger.info(f"Restored cached session for '{user}' on {origin}")
+                return True
+            logger.info(f"Cached session for '{user}' on {origin} was rejected; logging in through the UI")
+            self.invalidate(user, origin)
+
+        login(driver)
+        WaitEngine(driver).element(ready_locator, timeout)
+        self.save(user, origin, self.capture(driver))
+        if driver.current_url.rstrip("/") != url.rstrip("/"):
+            driver.get(url)
+        return False
+
+    def load(self, user: str, origin: str) -> SessionSnapshot | None:
+        """Returns the cached snapshot for `user` on `origin`, or None when missing, unreadable or expired."""
+        snapshot = self._memory.get((user, origin))
+        if snapshot is None:
+            try:
+                snapshot = SessionSnapshot(**json.loads(self._path(user, origin).read_text(encoding="utf-8")))
+            except (OSError, ValueError, TypeError):
+                return None
+        if time.time() - snapshot.created_at > self.ttl:
+            self.invalidate(user, origin)
+            return None
+        self._memory[(user, origin)] = snapshot
+        return snapshot
+
+    def save(self, user: str, origin: str, snapshot: SessionSnapshot) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._path(user, origin).write_text(json.dumps(asdict(snapshot)), encoding="utf-8")
+        self._memory[(user, origin)] = snapshot
+
+    def invalidate(self, user: str, origin: str) -> None:
+        self._memory.pop((user, origin), None)
+        self._path(user, origin).unlink(missing_ok=True)
+
+    @staticmethod
+    def capture(driver: WebDriver) -> SessionSnapshot:
+        """Captures cookies plus local/session storage of the page currently open in `driver`."""
+        storage = driver.execute_script(_READ_STORAGE_SCRIPT)
+        return SessionSnapshot(
+            origin=storage["origin"],
+            cookies=driver.get_cookies(),
+            local_storage=storage["local"],
+            session_storage=storage["session"],
+        )
+
+    @staticmethod
+    def restore(driver: WebDriver, snapshot: SessionSnapshot, url: str) -> None:
+        """
+                Injects `snapshot` into `driver` and opens `url`.
+
+                Chromium gets cookies through CDP and storage through a one-shot new-document
+                script, so restoring costs a single navigation. Other browsers first open the
+                origin (WebDriver only sets cookies for the current domain), then `url`.
+                """
+        if hasattr(driver, "execute_cdp_cmd"):
+            cookies = [SessionCache._cdp_cookie(cookie, snapshot.origin) for cookie in snapshot.cookies]
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+            script = driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": snapshot.storage_script()}
+            )
+            try:
+                driver.get(url)
+            finally:
+                driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script["identifier"]})
+            return
+        driver.get(snapshot.origin)
+        for cookie in snapshot.cookies:
+            driver.add_cookie(cookie)
+        driver.execute_script(snapshot.storage_script())
+        driver.get(url)
+
+    def _path(self, user: str, origin: str) -> Path:
+        return self.cache_dir / f"{_safe(user)}-{_safe(origin)}-{self._worker}.json"
+
+    @staticmethod
+    def _cdp_cookie(cookie: dict, origin: str) -> dict:
+        cdp_cookie = {key: cookie[key] for key in ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite")
+                      if key in cookie}
+        if "expiry" in cookie:
+            cdp_cookie["expires"] = cookie["expiry"]
+        if "domain" not in cdp_cookie:
+            cdp_cookie["url"] = origin
+        return cdp_cookie
+
+    @staticmethod
+    def _landed_on(driver: WebDriver, ready_locator: tuple[str, str], login_form_locator: tuple[str, str],
+                   timeout: int) -> str | None:
+        def _page(d: WebDriver) -> str | None:
+            if d.find_elements(*ready_locator):
+                return "ready"
+            if d.find_elements(*login_form_locator):
+                return "login"
+            return None
+
+        try:
+            return WaitEngine(driver).until(_page, timeout, label="page after session restore")
+        except TimeoutException:
+            return None
@@ -0,0 +1,90 @@
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+from loguru import logger
+from selenium.webdriver.common.driver_finder import DriverFinder
+
+from core.config.browser_config import browser_config
+
+
+# Chrome / Edge: skip first-run UI, background services and features a test never needs.
+FAST_CHROMIUM_ARGUMENTS = (
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-extensions",
+    "--disable-component-extensions-with-background-pages",
+    "--disable-component-update",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-client-side-phishing-detection",
+    "--disable-features=Translate,OptimizationHints,MediaRouter,InterestFeedContentSuggestions",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--password-store=basic",
+    "--use-mock-keychain",
+)
+
+# Firefox: no telemetry, updates, default-browser check, safe-browsing downloads or start page.
+FAST_FIREFOX_PREFERENCES = {
+    "browser.shell.checkDefaultBrowser": False,
+    "browser.startup.page": 0,
+    "browser.startup.homepage_override.mstone": "ignore",
+    "browser.aboutwelcome.enabled": False,
+    "browser.safebrowsing.malware.enabled": False,
+    "browser.safebrowsing.phishing.enabled": False,
+    "browser.safebrowsing.downloads.enabled": False,
+    "datareporting.policy.dataSubmissionEnabled": False,
+    "datareporting.healthreport.uploadEnabled": False,
+    "toolkit.telemetry.enabled": False,
+    "toolkit.telemetry.unified": False,
+    "app.normandy.enabled": False,
+    "app.shield.optoutstudies.enabled": False,
+    "extensions.update.enabled": False,
+    "extensions.getAddons.cache.enabled": False,
+    "network.captive-portal-service.enabled": False,
+    "network.connectivity-service.enabled": False,
+    "media.autoplay.default": 5,
+}
+
+
+def resolve_binary_paths(service, options) -> dict[str, str]:
+    """
+        Returns the driver and browser paths for `options`, cached on disk across runs.
+
+        Selenium Manager is only invoked when the cache has no entry for the browser or a cached
+        path no longer exists (e.g. after a browser update removed the old binary).
+        """
+    cache_path = Path(browser_config.driver_cache_path)
+    browser = options.capabilities["browserName"]
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cache = {}
+    paths = cache.get(browser)
+    if paths and all(Path(path).is_file() for path in paths.values() if path):
+        return paths
+
+    finder = DriverFinder(service, options)
+    paths = {"driver_path": finder.get_driver_path(), "browser_path": finder.get_browser_path()}
+    cache[browser] = paths
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+    logger.info("Cached {} driver paths in {}", browser, cache_path)
+    return paths
+
+
+def copy_profile_template() -> Path | None:
+    """Copies the configured pre-warmed profile template into a fresh temp dir, if one is configured."""
+    if not browser_config.profile_template_dir:
+        return None
+    target = Path(tempfile.mkdtemp(prefix="selenium_pom_profile_"))
+    shutil.copytree(browser_config.profile_template_dir, target, dirs_exist_ok=True)
+    return target
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class StartupProfile(Enum):
+    DEFAULT = "default"
+    FAST = "fast"
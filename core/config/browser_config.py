@@ -1,6 +1,16 @@
+import functools
+from typing import Any
+
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from selenium.webdriver.common.options import PageLoadStrategy
 
+from core.actions.wait_strategy import WaitStrategy
 from core.browser.browser_type import BrowserType
+from core.browser.render_profile_type import RenderProfile
+from core.browser.startup_profile_type import StartupProfile
+from core.config.sauce_demo_env import SauceDemoEnv
+from core.instrumentation.screenshot_format import ScreenshotFormat
 
 
 class BrowserConfig(BaseSettings):
@@ -10,8 +20,116 @@ class BrowserConfig(BaseSettings):
         extra="allow",
     )
 
+    # Application under test: URL, USER and PASS (environment or .env), see `sauce_demo`.
+    url: str = ""
+    user: str = ""
+    password: str = Field("", validation_alias="pass")
     browser: BrowserType = BrowserType.CHROME
     headless: bool = False
+    # normal waits for every subresource; eager returns at DOMContentLoaded, none right after the response.
+    # Page objects' open() then waits for their own ready element.
+    page_load_strategy: PageLoadStrategy = PageLoadStrategy.eager
+    # Browser pool (tests/conftest.py): idle drivers kept per worker and leases before a driver is recycled.
+    pool_size: int = 1
+    pool_max_uses: int = 50
+    # Parallel runs: 0 = derive the per-host browser cap from CPU count and available memory.
+    max_browsers: int = 0
+    browser_memory_mb: int = 600
+    browser_slot_timeout: int = 300
+    # Fixed window size used instead of maximize_window() under pytest-xdist and with the fast profile.
+    window_width: int = 1366
+    window_height: int = 768
+    # Startup profile: "fast" caches driver/browser paths, tunes launch flags and can copy a profile template.
+    startup_profile: StartupProfile = StartupProfile.DEFAULT
+    driver_cache_path: str = ".driver_cache/paths.json"
+    profile_template_dir: str = ""
+    # Render profile: "fast" renders at a fixed viewport and device scale factor, turns off CSS animations,
+    # transitions and smooth scrolling on every document and, with reduced_motion, emulates prefers-reduced-motion.
+    render_profile: RenderProfile = RenderProfile.DEFAULT
+    viewport_width: int = 1280
+    viewport_height: int = 720
+    device_scale_factor: float = 1.0
+    reduced_motion: bool = True
+    # Remote WebDriver / Selenium Grid: hub URL (empty = local browsers) and extra capabilities as a JSON
+    # object (e.g. remote_capabilities={"platformName":"linux"}). remote_max_sessions caps concurrent sessions
+    # from this host and sizes the shared keep-alive HTTP pool; a saturated grid is retried with backoff.
+    remote_url: str = ""
+    remote_capabilities: dict[str, Any] = {}
+    remote_max_sessions: int = 4
+    remote_session_retries: int = 5
+    remote_retry_delay: float = 2.0
+    # Resource policy: resource types (image, media, font, tracker) and URL globs to block, as JSON lists
+    # (e.g. block_resources=["image","font"]); network_stubs enables WebDriver BiDi for per-test stubs.
+    block_resources: list[str] = []
+    block_url_patterns: list[str] = []
+    network_stubs: bool = False
+    # Actions waits: backoff polling (first poll, growth factor, cap in seconds) or a MutationObserver.
+    wait_strategy: WaitStrategy = WaitStrategy.BACKOFF
+    wait_first_poll: float = 0.05
+    wait_backoff_factor: float = 2.0
+    wait_max_poll: float = 0.5
+    # Authenticated session snapshots (cookies + web storage) reused instead of the UI login.
+    session_cache_dir: str = ".session_cache"
+    session_ttl: int = 1800
+    # Per-step timing (core/instrumentation): JSON/CSV report directory, terminal top-N, Allure attachment.
+    timing_enabled: bool = True
+    timing_report_dir: str = "reports/timing"
+    timing_top_n: int = 10
+    timing_allure: bool = True
+    # Run history (core/plugins/history.py): per-test durations / outcomes of the last N runs, used for ordering
+    # and --time-budget selection.
+    history_path: str = ".test_history/history.json"
+    history_runs: int = 10
+    # Login matrix (core/plugins/login_matrix.py): credential / expectation table (CSV, or YAML with PyYAML),
+    # default per-row login latency budget in seconds, where per-row latencies are written, and whether a row
+    # over its budget fails instead of only being flagged as a timing regression.
+    login_matrix_path: str = "tests/data/login_matrix.csv"
+    login_latency_budget: float = 2.0
+    login_matrix_report: str = "reports/login_matrix.json"
+    login_latency_strict: bool = False
+    # Failure artifacts (core/plugins/artifacts.py): what to capture for the first N failing tests per worker
+    # (0 = every failure); screenshots are re-encoded in the background (png / jpeg, scale 0-1, needs Pillow).
+    failure_artifacts: list[str] = ["screenshot", "page_source", "console"]
+    failure_artifact_limit: int = 20
+    screenshot_format: ScreenshotFormat = ScreenshotFormat.PNG
+    screenshot_scale: float = 1.0
+    screenshot_jpeg_quality: int = 75
+
+    @property
+    def missing_sauce_demo(self) -> list[str]:
+        """Names of the required URL / USER / PASS variables that are not set."""
+        values = (("URL", self.url), ("USER", self.user), ("PASS", self.password))
+        return [name for name, value in values if not value.strip()]
+
+    @property
+    def sauce_demo(self) -> SauceDemoEnv:
+        return SauceDemoEnv(base_url=self.url.strip(), username=self.user.strip(), password=self.password.strip())
+
+
+@functools.cache
+def get_browser_config() -> BrowserConfig:
+    """The process-wide settings; the environment and `.env` are read once, on first use."""
+    return BrowserConfig()
+
+
+class _LazyBrowserConfig:
+    """
+        Module-level handle for `get_browser_config()`: importing `browser_config` reads nothing;
+        the first attribute access loads the settings, and assignments (e.g. `monkeypatch.setattr`)
+        go to the shared instance.
+        """
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_browser_config(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(get_browser_config(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(get_browser_config(), name)
+
+    def __repr__(self) -> str:
+        return repr(get_browser_config())
 
 
-browser_config = BrowserConfig()
+browser_config = _LazyBrowserConfig()
@@ -0,0 +1,83 @@
+import csv
+from dataclasses import dataclass
+from pathlib import Path
+
+from core.config.browser_config import browser_config
+from core.data.login_outcome_type import LoginOutcome
+
+# Password cell replaced by the `.env` password (PASS), so the table holds no secrets.
+ENV_PASSWORD = "${PASS}"
+
+_COLUMNS = ("id", "user", "password", "expected", "error", "max_seconds")
+
+
+@dataclass(frozen=True)
+class LoginCase:
+    """
+        One row of the login matrix: credentials, the expected outcome, a substring of the expected
+        error banner and the login latency budget in seconds (submit until inventory or error).
+        """
+
+    id: str
+    user: str
+    password: str
+    expected: LoginOutcome
+    error: str = ""
+    max_seconds: float = 0.0
+
+    def resolved_password(self, env_password: str) -> str:
+        return env_password if self.password == ENV_PASSWORD else self.password
+
+
+def _rows(path: Path) -> list[dict]:
+    if path.suffix.lower() in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError as e:
+            raise ImportError(f"Reading {path} needs PyYAML (pip install pyyaml); or use a CSV table.") from e
+        rows = yaml.safe_load(path.read_text(encoding="utf-8")) or []
+        if not isinstance(rows, list):
+            raise ValueError(f"{path}: expected a list of mappings, got {type(rows).__name__}")
+        return rows
+    with path.open(newline="", encoding="utf-8") as file:
+        return list(csv.DictReader(file))
+
+
+def load_login_matrix(path: str | Path | None = None) -> list[LoginCase]:
+    """
+        Reads login cases from a CSV table or a YAML list of mappings with the same keys.
+
+        Columns: `id` (defaults to the user; repeated ids get a numeric suffix), `user`, `password`
+        (`${PASS}` = the `.env` password, empty = no password), `expected` (`inventory` or `error`),
+        `error` (substring of the error banner) and `max_seconds` (empty = `login_latency_budget`).
+
+        Args:
+            path (str | Path | None): Table to read; defaults to `login_matrix_path`.
+
+        Returns:
+            list[LoginCase]: One case per row, in file order.
+
+        Raises:
+            ValueError: If a row is not a mapping, has an unknown column or an invalid `expected` /
+                `max_seconds` value.
+        """
+    path = Path(path or browser_config.login_matrix_path)
+    cases, seen = [], {}
+    for number, row in enumerate(_rows(path), start=1):
+        if not isinstance(row, dict):
+            raise ValueError(f"{path} row {number}: expected a mapping of columns, got {row!r}")
+        unknown = set(row) - set(_COLUMNS)
+        if unknown:
+            raise ValueError(f"{path} row {number}: unknown column(s) {sorted(unknown)}")
+        values = {key: "" if row.get(key) is None else str(row[key]).strip() for key in _COLUMNS}
+        try:
+            expected = LoginOutcome(values["expected"])
+            budget = float(values["max_seconds"] or browser_config.login_latency_budget)
+        except ValueError as e:
+            raise ValueError(f"{path} row {number}: {e}") from None
+        case_id = values["id"] or values["user"] or "no_user"
+        seen[case_id] = seen.get(case_id, 0) + 1
+        if seen[case_id] > 1:
+            case_id = f"{case_id}-{seen[case_id]}"
+        cases.append(LoginCase(case_id, values["user"], values["password"], expected, values["error"], budget))
+    return cases
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class LoginOutcome(Enum):
+    INVENTORY = "inventory"
+    ERROR = "error"
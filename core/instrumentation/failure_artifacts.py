@@ -0,0 +1,149 @@
+import base64
+import importlib.util
+import io
+import json
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from allure_commons import plugin_manager
+from allure_commons.model2 import ATTACHMENT_PATTERN, Attachment
+from allure_commons.reporter import AllureReporter
+from allure_commons.types import AttachmentType
+from loguru import logger
+from selenium.common import WebDriverException
+
+from core.config.browser_config import browser_config
+from core.instrumentation.screenshot_format import ScreenshotFormat
+
+ARTIFACT_TYPES = ("screenshot", "page_source", "console")
+
+
+def _current_allure_item():
+    """The running Allure test (or step), or None when allure-pytest is not reporting (no --alluredir)."""
+    for plugin in plugin_manager.get_plugins():
+        reporter = getattr(plugin, "allure_logger", None)
+        if isinstance(reporter, AllureReporter):
+            return reporter.get_last_item()
+    return None
+
+
+class FailureArtifacts:
+    """
+        Captures failure artifacts on the test thread and finishes them on a background worker.
+
+        The test thread only pays for the raw WebDriver calls (screenshot as base64, page source,
+        browser console log) and for registering the attachments with the running Allure test.
+        Decoding, downscaling / JPEG encoding, serialization and writing the files into the Allure
+        results directory happen on one worker thread; `close()` waits until it is done. Only the
+        first `limit` failures of the process are captured (0 = all).
+        """
+
+    def __init__(self, artifacts: list[str] | None = None, limit: int | None = None,
+                 image_format: ScreenshotFormat | None = None, scale: float | None = None,
+                 jpeg_quality: int | None = None):
+        self.artifacts = artifacts if artifacts is not None else browser_config.failure_artifacts
+        self.limit = limit if limit is not None else browser_config.failure_artifact_limit
+        self.image_format = image_format or browser_config.screenshot_format
+        self.scale = scale if scale is not None else browser_config.screenshot_scale
+        self.jpeg_quality = jpeg_quality or browser_config.screenshot_jpeg_quality
+        unknown = set(self.artifacts) - set(ARTIFACT_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown failure artifact(s): {sorted(unknown)}; supported: {list(ARTIFACT_TYPES)}")
+        # Pillow is optional (only needed to downscale or JPEG-encode) and imported on first use.
+        if importlib.util.find_spec("PIL") is None and (self.image_format is ScreenshotFormat.JPEG or self.scale < 1):
+            logger.warning("Pillow is not installed; failure screenshots are kept as full-size PNG.")
+            self.image_format, self.scale = ScreenshotFormat.PNG, 1.0
+        self.captured = 0
+        self._lock = threading.Lock()
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="failure-artifacts")
+
+    def capture(self, driver, name: str) -> bool:
+        """
+                Grabs the configured artifacts from `driver` and queues them for the running Allure test.
+
+                Args:
+                    driver: The failing test's WebDriver.
+                    name (str): Test id, used in log messages.
+
+                Returns:
+                    bool: False when nothing was captured (Allure not reporting or `limit` reached).
+                """
+        item = _current_allure_item()
+        if item is None:
+            return False
+        with self._lock:
+            if self.limit and self.captured >= self.limit:
+                logger.debug("Failure artifact limit ({}) reached; skipping {}.", self.limit, name)
+                return False
+            self.captured += 1
+        for artifact in self.artifacts:
+            try:
+                raw = self._grab(driver, artifact)
+            except WebDriverException as e:
+                logger.warning("Could not capture {} for {}: {}", artifact, name, e.msg)
+                continue
+            if raw is None:
+                continue
+            attachment_type = self._attachment_type(artifact)
+            file_name = ATTACHMENT_PATTERN.format(prefix=uuid.uuid4(), ext=attachment_type.extension)
+            item.attachments.append(
+                Attachment(name=f"{artifact}_on_failure", source=file_name, type=attachment_type.mime_type)
+            )
+            self._worker.submit(self._write, artifact, raw, file_name)
+        return True
+
+    def close(self) -> None:
+        """Waits for every queued artifact to be written."""
+        self._worker.shutdown(wait=True)
+
+    @staticmethod
+    def _grab(driver, artifact: str):
+        match artifact:
+            case "screenshot":
+                return driver.get_screenshot_as_base64()
+            case "page_source":
+                return driver.page_source
+            case "console":
+                # Only Chromium drivers expose the browser log.
+                return driver.get_log("browser") if hasattr(driver, "get_log") else None
+
+    def _attachment_type(self, artifact: str) -> AttachmentType:
+        match artifact:
+            case "screenshot":
+                return AttachmentType.JPG if self.image_format is ScreenshotFormat.JPEG else AttachmentType.PNG
+            case "page_source":
+                return AttachmentType.HTML
+            case "console":
+                return AttachmentType.JSON
+
+    def _write(self, artifact: str, raw, file_name: str) -> None:
+        try:
+            plugin_manager.hook.report_attached_data(body=self._encode(artifact, raw), file_name=file_name)
+        except Exception as e:
+            logger.error("Writing failure artifact {} ({}) failed: {}", file_name, artifact, e)
+
+    def _encode(self, artifact: str, raw) -> bytes:
+        match artifact:
+            case "screenshot":
+                return self._encode_screenshot(base64.b64decode(raw))
+            case "page_source":
+                return raw.encode("utf-8")
+            case "console":
+                return json.dumps(raw, indent=2).encode("utf-8")
+
+    def _encode_screenshot(self, png: bytes) -> bytes:
+        if self.image_format is ScreenshotFormat.PNG and self.scale >= 1:
+            return png
+        from PIL import Image
+
+        image = Image.open(io.BytesIO(png))
+        if self.scale < 1:
+            size = (max(1, round(image.width * self.scale)), max(1, round(image.height * self.scale)))
+            image = image.resize(size, Image.LANCZOS)
+        buffer = io.BytesIO()
+        if self.image_format is ScreenshotFormat.JPEG:
+            image.convert("RGB").save(buffer, "JPEG", quality=self.jpeg_quality, optimize=True)
+        else:
+            image.save(buffer, "PNG", optimize=True)
+        return buffer.getvalue()
@@ -0,0 +1,9 @@
+"""Percentiles shared by the step timing report and the benchmark suite, so both rank samples alike."""
+
+import math
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Nearest-rank percentile (`fraction` in 0-1) of a non-empty sample list."""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class ScreenshotFormat(Enum):
+    PNG = "png"
+    JPEG = "jpeg"
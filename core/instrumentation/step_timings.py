@@ -0,0 +1,212 @@
+import csv
+import functools
+import inspect
+import json
+import statistics
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+
+from core.config.browser_config import browser_config
+from core.instrumentation.percentiles import percentile
+
+_NAVIGATION_COMMANDS = ("get", "back", "forward", "refresh")
+
+
+@dataclass(frozen=True)
+class StepTiming:
+    """Wall time of one Action, page-object method, navigation or browser start-up."""
+
+    test: str
+    step: str
+    locator: str
+    category: str
+    total: float
+    wait: float
+    navigation: float
+    command: float
+
+
+class _Frame:
+    __slots__ = ("step", "locator", "category", "started", "wait", "navigation")
+
+    def __init__(self, step: str, locator: str, category: str):
+        self.step = step
+        self.locator = locator
+        self.category = category
+        self.started = time.perf_counter()
+        self.wait = 0.0
+        self.navigation = 0.0
+
+
+class StepTimings:
+    """
+        Collects per-step timings split into wait, navigation and command (driver round-trip) time.
+
+        Steps nest: a page-object method contains the Actions it calls, and wait/navigation time
+        is credited to every open step of the current thread. Recording is a couple of
+        `perf_counter` calls and a list append per step, so it stays on in CI by default.
+        """
+
+    def __init__(self):
+        self._enabled: bool | None = None
+        self.current_test = ""
+        self.records: list[StepTiming] = []
+        # The same records per test nodeid, so the per-test Allure attachment does not scan them all.
+        self._by_test: dict[str, list[StepTiming]] = {}
+        self._local = threading.local()
+
+    @property
+    def enabled(self) -> bool:
+        # Read on first use, so importing this module does not load the settings.
+        if self._enabled is None:
+            self._enabled = browser_config.timing_enabled
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+
+    @property
+    def _stack(self) -> list[_Frame]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def step(self, step: str, locator=None, category: str = "action"):
+        if not self.enabled:
+            yield
+            return
+        frame = _Frame(step, "" if locator is None else str(locator), category)
+        stack = self._stack
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            stack.pop()
+            total = time.perf_counter() - frame.started
+            if category == "navigation":
+                frame.navigation = total
+                for outer in stack:
+                    outer.navigation += total
+            record = StepTiming(
+                test=self.current_test,
+                step=frame.step,
+                locator=frame.locator,
+                category=category,
+                total=total,
+                wait=frame.wait,
+                navigation=frame.navigation,
+                command=max(0.0, total - frame.wait - frame.navigation),
+            )
+            self.records.append(record)
+            self._by_test.setdefault(record.test, []).append(record)
+
+    def add_wait(self, seconds: float) -> None:
+        """Credits `seconds` of explicit-wait time to every open step of this thread."""
+        if self.enabled:
+            for frame in self._stack:
+                frame.wait += seconds
+
+    def instrument_navigation(self, driver) -> None:
+        """Times `get`, `back`, `forward` and `refresh` on this driver instance as navigation steps."""
+        if not self.enabled:
+            return
+        for name in _NAVIGATION_COMMANDS:
+            command = getattr(driver, name)
+
+            @functools.wraps(command)
+            def timed_command(*args, _command=command, _name=name, **kwargs):
+                with self.step(f"WebDriver.{_name}", args[0] if args else None, category="navigation"):
+                    return _command(*args, **kwargs)
+
+            setattr(driver, name, timed_command)
+
+    def for_test(self, test: str) -> list[StepTiming]:
+        """Records of one test (by nodeid), in the order they finished."""
+        return list(self._by_test.get(test, ()))
+
+    def write(self, directory: Path, suffix: str) -> Path:
+        """Writes the raw records as `timings-<suffix>.json` and `.csv`; returns the JSON path."""
+        directory.mkdir(parents=True, exist_ok=True)
+        json_path = directory / f"timings-{suffix}.json"
+        json_path.write_text(json.dumps([asdict(record) for record in self.records]), encoding="utf-8")
+        with open(directory / f"timings-{suffix}.csv", "w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow([field.name for field in fields(StepTiming)])
+            writer.writerows(
+                [getattr(record, field.name) for field in fields(StepTiming)] for record in self.records
+            )
+        return json_path
+
+
+def load_records(directory: Path) -> list[StepTiming]:
+    """Reads every `timings-*.json` in `directory` (one per pytest-xdist worker)."""
+    records = []
+    for path in sorted(directory.glob("timings-*.json")):
+        records.extend(StepTiming(**row) for row in json.loads(path.read_text(encoding="utf-8")))
+    return records
+
+
+def summarize(records: list[StepTiming]) -> list[dict]:
+    """Aggregates records per (step, locator), slowest total time first."""
+    groups: dict[tuple[str, str], list[StepTiming]] = {}
+    for record in records:
+        groups.setdefault((record.step, record.locator), []).append(record)
+    summary = []
+    for (step, locator), group in groups.items():
+        totals = sorted(record.total for record in group)
+        summary.append({
+            "step": step,
+            "locator": locator,
+            "count": len(group),
+            "total": sum(totals),
+            "mean": statistics.fmean(totals),
+            "p95": percentile(totals, 0.95),
+            "max": totals[-1],
+            "wait": sum(record.wait for record in group),
+            "navigation": sum(record.navigation for record in group),
+            "command": sum(record.command for record in group),
+        })
+    return sorted(summary, key=lambda row: row["total"], reverse=True)
+
+
+step_timings = StepTimings()
+
+
+def timed(func):
+    """Records an `Actions` method as a step keyed by its first argument (the locator or locators)."""
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not step_timings.enabled:
+            return func(self, *args, **kwargs)
+        target = args[0] if args else None
+        locator = list(target) if isinstance(target, dict) else target
+        with step_timings.step(f"{type(self).__name__}.{func.__name__}", locator):
+            return func(self, *args, **kwargs)
+
+    return wrapper
+
+
+def timed_page(cls):
+    """Class decorator: records every public method of a page object as a `page` step."""
+    for name, member in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(member):
+            continue
+
+        def wrap(method, name=name):
+            @functools.wraps(method)
+            def wrapper(self, *args, **kwargs):
+                # Named after the runtime class, so inherited methods report e.g. `LoginPage.open`.
+                with step_timings.step(f"{type(self).__name__}.{name}", category="page"):
+                    return method(self, *args, **kwargs)
+
+            return wrapper
+
+        setattr(cls, name, wrap(member))
+    return cls
@@ -0,0 +1,131 @@
+import json
+import os
+import statistics
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from core.config.browser_config import browser_config
+
+# Duration assumed for tests without history when nothing else is known yet.
+_DEFAULT_DURATION = 10.0
+
+
+def scope_of(nodeid: str) -> str:
+    """The test's class, or its module for plain functions: the unit pytest-xdist's `loadscope` ships."""
+    return nodeid.rsplit("::", 1)[0]
+
+
+@dataclass
+class HistoryEntry:
+    """The last few durations (seconds) and outcomes (`passed` / `failed` / `skipped`) of one test."""
+
+    durations: list[float] = field(default_factory=list)
+    outcomes: list[str] = field(default_factory=list)
+
+    @property
+    def mean_duration(self) -> float:
+        return statistics.fmean(self.durations) if self.durations else 0.0
+
+    @property
+    def failed_last_run(self) -> bool:
+        return bool(self.outcomes) and self.outcomes[-1] == "failed"
+
+    @property
+    def failure_rate(self) -> float:
+        return self.outcomes.count("failed") / len(self.outcomes) if self.outcomes else 0.0
+
+
+class TestHistory:
+    """
+        Per-test durations and outcomes of previous runs, kept in a small JSON file.
+
+        Only the last `keep` runs of every test are stored. `order()` and `select()` use them to
+        run recently failed scopes first, schedule long scopes early and fit a run into a time budget.
+        """
+
+    __test__ = False  # Not a test class, despite the name.
+
+    def __init__(self, path: str | Path | None = None, keep: int | None = None):
+        self.path = Path(path or browser_config.history_path)
+        self.keep = keep or browser_config.history_runs
+        self.entries: dict[str, HistoryEntry] = {}
+        self._typical_duration: float | None = None
+
+    def load(self) -> "TestHistory":
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        self.entries = {nodeid: HistoryEntry(**entry) for nodeid, entry in data.get("tests", {}).items()}
+        self._typical_duration = None
+        return self
+
+    def save(self) -> None:
+        """Writes the history atomically, so a concurrent reader never sees a half-written file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"tests": {nodeid: vars(entry) for nodeid, entry in sorted(self.entries.items())}}
+        temporary = self.path.with_suffix(self.path.suffix + ".tmp")
+        temporary.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        os.replace(temporary, self.path)
+
+    def record(self, nodeid: str, duration: float, outcome: str) -> None:
+        entry = self.entries.setdefault(nodeid, HistoryEntry())
+        entry.durations = (entry.durations + [round(duration, 3)])[-self.keep:]
+        entry.outcomes = (entry.outcomes + [outcome])[-self.keep:]
+        self._typical_duration = None
+
+    def expected_duration(self, nodeid: str) -> float:
+        """Mean past duration; tests without history get the median of all known tests."""
+        entry = self.entries.get(nodeid)
+        if entry and entry.durations:
+            return entry.mean_duration
+        if self._typical_duration is None:
+            known = [e.mean_duration for e in self.entries.values() if e.durations]
+            self._typical_duration = statistics.median(known) if known else _DEFAULT_DURATION
+        return self._typical_duration
+
+    def value(self, nodeid: str, priority: bool = False) -> float:
+        """
+                How much running this test is worth: recent and frequent failures, new tests and
+                `priority` tests (e.g. marked `smoke`) score higher.
+                """
+        entry = self.entries.get(nodeid)
+        score = 1.0 + (2.0 if priority else 0.0)
+        if entry is None:
+            return score + 2.0
+        return score + (5.0 if entry.failed_last_run else 0.0) + 3.0 * entry.failure_rate
+
+    def order(self, nodeids: list[str]) -> list[str]:
+        """
+                Orders whole scopes (see `scope_of`): scopes with a test that failed last run first,
+                then the longest summed expected duration first (stable for ties).
+
+                Tests of one scope stay together and in collection order, so class- and
+                module-scoped fixtures are still set up once and xdist `loadscope` balances workers
+                on the same units this order is based on.
+                """
+        scopes: dict[str, list[str]] = {}
+        for nodeid in nodeids:
+            scopes.setdefault(scope_of(nodeid), []).append(nodeid)
+        ranked = sorted(scopes.values(), key=lambda scope: (
+            not any(nodeid in self.entries and self.entries[nodeid].failed_last_run for nodeid in scope),
+            -sum(self.expected_duration(nodeid) for nodeid in scope),
+        ))
+        return [nodeid for scope in ranked for nodeid in scope]
+
+    def select(self, nodeids: list[str], budget: float, priority: set[str] = frozenset()) -> list[str]:
+        """
+                Picks the most valuable tests whose expected durations fit into `budget` seconds.
+
+                Tests are taken greedily by value per expected second; the result keeps the order
+                of `nodeids`.
+                """
+        ranked = sorted(nodeids, key=lambda nodeid: self.value(nodeid, nodeid in priority)
+                        / max(self.expected_duration(nodeid), 0.001), reverse=True)
+        chosen, spent = set(), 0.0
+        for nodeid in ranked:
+            duration = self.expected_duration(nodeid)
+            if spent + duration <= budget:
+                chosen.add(nodeid)
+                spent += duration
+        return [nodeid for nodeid in nodeids if nodeid in chosen]
@@ -0,0 +1,47 @@
+"""
+Failure artifacts for Allure: when a test call fails, grabs a screenshot, the page source and the
+browser console log from the test's `browser` and lets a background worker encode and write them
+into the Allure results directory (see `core/instrumentation/failure_artifacts.py`).
+
+Registered from `tests/conftest.py`. Nothing is captured unless pytest runs with `--alluredir`.
+The capture machinery (and its worker thread) is created on the first failure, so a passing run
+never imports or starts it.
+"""
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from core.instrumentation.step_timings import step_timings
+
+if TYPE_CHECKING:
+    from core.instrumentation.failure_artifacts import FailureArtifacts
+
+_ARTIFACTS = pytest.StashKey["FailureArtifacts"]()
+
+
+def _failure_artifacts(config: pytest.Config) -> "FailureArtifacts":
+    artifacts = config.stash.get(_ARTIFACTS, None)
+    if artifacts is None:
+        from core.instrumentation.failure_artifacts import FailureArtifacts
+
+        artifacts = config.stash[_ARTIFACTS] = FailureArtifacts()
+    return artifacts
+
+
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item):
+    outcome = yield
+    result = outcome.get_result()
+    if result.when != "call" or not result.failed:
+        return
+    driver = item.funcargs.get("browser")
+    if driver:
+        with step_timings.step("FailureArtifacts.capture", category="artifacts"):
+            _failure_artifacts(item.config).capture(driver, item.nodeid)
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    artifacts = session.config.stash.get(_ARTIFACTS, None)
+    if artifacts:
+        artifacts.close()
@@ -0,0 +1,84 @@
+"""
+Run history: stores every test's duration and outcome (`history_path`) and uses previous runs to
+order the next one on request (`--history-order smart`: classes / modules with a recent failure
+first, then the longest first, each kept together) and, with `--time-budget MINUTES`, to run only
+the most valuable tests that fit.
+
+Registered from `tests/conftest.py`. A relative `history_path` is resolved against the rootdir,
+not the working directory. Under pytest-xdist only the controller writes the history; workers
+read the same file, so every worker collects the tests in the same order.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from core.config.browser_config import browser_config
+from core.instrumentation.test_history import TestHistory
+
+_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+_HISTORY = pytest.StashKey[TestHistory]()
+
+# nodeid -> (setup + call + teardown seconds, outcome) of this run; controller / serial run only.
+_runs: dict[str, tuple[float, str]] = {}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("history", "run history (core/plugins/history.py)")
+    group.addoption("--history-order", choices=("smart", "off"), default="off",
+                    help="smart: classes / modules with recent failures first, then longest first; "
+                         "off: collection order (default).")
+    group.addoption("--time-budget", type=float, metavar="MINUTES",
+                    help="Run only the most valuable tests whose past durations fit into MINUTES.")
+
+
+def _history_path(config: pytest.Config) -> Path:
+    return Path(config.rootpath) / browser_config.history_path
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.stash[_HISTORY] = TestHistory(_history_path(config)).load()
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    history = config.stash[_HISTORY]
+    budget = config.getoption("time_budget")
+    if budget is not None:
+        priority = {item.nodeid for item in items if item.get_closest_marker("smoke")}
+        selected = set(history.select([item.nodeid for item in items], budget * 60, priority))
+        deselected = [item for item in items if item.nodeid not in selected]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = [item for item in items if item.nodeid in selected]
+        reporter = config.pluginmanager.get_plugin("terminalreporter")
+        if reporter and not _WORKER:
+            expected = sum(history.expected_duration(item.nodeid) for item in items)
+            reporter.write_line(f"time budget {budget:g} min: {len(items)} test(s) selected, "
+                                f"~{expected / 60:.1f} min expected from history")
+    if config.getoption("history_order") == "smart":
+        position = {nodeid: index for index, nodeid in enumerate(history.order([item.nodeid for item in items]))}
+        items.sort(key=lambda item: position[item.nodeid])
+
+
+def pytest_runtest_logreport(report: pytest.TestReport) -> None:
+    if _WORKER:
+        return
+    duration, outcome = _runs.get(report.nodeid, (0.0, "passed"))
+    if report.failed:
+        outcome = "failed"
+    elif report.skipped and outcome == "passed":
+        outcome = "skipped"
+    _runs[report.nodeid] = (duration + report.duration, outcome)
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    if _WORKER or not _runs:
+        return
+    history = session.config.stash[_HISTORY]
+    for nodeid, (duration, outcome) in _runs.items():
+        # A skip says nothing about how long the test takes.
+        if outcome != "skipped":
+            history.record(nodeid, duration, outcome)
+    history.save()
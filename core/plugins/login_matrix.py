@@ -0,0 +1,78 @@
+"""
+Data-driven login matrix: parametrizes every test that takes a `login_case` argument with the rows of
+the login table (`--login-matrix PATH`, default `login_matrix_path`) and reports each row's login
+latency against its budget, so slow logins show up as timing regressions and not only as pass / fail.
+
+Tests report a row with `record_property("login_seconds", ...)` and `("login_budget", ...)`. The
+controller collects them (pytest-xdist ships user properties with every report), prints the table in
+the terminal summary and writes it to `login_matrix_report`.
+
+Registered from `tests/conftest.py`.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from core.config.browser_config import browser_config
+from core.data.login_matrix import load_login_matrix
+
+_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+
+# nodeid -> row of the latency report; controller / serial run only.
+_rows: dict[str, dict] = {}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("login_matrix", "login matrix (core/plugins/login_matrix.py)")
+    group.addoption("--login-matrix", metavar="PATH", help="Login table (CSV / YAML); default login_matrix_path.")
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "login_case" in metafunc.fixturenames:
+        try:
+            cases = load_login_matrix(metafunc.config.getoption("login_matrix"))
+        except (ValueError, ImportError) as e:
+            # A broken table is a usage error: report file and row, not a collection traceback.
+            raise pytest.UsageError(str(e)) from e
+        metafunc.parametrize("login_case", cases, ids=[case.id for case in cases])
+
+
+def pytest_runtest_logreport(report: pytest.TestReport) -> None:
+    if _WORKER or report.when != "call":
+        return
+    properties = dict(report.user_properties)
+    if "login_seconds" not in properties:
+        return
+    seconds, budget = properties["login_seconds"], properties["login_budget"]
+    _rows[report.nodeid] = {
+        "case": properties.get("login_case", report.nodeid),
+        "seconds": seconds,
+        "budget": budget,
+        "over_budget": seconds > budget,
+        "outcome": report.outcome,
+    }
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    if _WORKER or not _rows:
+        return
+    terminalreporter.section("login matrix")
+    terminalreporter.write_line(f"{'seconds':>8} {'budget':>7}  {'result':<8} case")
+    for row in sorted(_rows.values(), key=lambda r: r["seconds"], reverse=True):
+        flag = "SLOW" if row["over_budget"] else row["outcome"]
+        terminalreporter.write_line(f"{row['seconds']:>8.3f} {row['budget']:>7.2f}  {flag:<8} {row['case']}")
+    slow = [row["case"] for row in _rows.values() if row["over_budget"]]
+    if slow:
+        terminalreporter.write_line(f"timing regression: {len(slow)} login(s) over budget: {', '.join(slow)}",
+                                    yellow=True, bold=True)
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    if _WORKER or not _rows:
+        return
+    path = Path(session.config.rootpath) / browser_config.login_matrix_report
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(list(_rows.values()), indent=2), encoding="utf-8")
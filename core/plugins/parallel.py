@@ -0,0 +1,44 @@
+"""
+pytest-xdist integration: size `-n auto` by browser capacity, fix that capacity for the whole run and
+keep test classes on one worker.
+
+Registered from `tests/conftest.py`; every hook is a no-op when pytest-xdist is not installed.
+"""
+
+import os
+
+import pytest
+from loguru import logger
+
+from core.browser.browser_slots import browser_capacity, host_browser_capacity
+
+_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config: pytest.Config) -> int:
+    """`-n auto` starts one worker per browser the host (or its Grid session quota) can hold, not one per CPU."""
+    capacity = browser_capacity()
+    logger.info("pytest-xdist auto workers capped to browser capacity: {}", capacity)
+    return capacity
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Pins the host browser capacity before any worker starts, then switches xdist's default `load`
+    distribution to `loadscope` unless `--dist` was given.
+
+    Workers inherit the capacity computed here instead of measuring free memory again once other
+    workers' browsers are running. With `loadscope` every test class runs on a single worker, so
+    the class reuses that worker's pooled browser process and the worker's session cache. No page
+    state carries over between tests: the pool clears cookies and storage and goes to
+    `about:blank` on every release, and a logged-in session is restored from `SessionCache`.
+    """
+    if not _WORKER:
+        host_browser_capacity()
+    if getattr(config.option, "dist", "no") != "load":
+        return
+    args = config.invocation_params.args
+    if any(arg == "--dist" or arg.startswith("--dist=") or arg == "-d" for arg in args):
+        return
+    config.option.dist = "loadscope"
@@ -0,0 +1,79 @@
+"""
+Per-step timing report: tags records with the running test, writes JSON/CSV at session end,
+attaches each test's steps to Allure, and prints the slowest steps in the terminal summary.
+
+Registered from `tests/conftest.py`. Under pytest-xdist every worker writes its own
+`timings-<worker>.json`; the controller merges them for the summary.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import allure
+import pytest
+
+from core.config.browser_config import browser_config
+from core.instrumentation.step_timings import load_records, step_timings, summarize
+
+_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+
+
+def _report_dir(config: pytest.Config) -> Path:
+    return Path(config.rootpath) / browser_config.timing_report_dir
+
+
+def pytest_sessionstart(session: pytest.Session) -> None:
+    if _WORKER or not step_timings.enabled:
+        return
+    # Only the controller (or a serial run) clears results of the previous run.
+    for stale in _report_dir(session.config).glob("timings-*.*"):
+        stale.unlink()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item: pytest.Item, nextitem):
+    step_timings.current_test = item.nodeid
+    yield
+    step_timings.current_test = ""
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    yield
+    if step_timings.enabled and browser_config.timing_allure:
+        steps = [
+            {"step": r.step, "locator": r.locator, "total": round(r.total, 4), "wait": round(r.wait, 4),
+             "navigation": round(r.navigation, 4), "command": round(r.command, 4)}
+            for r in step_timings.for_test(item.nodeid)
+        ]
+        if steps:
+            allure.attach(json.dumps(steps, indent=2), name="step_timings",
+                          attachment_type=allure.attachment_type.JSON)
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    if step_timings.enabled and step_timings.records:
+        step_timings.write(_report_dir(session.config), _WORKER or "main")
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    if _WORKER or not step_timings.enabled:
+        return
+    records = load_records(_report_dir(config))
+    if not records:
+        return
+    top_n = browser_config.timing_top_n
+    terminalreporter.section(f"slowest {top_n} steps (by total time)")
+    terminalreporter.write_line(f"{'total':>8} {'wait':>8} {'nav':>8} {'cmd':>8} {'count':>5}  step / locator")
+    for row in summarize(records)[:top_n]:
+        target = f"{row['step']} {row['locator']}".strip()
+        terminalreporter.write_line(
+            f"{row['total']:8.2f} {row['wait']:8.2f} {row['navigation']:8.2f} {row['command']:8.2f} "
+            f"{row['count']:5d}  {target}"
+        )
+    terminalreporter.section(f"slowest {top_n} single steps")
+    for record in sorted(records, key=lambda r: r.total, reverse=True)[:top_n]:
+        target = f"{record.step} {record.locator}".strip()
+        terminalreporter.write_line(f"{record.total:8.2f}s  {target}  ({record.test or 'session setup'})")
+    terminalreporter.write_line(f"Full report: {_report_dir(config)}")
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from urllib.parse import urljoin, urlparse
+
+from core.actions.actions import shared_actions
+from core.config.browser_config import browser_config
+from core.instrumentation.step_timings import timed_page
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+
+@timed_page
+class BasePage:
+    """
+    Navigation shared by page objects.
+
+    Subclasses declare their elements with `Element` and set `PATH` (relative to the site root)
+    and `READY_LOCATOR`, the element that proves the page is usable. `open()` returns as soon as
+    that element is visible, so with the `eager` / `none` page load strategy a test no longer
+    waits for every image and script. All page objects on one driver share its `Actions` and
+    element cache (see `shared_actions`), so creating a page object per step is cheap.
+    """
+
+    PATH = "/"
+    READY_LOCATOR: tuple[str, str]
+
+    def __init__(self, driver: WebDriver, default_timeout: int = 10):
+        self.driver = driver
+        self.actions = shared_actions(driver)
+        self.default_timeout = default_timeout
+
+    def open(self, base_url: str | None = None):
+        """
+        Navigates to this page and waits until `READY_LOCATOR` is visible.
+
+        Args:
+            base_url (str | None): Site root; defaults to the origin of the current URL or, when that
+                is not an http(s) page (e.g. `about:blank` on a fresh browser), the configured `URL`.
+
+        Returns:
+            The page object itself, for chaining.
+
+        Raises:
+            ValueError: If no `base_url` is given and neither the current URL nor the settings
+                provide an http(s) site root.
+            TimeoutException: If the ready element is not visible within `default_timeout`.
+        """
+        if base_url is None:
+            base_url = self._current_origin() or browser_config.url.strip()
+            if not base_url:
+                raise ValueError(f"{type(self).__name__}.open(): the browser is at {self.driver.current_url!r}, "
+                                 "not an http(s) page, and URL is not set; pass base_url")
+        self.driver.get(urljoin(base_url.rstrip("/") + "/", self.PATH.lstrip("/")))
+        return self.wait_until_ready()
+
+    def _current_origin(self) -> str | None:
+        current = urlparse(self.driver.current_url)
+        if current.scheme not in ("http", "https") or not current.netloc:
+            return None
+        return f"{current.scheme}://{current.netloc}"
+
+    def wait_until_ready(self):
+        """Waits until `READY_LOCATOR` is visible and returns the page object."""
+        self.actions.waits.element(self.READY_LOCATOR, self.default_timeout)
+        return self
+
+    def fill(self, native: bool = False, **fields: str) -> None:
+        """
+        Fills several `Element` fields, named by attribute, in one driver round-trip.
+
+            page.fill(username="standard_user", password="secret_sauce")
+
+        Args:
+            native (bool): Type into each field with WebDriver key events instead (see `Actions.fill_form`).
+            **fields (str): Element attribute name -> text, in fill order.
+
+        Raises:
+            TimeoutException: If any field is not visible and enabled within `default_timeout`.
+        """
+        owner = type(self)
+        self.actions.fill_form({getattr(owner, name): text for name, text in fields.items()},
+                               self.default_timeout, native=native)
+
+    def texts(self, *names: str) -> dict[str, str]:
+        """Reads the text of several `Element`s, named by attribute, in one `execute_script` call."""
+        owner = type(self)
+        return dict(zip(names, self.actions.get_texts([getattr(owner, name) for name in names], self.default_timeout)))
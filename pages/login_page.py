@@ -1,31 +1,54 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webdriver import WebDriver
 
-from core.actions.actions import Actions
+from core.actions import scripts
+from core.actions.element import Element
+from core.data.login_outcome_type import LoginOutcome
+from core.instrumentation.step_timings import timed_page
+from pages.base_page import BasePage
+from pages.inventory_page import InventoryPage
 
 
-class LoginPage:
+@timed_page
+class LoginPage(BasePage):
     """Sauce Demo (Swag Labs) login — IDs and data-test hooks are stable across locales."""
 
-    USERNAME_INPUT = (By.ID, "user-name")
-    PASSWORD_INPUT = (By.ID, "password")
-    LOGIN_BUTTON = (By.ID, "login-button")
+    username = Element(By.ID, "user-name")
+    password = Element(By.ID, "password")
+    login_button = Element(By.ID, "login-button")
     # Prefer test hook over XPath with long English copy (survives i18n / copy tweaks).
-    ERROR_MESSAGE = (By.CSS_SELECTOR, '[data-test="error"]')
+    # Not cached: the banner is re-created on every failed attempt.
+    error_message = Element(By.CSS_SELECTOR, '[data-test="error"]', cache=False)
 
-    def __init__(self, driver: WebDriver, default_timeout=10):
-        self.driver = driver
-        self.actions = Actions(driver)
-        self.default_timeout = default_timeout
+    PATH = "/"
+    READY_LOCATOR = username
 
-    def set_username(self, user: str) -> None:
-        self.actions.send_text(self.USERNAME_INPUT, user, self.default_timeout)
+    def fill_credentials(self, user: str, password: str, native: bool = False) -> None:
+        """Enters username and password in one driver round-trip (`native=True` types them instead)."""
+        self.fill(username=user, password=password, native=native)
 
-    def set_password(self, password: str) -> None:
-        self.actions.send_text(self.PASSWORD_INPUT, password, self.default_timeout)
-
-    def click_login_button(self) -> None:
-        self.actions.click(self.LOGIN_BUTTON, self.default_timeout)
+    def login(self, user: str, password: str, native: bool = False) -> None:
+        self.fill_credentials(user, password, native=native)
+        self.login_button.click()
 
     def is_error_message_displayed(self) -> bool:
-        return self.actions.is_visible(self.ERROR_MESSAGE, self.default_timeout)
+        return self.error_message.wait_visible()
+
+    def wait_for_outcome(self, timeout: float | None = None) -> LoginOutcome:
+        """
+        Waits until a submitted login lands on the inventory or shows the error banner.
+
+        Args:
+            timeout (float | None): Maximum wait in seconds; defaults to `default_timeout`.
+
+        Raises:
+            TimeoutException: If neither appears within the timeout.
+        """
+        locators = [list(InventoryPage.title), list(self.error_message)]
+
+        def outcome(driver) -> LoginOutcome | None:
+            # One script per poll checks both pages.
+            inventory, error = driver.execute_script(scripts.ARE_VISIBLE, locators)
+            return LoginOutcome.INVENTORY if inventory else LoginOutcome.ERROR if error else None
+
+        return self.actions.waits.until(outcome, self.default_timeout if timeout is None else timeout,
+                                        label="login outcome")
@@ -1,48 +1,91 @@
-import os
-
-import allure
 import pytest
-from dotenv import load_dotenv
 
 from core.browser.browser import BrowserSettings
-from tests.sauce_demo_env import SauceDemoEnv
+from core.browser.browser_pool import BrowserPool
+from core.browser.resource_policy import NetworkStubs
+from core.browser.session_cache import SessionCache
+from core.config.browser_config import BrowserConfig, get_browser_config
+from core.config.sauce_demo_env import SauceDemoEnv
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
 
-load_dotenv()
+pytest_plugins = [
+    "core.plugins.parallel",
+    "core.plugins.timing",
+    "core.plugins.artifacts",
+    "core.plugins.history",
+    "core.plugins.login_matrix",
+]
 
 
-@pytest.fixture
-def sauce_demo_env() -> SauceDemoEnv:
+@pytest.fixture(scope="session")
+def settings() -> BrowserConfig:
+    """The process-wide settings (environment + .env), loaded once per worker."""
+    return get_browser_config()
+
+
+@pytest.fixture(scope="session")
+def sauce_demo_env(settings: BrowserConfig) -> SauceDemoEnv:
     """Fail fast with a clear message when .env is missing or incomplete."""
-    base_url = os.getenv("URL", "").strip()
-    username = os.getenv("USER", "").strip()
-    password = os.getenv("PASS", "").strip()
-    missing = [name for name, val in (("URL", base_url), ("USER", username), ("PASS", password)) if not val]
+    missing = settings.missing_sauce_demo
     if missing:
         pytest.fail(
             f"Missing required environment variable(s): {', '.join(missing)}. "
             "Copy .env.example to .env and set URL, USER, and PASS."
         )
-    return SauceDemoEnv(base_url=base_url, username=username, password=password)
+    return settings.sauce_demo
+
+
+@pytest.fixture(scope="session")
+def browser_pool():
+    """Warm drivers shared by the tests of this worker (one pool per xdist worker process)."""
+    pool = BrowserPool()
+    yield pool
+    pool.close()
 
 
 @pytest.fixture
-def browser():
-    browser_settings = BrowserSettings()
-    driver = browser_settings.get_driver()
+def browser(request, browser_pool: BrowserPool):
+    """Leases a pooled driver; tests marked `fresh_browser` get a dedicated one, in the pool's browser slot."""
+    if request.node.get_closest_marker("fresh_browser"):
+        browser_pool.displace()
+        browser_settings = BrowserSettings()
+        driver = browser_settings.get_driver()
+        yield driver
+        browser_settings.quit_driver()
+        return
+    driver = browser_pool.acquire()
     yield driver
-    driver.quit()
-
-
-@pytest.hookimpl(tryfirst=True, hookwrapper=True)
-def pytest_runtest_makereport(item):
-    outcome = yield
-    result = outcome.get_result()
-
-    if result.when == "call" and result.failed:
-        browser = item.funcargs.get("browser")
-        if browser:
-            allure.attach(
-                browser.get_screenshot_as_png(),
-                name="screenshot_on_failure",
-                attachment_type=allure.attachment_type.PNG,
-            )
+    browser_pool.release(driver)
+
+
+@pytest.fixture
+def network_stubs(browser) -> NetworkStubs:
+    """Register canned responses for this test with `network_stubs.add(url_glob, body)`; requires network_stubs=true."""
+    stubs = NetworkStubs(browser)
+    yield stubs
+    stubs.clear()
+
+
+@pytest.fixture(scope="session")
+def session_cache() -> SessionCache:
+    return SessionCache()
+
+
+@pytest.fixture
+def logged_in_browser(browser, sauce_demo_env: SauceDemoEnv, session_cache: SessionCache):
+    """`browser` already signed in as the `.env` user and sitting on /inventory.html."""
+
+    def ui_login(driver):
+        LoginPage(driver).open(sauce_demo_env.base_url).login(sauce_demo_env.username, sauce_demo_env.password)
+
+    session_cache.authenticate(
+        browser,
+        sauce_demo_env.username,
+        sauce_demo_env.base_url.rstrip("/") + InventoryPage.PATH,
+        login=ui_login,
+        ready_locator=InventoryPage.title,
+        login_form_locator=LoginPage.username,
+    )
+    return browser
+
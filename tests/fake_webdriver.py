@@ -0,0 +1,238 @@
+"""
+Minimal in-process stand-ins for a WebDriver session, for tests and benchmarks that must not start
+a browser.
+
+`FakeWebDriver` records the commands it receives; with `latency` every command (its elements'
+calls included) also sleeps that long, a stand-in for one WebDriver round-trip, and
+`command_seconds` adds up the time spent sleeping. `SauceDemoWebDriver` serves the Sauce Demo
+login and inventory pages on top of it:
+
+    driver = SauceDemoWebDriver(latency=0.002)
+    LoginPage(driver).open(driver.base_url).login("standard_user", PASSWORD)
+"""
+
+import base64
+import time
+from urllib.parse import urlparse
+
+from selenium.common import NoSuchElementException, StaleElementReferenceException, WebDriverException
+
+from core.actions import scripts
+from core.actions.element_cache import track_navigations
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+
+USERS = ("standard_user", "problem_user", "performance_glitch_user", "error_user", "visual_user")
+PASSWORD = "secret_sauce"
+
+
+class FakeElement:
+    """
+    Element stand-in; set `stale` to make every call raise StaleElementReferenceException.
+    With a `driver`, its calls are recorded (and delayed) as that driver's commands.
+    """
+
+    def __init__(self, text: str = "", driver: "FakeWebDriver | None" = None, displayed: bool = True):
+        self.text_value = text
+        self.driver = driver
+        self.displayed = displayed
+        self.stale = False
+        self.clicks = 0
+        self.value = ""
+
+    def _check(self, name: str) -> None:
+        if self.driver is not None:
+            self.driver._record(name)
+        if self.stale:
+            raise StaleElementReferenceException("element is not attached to the page document")
+
+    def is_displayed(self) -> bool:
+        self._check("is_displayed")
+        return self.displayed
+
+    def is_enabled(self) -> bool:
+        self._check("is_enabled")
+        return True
+
+    def click(self) -> None:
+        self._check("click")
+        self.clicks += 1
+        if self.driver is not None:
+            self.driver._clicked(self)
+
+    def clear(self) -> None:
+        self._check("clear")
+        self.value = ""
+
+    def send_keys(self, text: str) -> None:
+        self._check("send_keys")
+        self.value += text
+
+    @property
+    def text(self) -> str:
+        self._check("text")
+        return self.text_value
+
+
+class _SwitchTo:
+    def __init__(self, driver: "FakeWebDriver"):
+        self._driver = driver
+
+    def window(self, handle: str) -> None:
+        self._driver.current_window_handle = handle
+
+
+class FakeWebDriver:
+    """Records the commands it receives; set `broken` to make every command fail."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.command_seconds = 0.0
+        self.window_handles = ["main"]
+        self.current_window_handle = "main"
+        self.current_url = "about:blank"
+        self.page_source = "<html><body></body></html>"
+        self.console_logs: list[dict] = []
+        self.screenshot = b"\x89PNG\r\n\x1a\n"
+        self.commands: list[str] = []
+        self.elements: dict[tuple[str, str], FakeElement] = {}
+        self.broken = False
+        self.quit_called = False
+        self.switch_to = _SwitchTo(self)
+
+    def _record(self, name: str) -> None:
+        if self.broken:
+            raise WebDriverException(f"{name}: session is gone")
+        self.commands.append(name)
+        if self.latency:
+            started = time.perf_counter()
+            time.sleep(self.latency)
+            self.command_seconds += time.perf_counter() - started
+
+    def _clicked(self, element: FakeElement) -> None:
+        """Hook for subclasses that react to clicks on their elements."""
+
+    def execute_script(self, script: str, *args):
+        self._record("execute_script")
+        return 1 if script.strip() == "return 1;" else None
+
+    def find_element(self, by: str, value: str) -> FakeElement:
+        self._record("find_element")
+        try:
+            return self.elements[(by, value)]
+        except KeyError:
+            raise NoSuchElementException(f"no element for {(by, value)}") from None
+
+    def find_elements(self, by: str, value: str) -> list[FakeElement]:
+        self._record("find_elements")
+        return [self.elements[(by, value)]] if (by, value) in self.elements else []
+
+    def get_screenshot_as_base64(self) -> str:
+        self._record("get_screenshot_as_base64")
+        return base64.b64encode(self.screenshot).decode("ascii")
+
+    def get_log(self, log_type: str) -> list[dict]:
+        self._record("get_log")
+        return self.console_logs
+
+    def delete_all_cookies(self) -> None:
+        self._record("delete_all_cookies")
+
+    def get(self, url: str) -> None:
+        self._record("get")
+        self.current_url = url
+
+    def back(self) -> None:
+        self._record("back")
+
+    def forward(self) -> None:
+        self._record("forward")
+
+    def refresh(self) -> None:
+        self._record("refresh")
+
+    def close(self) -> None:
+        self._record("close")
+        self.window_handles.remove(self.current_window_handle)
+
+    def quit(self) -> None:
+        self.quit_called = True
+
+
+class SauceDemoWebDriver(FakeWebDriver):
+    """
+    Serves a login page and an inventory page from memory; logging in with a demo user and
+    `PASSWORD` "navigates" to the inventory, anything else shows the error banner. It answers
+    the scripts in `core.actions.scripts` the way the real pages would.
+    """
+
+    base_url = "http://sauce-demo.invalid"
+
+    def __init__(self, latency: float = 0.0):
+        super().__init__(latency)
+        track_navigations(self)
+
+    def _load(self, path: str) -> None:
+        if path == InventoryPage.PATH:
+            self.elements = {tuple(InventoryPage.title): FakeElement("Products", self)}
+        else:
+            self.elements = {
+                tuple(LoginPage.username): FakeElement("", self),
+                tuple(LoginPage.password): FakeElement("", self),
+                tuple(LoginPage.login_button): FakeElement("Login", self),
+            }
+        self.current_url = self.base_url + path
+
+    def _clicked(self, element: FakeElement) -> None:
+        if element is not self.elements.get(tuple(LoginPage.login_button)):
+            return
+        user = self.elements[tuple(LoginPage.username)].value
+        password = self.elements[tuple(LoginPage.password)].value
+        if user in USERS and password == PASSWORD:
+            self._load(InventoryPage.PATH)
+        else:
+            self.elements[tuple(LoginPage.error_message)] = FakeElement(
+                "Epic sadface: Username and password do not match any user in this service", self
+            )
+
+    def _visible(self, by: str, value: str) -> FakeElement | None:
+        element = self.elements.get((by, value))
+        return element if element is not None and element.displayed else None
+
+    def get(self, url: str) -> None:
+        self._record("get")
+        self._load(urlparse(url).path or "/")
+
+    def refresh(self) -> None:
+        self._record("refresh")
+        self._load(urlparse(self.current_url).path or "/")
+
+    def back(self) -> None:
+        self._record("back")
+        self._load(LoginPage.PATH)
+
+    def execute_script(self, script: str, *args):
+        self._record("execute_script")
+        if script is scripts.FILL_FORM:
+            pending = [i for i, (by, value, _) in enumerate(args[0]) if self._visible(by, value) is None]
+            if not pending:
+                for by, value, text in args[0]:
+                    self.elements[(by, value)].value = text
+            return pending
+        if script is scripts.GET_TEXTS:
+            elements = [self._visible(by, value) for by, value in args[0]]
+            return None if None in elements else [element.text_value for element in elements]
+        if script is scripts.ARE_VISIBLE:
+            return [self._visible(by, value) is not None for by, value in args[0]]
+        if script is scripts.ELEMENT_STATE:
+            element = self.elements.get(tuple(args))
+            if element is None:
+                return {"state": "absent", "reason": "no element matches the locator"}
+            return {"state": "visible", "reason": None} if element.displayed else \
+                {"state": "hidden", "reason": "display: none"}
+        return None
+
+    def execute_async_script(self, script: str, *args):
+        self._record("execute_async_script")
+        by, value = args[0], args[1]
+        return self._visible(by, value)
@@ -0,0 +1,87 @@
+"""AsyncBrowsers facade: concurrent sessions on a bounded pool, awaitable page objects."""
+
+import asyncio
+import threading
+import time
+
+from core.actions.async_actions import AsyncBrowsers
+from pages.login_page import LoginPage
+from tests.fake_webdriver import FakeElement, FakeWebDriver
+
+
+class _SlowSettings:
+    """Fake BrowserSettings whose start-up blocks like a real browser launch."""
+
+    starting = 0
+    peak_starting = 0
+    open_sessions = 0
+    peak_sessions = 0
+    lock = threading.Lock()
+
+    def __init__(self):
+        self.driver = None
+
+    def get_driver(self):
+        with self.lock:
+            type(self).starting += 1
+            type(self).peak_starting = max(self.peak_starting, self.starting)
+        time.sleep(0.2)
+        with self.lock:
+            type(self).starting -= 1
+            type(self).open_sessions += 1
+            type(self).peak_sessions = max(self.peak_sessions, self.open_sessions)
+        self.driver = FakeWebDriver()
+        self.driver.elements[LoginPage.username] = FakeElement()
+        return self.driver
+
+    def quit_driver(self):
+        with self.lock:
+            type(self).open_sessions -= 1
+        self.driver.quit()
+
+
+async def _open_login(browsers: AsyncBrowsers, base_url: str) -> tuple[str, bool]:
+    async with browsers.session() as session:
+        page = await session.page(LoginPage).open(base_url)
+        return session.driver.current_url, page.driver.quit_called
+
+
+class TestAsyncBrowsers:
+
+    def setup_method(self):
+        _SlowSettings.open_sessions = _SlowSettings.peak_sessions = 0
+        _SlowSettings.starting = _SlowSettings.peak_starting = 0
+
+    def test_sessions_start_concurrently_and_are_quit(self):
+        async def scenario():
+            async with AsyncBrowsers(max_workers=4, settings_factory=_SlowSettings) as browsers:
+                return await asyncio.gather(*(_open_login(browsers, f"https://u{i}.test") for i in range(4)))
+
+        results = asyncio.run(scenario())
+        assert _SlowSettings.peak_starting == 4  # all four launches overlapped
+        assert results == [(f"https://u{i}.test/", False) for i in range(4)]
+        assert _SlowSettings.open_sessions == 0
+
+    def test_open_sessions_never_exceed_the_pool_size(self):
+        async def scenario():
+            async with AsyncBrowsers(max_workers=2, settings_factory=_SlowSettings) as browsers:
+                await asyncio.gather(*(_open_login(browsers, "https://demo.test") for _ in range(5)))
+
+        asyncio.run(scenario())
+        assert _SlowSettings.peak_sessions == 2
+
+    def test_page_elements_are_proxied_off_the_event_loop(self):
+        loop_thread = threading.get_ident()
+
+        async def scenario():
+            async with AsyncBrowsers(max_workers=1, settings_factory=_SlowSettings) as browsers:
+                async with browsers.session() as session:
+                    button = session.driver.elements[LoginPage.login_button] = FakeElement("Login")
+                    button.click = lambda: clicks.append(threading.get_ident())
+                    page = session.page(LoginPage)
+                    await page.login_button.click()
+                    return await page.login_button.text
+
+        clicks = []
+        assert asyncio.run(scenario()) == "Login"
+        assert clicks and clicks[0] != loop_thread
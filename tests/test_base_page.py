@@ -0,0 +1,29 @@
+"""BasePage.open() site-root resolution, without a browser."""
+
+import pytest
+
+from core.config.browser_config import browser_config
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+from tests.fake_webdriver import SauceDemoWebDriver
+
+
+class TestBasePage:
+
+    def test_open_keeps_the_current_origin(self, monkeypatch):
+        monkeypatch.setattr(browser_config, "url", "https://configured.invalid")
+        driver = SauceDemoWebDriver()
+        driver.get(driver.base_url + InventoryPage.PATH)
+        LoginPage(driver).open()
+        assert driver.current_url == driver.base_url + "/"
+
+    def test_fresh_browser_falls_back_to_the_configured_url(self, monkeypatch):
+        monkeypatch.setattr(browser_config, "url", SauceDemoWebDriver.base_url + "/")
+        driver = SauceDemoWebDriver()
+        LoginPage(driver).open()
+        assert driver.current_url == SauceDemoWebDriver.base_url + "/"
+
+    def test_fresh_browser_without_a_configured_url_is_an_error(self, monkeypatch):
+        monkeypatch.setattr(browser_config, "url", "")
+        with pytest.raises(ValueError, match="about:blank"):
+            LoginPage(SauceDemoWebDriver()).open()
@@ -0,0 +1,60 @@
+"""Batched `get_texts` / `are_visible` / `fill_form` scripts against the fake Sauce Demo pages."""
+
+import pytest
+from selenium.common import TimeoutException
+
+from core.actions.actions import Actions
+from core.actions.wait_engine import BackoffSchedule, WaitEngine
+from core.actions.wait_strategy import WaitStrategy
+from pages.login_page import LoginPage
+from tests.fake_webdriver import PASSWORD, SauceDemoWebDriver
+
+FAST = BackoffSchedule(first=0.001, factor=2.0, cap=0.004)
+USERNAME, PASSWORD_FIELD, BUTTON, ERROR = LoginPage.username, LoginPage.password, LoginPage.login_button, \
+    LoginPage.error_message
+
+
+def _actions() -> Actions:
+    driver = SauceDemoWebDriver()
+    driver.get(driver.base_url + LoginPage.PATH)
+    return Actions(driver, WaitEngine(driver, WaitStrategy.BACKOFF, FAST))
+
+
+class TestBatchedActions:
+
+    def test_get_texts_follows_the_locator_order(self):
+        actions = _actions()
+        assert actions.get_texts([BUTTON, USERNAME], 1) == ["Login", ""]
+        assert actions.get_texts([USERNAME, BUTTON], 1) == ["", "Login"]
+        assert actions.driver.commands.count("execute_script") == 2
+
+    def test_get_texts_keeps_polling_while_an_element_is_missing(self):
+        actions = _actions()
+        with pytest.raises(TimeoutException, match="did not all become visible within 0.05s"):
+            actions.get_texts([BUTTON, ERROR], 0.05)
+        assert actions.driver.commands.count("execute_script") > 1
+
+    def test_are_visible_reports_each_locator_instead_of_raising(self):
+        actions = _actions()
+        assert actions.are_visible([USERNAME, ERROR, BUTTON], 0.05) == [True, False, True]
+        assert actions.are_visible([USERNAME, BUTTON], 1) == [True, True]
+
+    def test_fill_form_sets_every_field_in_one_script(self):
+        actions = _actions()
+        actions.fill_form({USERNAME: "standard_user", PASSWORD_FIELD: PASSWORD}, 1)
+        elements = actions.driver.elements
+        assert (elements[USERNAME].value, elements[PASSWORD_FIELD].value) == ("standard_user", PASSWORD)
+        assert actions.driver.commands[-1] == "execute_script" and "send_keys" not in actions.driver.commands
+
+    def test_fill_form_names_the_fields_that_never_showed_up(self):
+        actions = _actions()
+        with pytest.raises(TimeoutException, match=r"fields \[\('css selector', '\[data-test=\"error\"\]'\)\]"):
+            actions.fill_form({USERNAME: "standard_user", ERROR: "x"}, 0.05)
+        assert actions.driver.elements[USERNAME].value == ""
+
+    def test_native_fill_form_types_each_field(self):
+        actions = _actions()
+        actions.fill_form({USERNAME: "standard_user", PASSWORD_FIELD: PASSWORD}, 1, native=True)
+        elements = actions.driver.elements
+        assert (elements[USERNAME].value, elements[PASSWORD_FIELD].value) == ("standard_user", PASSWORD)
+        assert actions.driver.commands.count("send_keys") == 2
@@ -0,0 +1,67 @@
+"""BrowserPool lease / reset / recycle behaviour, exercised without a real browser."""
+
+from core.browser.browser_pool import BrowserPool
+from tests.fake_webdriver import FakeWebDriver
+
+
+class _FakeSettings:
+    def __init__(self):
+        self.driver = None
+
+    def get_driver(self):
+        self.driver = FakeWebDriver()
+        return self.driver
+
+    def quit_driver(self):
+        self.driver.quit()
+
+
+class TestBrowserPool:
+
+    def test_released_driver_is_reset_and_reused(self):
+        pool = BrowserPool(size=1, max_uses=5, settings_factory=_FakeSettings)
+        driver = pool.acquire()
+        driver.window_handles.append("popup")
+        driver.get("https://example.test/inventory.html")
+        pool.release(driver)
+
+        assert driver.window_handles == ["main"]
+        assert driver.current_url == "about:blank"
+        assert "delete_all_cookies" in driver.commands
+        assert pool.acquire() is driver
+
+    def test_unhealthy_driver_is_replaced(self):
+        pool = BrowserPool(size=1, max_uses=5, settings_factory=_FakeSettings)
+        driver = pool.acquire()
+        pool.release(driver)
+        driver.broken = True
+
+        replacement = pool.acquire()
+        assert replacement is not driver
+        assert driver.quit_called
+
+    def test_driver_is_recycled_after_max_uses(self):
+        pool = BrowserPool(size=1, max_uses=2, settings_factory=_FakeSettings)
+        driver = pool.acquire()
+        pool.release(driver)
+        assert pool.acquire() is driver
+        pool.release(driver)
+
+        assert driver.quit_called
+        assert pool.acquire() is not driver
+
+    def test_displace_quits_idle_drivers_so_their_slots_free_up(self):
+        pool = BrowserPool(size=1, max_uses=5, settings_factory=_FakeSettings)
+        driver = pool.acquire()
+        pool.release(driver)
+        pool.displace()
+        assert driver.quit_called
+        assert pool.acquire() is not driver
+
+    def test_close_quits_idle_drivers(self):
+        pool = BrowserPool(size=2, max_uses=5, settings_factory=_FakeSettings)
+        first, second = pool.acquire(), pool.acquire()
+        pool.release(first)
+        pool.release(second)
+        pool.close()
+        assert first.quit_called and second.quit_called
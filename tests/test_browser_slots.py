@@ -0,0 +1,63 @@
+"""Cross-process browser slot limit, exercised with a private lock directory."""
+
+import pytest
+from selenium.common import WebDriverException
+
+from core.browser import browser_slots
+from core.browser.browser import BrowserSettings
+from core.browser.browser_slots import CAPACITY_ENV, BrowserSlot, host_browser_capacity
+from core.config.browser_config import browser_config
+from tests.fake_webdriver import FakeWebDriver
+
+
+class TestBrowserSlot:
+
+    def test_slots_are_exclusive_until_released(self, tmp_path):
+        first = BrowserSlot(limit=1, timeout=0, lock_dir=tmp_path)
+        second = BrowserSlot(limit=1, timeout=0, lock_dir=tmp_path)
+        first.acquire()
+        with pytest.raises(TimeoutError):
+            second.acquire()
+        first.release()
+        second.acquire()
+        second.release()
+
+    def test_each_lease_takes_a_distinct_slot(self, tmp_path):
+        leases = [BrowserSlot(limit=3, timeout=0, lock_dir=tmp_path) for _ in range(3)]
+        for lease in leases:
+            lease.acquire()
+        assert sorted(lease.index for lease in leases) == [0, 1, 2]
+        for lease in leases:
+            lease.release()
+
+    def test_failed_driver_set_up_quits_the_browser_and_frees_its_slot(self, tmp_path, monkeypatch):
+        settings = BrowserSettings(remote_url="")
+        settings.slot = BrowserSlot(limit=1, timeout=0, lock_dir=tmp_path)
+        driver = FakeWebDriver()
+        monkeypatch.setattr(settings, "_start_driver", lambda: driver)
+
+        def unsupported(*args):
+            raise WebDriverException("unknown command: Network.setBlockedURLs")
+
+        monkeypatch.setattr(settings.resource_policy, "apply", unsupported)
+        with pytest.raises(WebDriverException):
+            settings.get_driver()
+        assert driver.quit_called and settings.driver is None
+        next_lease = BrowserSlot(limit=1, timeout=0, lock_dir=tmp_path)
+        next_lease.acquire()
+        next_lease.release()
+
+    def test_capacity_is_computed_once_and_exported_to_workers(self, monkeypatch):
+        monkeypatch.setattr(browser_config, "max_browsers", 0)
+        monkeypatch.setenv(CAPACITY_ENV, "")  # restored afterwards, whatever the test exports
+        monkeypatch.setattr(browser_slots, "_available_memory_mb", lambda: 4 * browser_config.browser_memory_mb)
+        host_browser_capacity.cache_clear()
+        try:
+            capacity = host_browser_capacity()
+            assert browser_slots.os.environ[CAPACITY_ENV] == str(capacity)
+            # Later processes (xdist workers) inherit it even though free memory has dropped meanwhile.
+            monkeypatch.setattr(browser_slots, "_available_memory_mb", lambda: 0)
+            host_browser_capacity.cache_clear()
+            assert host_browser_capacity() == capacity
+        finally:
+            host_browser_capacity.cache_clear()
@@ -0,0 +1,59 @@
+"""Declarative page elements: import-time selector checks, lazy bound proxies and shared Actions."""
+
+import pytest
+from selenium.common import InvalidSelectorException
+from selenium.webdriver.common.by import By
+
+from core.actions.actions import release_shared_actions
+from core.actions.element import BoundElement, Element
+from pages.base_page import BasePage
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+from tests.fake_webdriver import FakeElement, FakeWebDriver
+
+
+class TestElement:
+
+    def test_broken_selectors_fail_when_the_page_class_is_defined(self):
+        with pytest.raises(InvalidSelectorException):
+            class _Broken(BasePage):
+                button = Element(By.CSS_SELECTOR, "form > > button")
+        with pytest.raises(InvalidSelectorException):
+            Element(By.XPATH, "//div[@id='x'")
+
+    def test_class_access_is_the_locator_and_instance_access_is_lazy(self):
+        driver = FakeWebDriver()
+        page = LoginPage(driver)
+        assert LoginPage.username == (By.ID, "user-name")
+        assert isinstance(page.username, BoundElement) and page.username == LoginPage.username
+        assert page.username is page.username
+        assert driver.commands == []
+
+    def test_bound_element_clicks_through_the_page_actions(self):
+        driver = FakeWebDriver()
+        button = driver.elements[LoginPage.login_button] = FakeElement()
+        LoginPage(driver).login_button.click()
+        LoginPage(driver).login_button.click()
+        assert button.clicks == 2
+        assert driver.commands.count("find_element") == 1  # cached across page objects
+
+    def test_page_fill_sets_every_field_in_one_script(self):
+        driver = FakeWebDriver()
+        LoginPage(driver).fill(username="standard_user", password="secret_sauce")
+        assert driver.commands == ["execute_script"]
+
+    def test_native_login_types_with_key_events(self):
+        driver = FakeWebDriver()
+        username, password = FakeElement(), FakeElement()
+        driver.elements[LoginPage.username], driver.elements[LoginPage.password] = username, password
+        driver.elements[LoginPage.login_button] = FakeElement()
+        LoginPage(driver).login("standard_user", "secret_sauce", native=True)
+        assert (username.value, password.value) == ("standard_user", "secret_sauce")
+        assert "execute_script" not in driver.commands
+
+    def test_pages_on_one_driver_share_actions_until_released(self):
+        driver = FakeWebDriver()
+        actions = LoginPage(driver).actions
+        assert InventoryPage(driver).actions is actions
+        release_shared_actions(driver)
+        assert LoginPage(driver).actions is not actions
@@ -0,0 +1,64 @@
+"""Element cache reuse, navigation expiry and stale-element recovery in Actions."""
+
+from selenium.webdriver.common.by import By
+
+from core.actions.actions import Actions
+from core.actions.element import Element
+from core.actions.element_cache import track_navigations
+from tests.fake_webdriver import FakeElement, FakeWebDriver
+
+BUTTON = Element(By.ID, "login-button")
+
+
+def _driver_with_button() -> tuple[FakeWebDriver, FakeElement]:
+    driver = FakeWebDriver()
+    track_navigations(driver)
+    button = FakeElement()
+    driver.elements[BUTTON] = button
+    return driver, button
+
+
+class TestElementCache:
+
+    def test_cached_locator_is_resolved_once(self):
+        driver, button = _driver_with_button()
+        actions = Actions(driver)
+        actions.click(BUTTON, 1)
+        actions.click(BUTTON, 1)
+        assert button.clicks == 2
+        assert driver.commands.count("find_element") == 1
+
+    def test_plain_locator_is_resolved_every_time(self):
+        driver, button = _driver_with_button()
+        actions = Actions(driver)
+        plain = (By.ID, "login-button")
+        actions.click(plain, 1)
+        actions.click(plain, 1)
+        assert driver.commands.count("find_element") == 2
+
+    def test_navigation_expires_the_cache(self):
+        driver, _ = _driver_with_button()
+        actions = Actions(driver)
+        actions.click(BUTTON, 1)
+        driver.get("https://example.test/inventory.html")
+        actions.click(BUTTON, 1)
+        assert driver.commands.count("find_element") == 2
+
+    def test_url_change_after_a_click_expires_the_cache(self):
+        driver, _ = _driver_with_button()
+        actions = Actions(driver)
+        actions.click(BUTTON, 1)
+        driver.current_url = "https://example.test/inventory.html"  # the click navigated
+        actions.click(BUTTON, 1)
+        actions.click(BUTTON, 1)
+        assert driver.commands.count("find_element") == 2
+
+    def test_stale_element_is_resolved_again_and_retried(self):
+        driver, button = _driver_with_button()
+        actions = Actions(driver)
+        actions.click(BUTTON, 1)
+        button.stale = True
+        fresh = FakeElement()
+        driver.elements[BUTTON] = fresh
+        actions.click(BUTTON, 1)
+        assert fresh.clicks == 1
@@ -0,0 +1,67 @@
+"""Negative visibility checks: one script per poll, returning as soon as the answer is known."""
+
+import time
+
+import pytest
+from selenium.common import TimeoutException
+from selenium.webdriver.common.by import By
+
+from core.actions import scripts
+from core.actions.actions import Actions
+from core.actions.wait_engine import BackoffSchedule, WaitEngine
+from core.actions.wait_strategy import WaitStrategy
+from tests.fake_webdriver import FakeWebDriver
+
+FAST = BackoffSchedule(first=0.001, factor=2.0, cap=0.004)
+ERROR = (By.CSS_SELECTOR, '[data-test="error"]')
+
+
+class _StateWebDriver(FakeWebDriver):
+    """Answers `scripts.ELEMENT_STATE` with the given states in turn, repeating the last one."""
+
+    def __init__(self, *states: dict):
+        super().__init__()
+        self.states = list(states)
+
+    def execute_script(self, script: str, *args):
+        if script is not scripts.ELEMENT_STATE:
+            return super().execute_script(script, *args)
+        self._record("execute_script")
+        return self.states.pop(0) if len(self.states) > 1 else self.states[0]
+
+
+def _actions(*states: dict) -> Actions:
+    driver = _StateWebDriver(*states)
+    return Actions(driver, WaitEngine(driver, WaitStrategy.BACKOFF, FAST))
+
+
+class TestElementState:
+
+    def test_absent_element_is_reported_in_one_round_trip(self):
+        actions = _actions({"state": "absent", "reason": "no element matches the locator"})
+        started = time.perf_counter()
+        assert actions.is_absent(ERROR)
+        assert not actions.is_visible_now(ERROR)
+        assert time.perf_counter() - started < 0.5
+        assert actions.driver.commands == ["execute_script", "execute_script"]
+
+    def test_hidden_element_is_diagnosed_with_its_reason(self):
+        state = _actions({"state": "hidden", "reason": "display: none"}).element_state(ERROR)
+        assert state.hidden and not state.absent and not state.visible
+        assert state.reason == "display: none"
+        assert state.locator == ERROR
+
+    def test_is_absent_polls_until_the_element_is_removed(self):
+        actions = _actions({"state": "visible", "reason": None}, {"state": "visible", "reason": None},
+                           {"state": "absent", "reason": "no element matches the locator"})
+        assert actions.is_absent(ERROR, timeout=1)
+        assert actions.driver.commands.count("execute_script") == 3
+
+    def test_is_absent_is_false_for_a_present_element(self):
+        assert not _actions({"state": "hidden", "reason": "opacity: 0"}).is_absent(ERROR)
+
+    def test_wait_until_invisible_returns_the_state_or_raises(self):
+        actions = _actions({"state": "visible", "reason": None}, {"state": "hidden", "reason": "visibility: hidden"})
+        assert actions.wait_until_invisible(ERROR, 1).reason == "visibility: hidden"
+        with pytest.raises(TimeoutException):
+            _actions({"state": "visible", "reason": None}).wait_until_invisible(ERROR, 0.02)
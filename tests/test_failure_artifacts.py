@@ -0,0 +1,78 @@
+"""FailureArtifacts: raw capture on the test thread, files written into the Allure results by the worker."""
+
+import json
+import uuid
+
+import pytest
+from allure_commons import model2, plugin_manager
+from allure_commons.logger import AllureFileLogger
+from allure_commons.reporter import AllureReporter
+
+from core.instrumentation.failure_artifacts import FailureArtifacts
+from core.instrumentation.screenshot_format import ScreenshotFormat
+from tests.fake_webdriver import FakeWebDriver
+
+
+class _AllureRun:
+    """Stands in for allure-pytest: one running test whose attachments land in `report_dir`."""
+
+    def __init__(self, report_dir):
+        self.allure_logger = AllureReporter()
+        self.file_logger = AllureFileLogger(report_dir)
+        self.test = model2.TestResult(uuid=str(uuid.uuid4()), name="test_failing")
+        self.allure_logger.schedule_test(self.test.uuid, self.test)
+
+
+@pytest.fixture
+def allure_run(tmp_path):
+    run = _AllureRun(tmp_path)
+    plugin_manager.register(run)
+    plugin_manager.register(run.file_logger)
+    yield run
+    plugin_manager.unregister(run.file_logger)
+    plugin_manager.unregister(run)
+
+
+def _artifacts(**overrides) -> FailureArtifacts:
+    settings = {"artifacts": ["screenshot", "page_source", "console"], "limit": 0,
+                "image_format": ScreenshotFormat.PNG, "scale": 1.0}
+    return FailureArtifacts(**{**settings, **overrides})
+
+
+class TestFailureArtifacts:
+
+    def test_artifacts_are_attached_and_written_by_the_worker(self, allure_run, tmp_path):
+        driver = FakeWebDriver()
+        driver.console_logs = [{"level": "SEVERE", "message": "boom"}]
+        artifacts = _artifacts()
+
+        assert artifacts.capture(driver, "test_failing")
+        artifacts.close()
+
+        written = {a.name: tmp_path / a.source for a in allure_run.test.attachments}
+        assert sorted(written) == ["console_on_failure", "page_source_on_failure", "screenshot_on_failure"]
+        assert written["screenshot_on_failure"].read_bytes() == driver.screenshot
+        assert written["page_source_on_failure"].read_text(encoding="utf-8") == driver.page_source
+        assert json.loads(written["console_on_failure"].read_text(encoding="utf-8")) == driver.console_logs
+
+    def test_only_the_first_failures_are_captured(self, allure_run):
+        driver = FakeWebDriver()
+        artifacts = _artifacts(artifacts=["screenshot"], limit=1)
+
+        assert artifacts.capture(driver, "first")
+        assert not artifacts.capture(driver, "second")
+        artifacts.close()
+
+        assert driver.commands == ["get_screenshot_as_base64"]
+
+    def test_nothing_is_captured_without_an_allure_report(self):
+        driver = FakeWebDriver()
+        artifacts = _artifacts()
+
+        assert not artifacts.capture(driver, "test_failing")
+        artifacts.close()
+        assert driver.commands == []
+
+    def test_unknown_artifact_is_rejected(self):
+        with pytest.raises(ValueError, match="har"):
+            FailureArtifacts(artifacts=["har"])
@@ -0,0 +1,28 @@
+"""Offline benchmark pieces: the Sauce Demo fake driver, the overhead run and the percentile summary."""
+
+from benchmarks import framework_overhead
+from benchmarks.stats import latency_summary
+from pages.login_page import LoginPage
+from tests.fake_webdriver import SauceDemoWebDriver
+
+
+class TestFrameworkOverhead:
+
+    def test_fake_driver_logs_in_and_rejects_bad_passwords(self):
+        driver = SauceDemoWebDriver()
+        LoginPage(driver).open(driver.base_url).login("standard_user", "wrong")
+        assert LoginPage(driver).error_message.state.visible
+
+        LoginPage(driver).open(driver.base_url).login("standard_user", "secret_sauce")
+        assert driver.current_url.endswith("/inventory.html")
+
+    def test_run_reports_every_step_with_commands_and_overhead(self):
+        result = framework_overhead.run(latency_ms=1, iterations=3)
+        assert result["tests"] == 3 and result["tests_per_minute"] > 0
+        click = result["actions"]["click_login"]
+        assert click["commands"] >= 1
+        assert 0 <= click["overhead_p50_ms"] < click["p50_ms"]
+
+    def test_latency_summary_uses_nearest_rank_percentiles(self):
+        summary = latency_summary([i / 1000 for i in range(1, 101)])
+        assert (summary["p50_ms"], summary["p95_ms"], summary["max_ms"]) == (50.0, 95.0, 100.0)
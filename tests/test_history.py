@@ -0,0 +1,56 @@
+"""TestHistory: persistence, failed-first / longest-first ordering and time-budget selection."""
+
+from core.instrumentation.test_history import TestHistory
+
+
+def _history(tmp_path, runs: dict[str, list[tuple[float, str]]]) -> TestHistory:
+    history = TestHistory(tmp_path / "history.json", keep=3)
+    for nodeid, results in runs.items():
+        for duration, outcome in results:
+            history.record(nodeid, duration, outcome)
+    return history
+
+
+class TestTestHistory:
+
+    def test_round_trip_keeps_only_the_last_runs(self, tmp_path):
+        history = _history(tmp_path, {"t::a": [(1.0, "passed"), (2.0, "failed"), (3.0, "passed"), (4.0, "passed")]})
+        history.save()
+
+        loaded = TestHistory(tmp_path / "history.json", keep=3).load()
+        assert loaded.entries["t::a"].durations == [2.0, 3.0, 4.0]
+        assert loaded.entries["t::a"].outcomes == ["failed", "passed", "passed"]
+
+    def test_recent_failures_first_then_longest_first(self, tmp_path):
+        history = _history(tmp_path, {
+            "short.py::t": [(1.0, "passed")],
+            "long.py::t": [(9.0, "passed")],
+            "broken.py::t": [(0.5, "failed")],
+        })
+        assert history.order(["short.py::t", "long.py::t", "broken.py::t"]) == ["broken.py::t", "long.py::t",
+                                                                                 "short.py::t"]
+
+    def test_scopes_move_as_a_whole_and_keep_their_test_order(self, tmp_path):
+        history = _history(tmp_path, {
+            "a.py::A::one": [(1.0, "passed")],
+            "a.py::A::two": [(1.0, "passed")],
+            "b.py::B::long": [(1.5, "passed")],
+            "c.py::C::broken": [(0.1, "failed")],
+        })
+        nodeids = ["a.py::A::one", "b.py::B::long", "a.py::A::two", "c.py::C::broken"]
+        assert history.order(nodeids) == ["c.py::C::broken", "a.py::A::one", "a.py::A::two", "b.py::B::long"]
+
+    def test_budget_prefers_failing_and_priority_tests(self, tmp_path):
+        history = _history(tmp_path, {
+            "t::slow": [(50.0, "passed")],
+            "t::flaky": [(20.0, "passed"), (20.0, "failed")],
+            "t::smoke": [(20.0, "passed")],
+            "t::other": [(20.0, "passed")],
+        })
+        selected = history.select(["t::slow", "t::flaky", "t::smoke", "t::other"], budget=45,
+                                  priority={"t::smoke"})
+        assert selected == ["t::flaky", "t::smoke"]
+
+    def test_unknown_tests_are_estimated_from_known_ones(self, tmp_path):
+        history = _history(tmp_path, {"t::a": [(2.0, "passed")], "t::b": [(4.0, "passed")], "t::c": [(9.0, "passed")]})
+        assert history.expected_duration("t::new") == 4.0
@@ -0,0 +1,57 @@
+"""Login matrix tables (CSV / YAML) and the login outcome wait, without a browser."""
+
+import pytest
+
+from core.config.browser_config import browser_config
+from core.data.login_matrix import load_login_matrix
+from core.data.login_outcome_type import LoginOutcome
+from pages.login_page import LoginPage
+from tests.fake_webdriver import SauceDemoWebDriver
+
+
+class TestLoginCases:
+
+    def test_bundled_table_loads_with_unique_ids(self):
+        cases = load_login_matrix()
+        assert len({case.id for case in cases}) == len(cases)
+        glitch = next(case for case in cases if case.user == "performance_glitch_user")
+        assert glitch.expected is LoginOutcome.INVENTORY
+        assert glitch.max_seconds == browser_config.login_latency_budget
+        assert glitch.resolved_password("from-env") == "from-env"
+
+    def test_csv_ids_default_to_the_user_and_repeats_get_a_suffix(self, tmp_path):
+        table = tmp_path / "logins.csv"
+        table.write_text("user,password,expected,error,max_seconds\n"
+                         "standard_user,x,error,do not match,0.5\n"
+                         "standard_user,,error,Password is required,\n", encoding="utf-8")
+        first, second = load_login_matrix(table)
+        assert (first.id, first.max_seconds) == ("standard_user", 0.5)
+        assert (second.id, second.password) == ("standard_user-2", "")
+
+    def test_yaml_tables_and_invalid_rows(self, tmp_path):
+        pytest.importorskip("yaml")
+        table = tmp_path / "logins.yaml"
+        table.write_text("- {user: visual_user, password: \"${PASS}\", expected: inventory, max_seconds: 3}\n",
+                         encoding="utf-8")
+        (case,) = load_login_matrix(table)
+        assert (case.user, case.expected, case.max_seconds) == ("visual_user", LoginOutcome.INVENTORY, 3.0)
+
+        table.write_text("- {user: visual_user, expected: dashboard}\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="row 1"):
+            load_login_matrix(table)
+
+        table.write_text("- {user: visual_user, expected: inventory}\n- visual_user\n", encoding="utf-8")
+        with pytest.raises(ValueError, match=r"logins.yaml row 2: expected a mapping"):
+            load_login_matrix(table)
+        table.write_text("user: visual_user\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="expected a list of mappings"):
+            load_login_matrix(table)
+
+    def test_wait_for_outcome_tells_inventory_from_error(self):
+        driver = SauceDemoWebDriver()
+        page = LoginPage(driver).open(driver.base_url)
+        page.login("standard_user", "wrong")
+        assert page.wait_for_outcome(1) is LoginOutcome.ERROR
+        page = LoginPage(driver).open(driver.base_url)
+        page.login("standard_user", "secret_sauce")
+        assert page.wait_for_outcome(1) is LoginOutcome.INVENTORY
@@ -0,0 +1,46 @@
+"""Login scenarios generated from the login table (`tests/data/login_matrix.csv`), one pooled browser per worker."""
+
+import time
+
+import allure
+import pytest
+from loguru import logger
+
+from core.config.browser_config import browser_config
+from core.config.sauce_demo_env import SauceDemoEnv
+from core.data.login_matrix import LoginCase
+from core.data.login_outcome_type import LoginOutcome
+from pages.login_page import LoginPage
+
+
+@allure.feature("Login")
+class TestLoginMatrix:
+    """One test per table row; the browser pool resets the browser between rows instead of relaunching it."""
+
+    @pytest.mark.regression
+    @allure.story("Every account in the login table gets its expected outcome in time")
+    def test_login_row(self, browser, sauce_demo_env: SauceDemoEnv, login_case: LoginCase, record_property):
+        allure.dynamic.parameter("user", login_case.user)
+        login_page = LoginPage(browser).open(sauce_demo_env.base_url)
+        with allure.step(f"Sign in as {login_case.user or '<empty>'}"):
+            started = time.perf_counter()
+            login_page.login(login_case.user, login_case.resolved_password(sauce_demo_env.password))
+            outcome = login_page.wait_for_outcome()
+            seconds = time.perf_counter() - started
+        record_property("login_case", login_case.id)
+        record_property("login_seconds", round(seconds, 3))
+        record_property("login_budget", login_case.max_seconds)
+        logger.info("Login row {}: {} in {:.3f}s (budget {}s)", login_case.id, outcome.value, seconds,
+                    login_case.max_seconds)
+
+        with allure.step(f"Assert outcome is {login_case.expected.value}"):
+            assert outcome is login_case.expected, f"{login_case.id}: expected {login_case.expected.value}, got {outcome.value}"
+            if outcome is LoginOutcome.ERROR and login_case.error:
+                text = login_page.error_message.text
+                assert login_case.error in text, f"{login_case.id}: error banner {text!r} lacks {login_case.error!r}"
+        if seconds > login_case.max_seconds:
+            allure.dynamic.tag("timing-regression")
+        if browser_config.login_latency_strict:
+            assert seconds <= login_case.max_seconds, (
+                f"{login_case.id}: login took {seconds:.2f}s, budget {login_case.max_seconds:.2f}s (timing regression)"
+            )
@@ -0,0 +1,41 @@
+"""Remote sessions against the mock Grid hub: shared keep-alive pool and saturation retries."""
+
+import pytest
+from selenium.common import SessionNotCreatedException
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+from benchmarks.mock_grid import MockGrid
+from core.browser.remote import close_connection_pools, start_remote_driver
+from core.config.browser_config import browser_config
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(browser_config, "remote_retry_delay", 0.01)
+    monkeypatch.setattr(browser_config, "remote_session_retries", 2)
+    yield
+    close_connection_pools()
+
+
+class TestRemoteDriver:
+
+    def test_sessions_share_one_keep_alive_connection(self):
+        with MockGrid() as grid:
+            for _ in range(3):
+                driver = start_remote_driver(ChromeOptions(), grid.url)
+                driver.get(f"{grid.url}/inventory.html")
+                assert driver.current_url.endswith("/inventory.html")
+                driver.quit()
+            assert grid.connections == 1
+            assert not grid.sessions
+
+    def test_saturated_grid_is_retried_until_a_session_is_created(self):
+        with MockGrid(refusals=2) as grid:
+            driver = start_remote_driver(ChromeOptions(), grid.url)
+            assert driver.session_id in grid.sessions
+            driver.quit()
+
+    def test_gives_up_after_the_configured_retries(self):
+        with MockGrid(refusals=3) as grid:
+            with pytest.raises(SessionNotCreatedException, match="No free slots"):
+                start_remote_driver(ChromeOptions(), grid.url)
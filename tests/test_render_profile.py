@@ -0,0 +1,48 @@
+"""Render profile launch options and the CDP set-up applied to a started driver."""
+
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+from core.browser.browser_type import BrowserType
+from core.browser.render_profile import apply_render_profile, configure_render_options
+from core.config.browser_config import browser_config
+from tests.fake_webdriver import FakeWebDriver
+
+
+class _CdpWebDriver(FakeWebDriver):
+    def __init__(self):
+        super().__init__()
+        self.cdp: list[tuple[str, dict]] = []
+
+    def execute_cdp_cmd(self, command: str, params: dict) -> dict:
+        self.cdp.append((command, params))
+        return {}
+
+
+class TestRenderProfile:
+
+    def test_chromium_gets_reduced_motion_flags_without_bidi(self):
+        options = ChromeOptions()
+        configure_render_options(BrowserType.CHROME, options)
+        assert {"--disable-smooth-scrolling", "--force-prefers-reduced-motion"} <= set(options.arguments)
+        assert not options.enable_bidi
+
+    def test_firefox_uses_preferences_and_bidi(self):
+        options = FirefoxOptions()
+        configure_render_options(BrowserType.FIREFOX, options)
+        assert options.preferences["ui.prefersReducedMotion"] == 1
+        assert options.preferences["general.smoothScroll"] is False
+        assert options.enable_bidi
+
+    def test_cdp_driver_gets_no_motion_script_and_fixed_viewport(self):
+        driver = _CdpWebDriver()
+        apply_render_profile(driver)
+
+        commands = dict(driver.cdp)
+        assert "transition-duration: 0s !important" in commands["Page.addScriptToEvaluateOnNewDocument"]["source"]
+        assert commands["Emulation.setDeviceMetricsOverride"] == {
+            "width": browser_config.viewport_width,
+            "height": browser_config.viewport_height,
+            "deviceScaleFactor": browser_config.device_scale_factor,
+            "mobile": False,
+        }
@@ -0,0 +1,105 @@
+"""ResourcePolicy pattern expansion per browser, BiDi blocking and per-test stubs with fake requests."""
+
+import pytest
+
+from core.browser.browser_type import BrowserType
+from core.browser.resource_policy import NetworkStubs, ResourcePolicy
+from tests.fake_webdriver import FakeWebDriver
+
+
+class _FakeRequest:
+    def __init__(self, url: str):
+        self.url = url
+        self.actions: list[tuple] = []
+
+    def fail(self) -> None:
+        self.actions.append(("fail",))
+
+    def provide_response(self, **response) -> None:
+        self.actions.append(("provide_response", response))
+
+
+class _FakeNetwork:
+    """`driver.network` stand-in for the high-level `add_request_handler(handler)` form."""
+
+    def __init__(self):
+        self.handlers = {}
+
+    def add_request_handler(self, handler) -> str:
+        handler_id = f"handler-{len(self.handlers)}"
+        self.handlers[handler_id] = handler
+        return handler_id
+
+    def remove_request_handler(self, handler_id: str) -> None:
+        del self.handlers[handler_id]
+
+
+def _bidi_driver() -> FakeWebDriver:
+    driver = FakeWebDriver()
+    driver.caps = {"webSocketUrl": "ws://127.0.0.1:9222/session"}
+    driver.network = _FakeNetwork()
+    return driver
+
+
+class TestResourcePolicy:
+
+    def test_chromium_blocks_type_globs_with_query_string_variants(self):
+        policy = ResourcePolicy(block_resources=["font"], block_url_patterns=["*/ads/*"], stubs_enabled=False)
+        patterns = policy.blocked_patterns(BrowserType.CHROME)
+        assert patterns[0] == "*/ads/*"
+        assert {"*.woff2", "*.woff2?*"} <= set(patterns)
+
+    def test_firefox_leaves_preference_backed_types_out_of_url_blocking(self):
+        policy = ResourcePolicy(block_resources=["image", "tracker"], block_url_patterns=[], stubs_enabled=False)
+        patterns = policy.blocked_patterns(BrowserType.FIREFOX)
+        assert "*.png" not in patterns
+        assert "*google-analytics.com*" in patterns
+
+    def test_unknown_resource_type_is_rejected(self):
+        with pytest.raises(ValueError, match="stylesheets"):
+            ResourcePolicy(block_resources=["stylesheets"], block_url_patterns=[], stubs_enabled=False)
+
+    def test_bidi_blocking_fails_only_matching_requests(self):
+        driver = _bidi_driver()
+        ResourcePolicy(block_resources=[], block_url_patterns=["*/ads/*"], stubs_enabled=False).apply(
+            driver, BrowserType.FIREFOX)
+        (handler,) = driver.network.handlers.values()
+        blocked, passed = _FakeRequest("https://example.test/ads/banner.js"), _FakeRequest("https://example.test/")
+        handler(blocked)
+        handler(passed)
+        assert blocked.actions == [("fail",)]
+        assert passed.actions == []  # continued by Selenium
+
+
+class TestNetworkStubs:
+
+    def test_matching_request_gets_the_stubbed_response(self):
+        driver = _bidi_driver()
+        stubs = NetworkStubs(driver)
+        stubs.add("*/api/inventory*", '{"items": []}')
+        stubs.add("*/api/cart*", "gone", status=410, content_type="text/plain")
+
+        inventory, cart, other = (_FakeRequest(f"https://example.test/api/{name}")
+                                  for name in ("inventory", "cart", "orders"))
+        for request in (inventory, cart, other):
+            stubs._handle(request)
+        assert inventory.actions == [("provide_response", {
+            "status": 200, "headers": {"Content-Type": "application/json"}, "body": '{"items": []}',
+            "reason_phrase": "OK"})]
+        assert cart.actions[0][1]["reason_phrase"] == "Stubbed"
+        assert other.actions == []
+
+    def test_one_handler_per_test_removed_on_clear(self):
+        driver = _bidi_driver()
+        stubs = NetworkStubs(driver)
+        stubs.add("*/a*", "a")
+        stubs.add("*/b*", "b")
+        assert len(driver.network.handlers) == 1
+        stubs.clear()
+        assert driver.network.handlers == {}
+
+    def test_stubs_need_bidi(self):
+        driver = FakeWebDriver()
+        driver.caps = {}
+        with pytest.raises(RuntimeError, match="network_stubs=true"):
+            NetworkStubs(driver).add("*", "")
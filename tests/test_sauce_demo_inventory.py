@@ -0,0 +1,21 @@
+"""Post-login scenarios; sign-in is restored from the session cache instead of the login form."""
+
+import allure
+import pytest
+from loguru import logger
+
+from pages.inventory_page import InventoryPage
+
+
+@allure.feature("Inventory")
+class TestInventory:
+    """Starts on /inventory.html through `logged_in_browser` (URL, USER, PASS)."""
+
+    @pytest.mark.smoke
+    @pytest.mark.regression
+    @allure.story("Signed-in user sees the product listing")
+    def test_inventory_loaded(self, logged_in_browser):
+        logger.info("Starting inventory test (cached session)")
+        with allure.step("Assert inventory page is loaded"):
+            assert InventoryPage(logged_in_browser).is_loaded(), "Inventory page title should be visible"
+        logger.info("Inventory test (cached session) finished")
@@ -6,9 +6,9 @@ import allure
 import pytest
 from loguru import logger
 
+from core.config.sauce_demo_env import SauceDemoEnv
 from pages.inventory_page import InventoryPage
 from pages.login_page import LoginPage
-from tests.sauce_demo_env import SauceDemoEnv
 
 
 @allure.feature("Login")
@@ -22,12 +22,12 @@ class TestLogin:
     def test_login_ok(self, browser, sauce_demo_env: SauceDemoEnv):
         logger.info("Starting login test (happy path)")
         with allure.step("Open the application under test"):
-            browser.get(sauce_demo_env.base_url)
-        login_page = LoginPage(browser)
-        with allure.step("Enter credentials and submit login"):
-            login_page.set_username(sauce_demo_env.username)
-            login_page.set_password(sauce_demo_env.password)
-            login_page.click_login_button()
+            login_page = LoginPage(browser).open(sauce_demo_env.base_url)
+        with allure.step("Assert no error message is shown before signing in"):
+            assert login_page.error_message.absent, f"Unexpected error banner: {login_page.error_message.state}"
+        with allure.step("Type credentials and submit login"):
+            # Real key events: this test proves a user can type into the form; the others use the batched fill.
+            login_page.login(sauce_demo_env.username, sauce_demo_env.password, native=True)
         with allure.step("Assert inventory page is loaded (URL and UI)"):
             path = urlparse(browser.current_url).path
             assert path == "/inventory.html", (
@@ -42,12 +42,9 @@ class TestLogin:
     def test_login_fail(self, browser, sauce_demo_env: SauceDemoEnv):
         logger.info("Starting login test (invalid password)")
         with allure.step("Open the application under test"):
-            browser.get(sauce_demo_env.base_url)
-        login_page = LoginPage(browser)
+            login_page = LoginPage(browser).open(sauce_demo_env.base_url)
         with allure.step("Enter credentials and submit login"):
-            login_page.set_username(sauce_demo_env.username)
-            login_page.set_password("wrong_password")
-            login_page.click_login_button()
+            login_page.login(sauce_demo_env.username, "wrong_password")
         with allure.step("Assert error message is displayed"):
             assert login_page.is_error_message_displayed(), "Error message should be visible"
         logger.info("Login test (invalid password) finished")
@@ -58,12 +55,9 @@ class TestLogin:
         """Uses the public demo account `locked_out_user` (documented on the login page)."""
         logger.info("Starting login test (locked-out user)")
         with allure.step("Open the application under test"):
-            browser.get(sauce_demo_env.base_url)
-        login_page = LoginPage(browser)
+            login_page = LoginPage(browser).open(sauce_demo_env.base_url)
         with allure.step("Sign in as locked_out_user"):
-            login_page.set_username("locked_out_user")
-            login_page.set_password(sauce_demo_env.password)
-            login_page.click_login_button()
+            login_page.login("locked_out_user", sauce_demo_env.password)
         with allure.step("Assert error message is displayed"):
             assert login_page.is_error_message_displayed(), "Error message should be visible for locked-out user"
         logger.info("Login test (locked-out user) finished")
@@ -0,0 +1,112 @@
+"""SessionCache persistence, expiry, origin keys and restore / invalidation, exercised without a real browser."""
+
+import time
+
+from selenium.common import NoSuchElementException
+
+from core.browser.session_cache import SessionCache, SessionSnapshot
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+from tests.fake_webdriver import FakeElement, FakeWebDriver
+
+ORIGIN = "https://example.test"
+INVENTORY_URL = ORIGIN + InventoryPage.PATH
+
+
+def _snapshot(age: float = 0) -> SessionSnapshot:
+    return SessionSnapshot(
+        origin=ORIGIN,
+        cookies=[{"name": "session-username", "value": "standard_user", "path": "/"}],
+        local_storage={"cart-contents": "[]"},
+        created_at=time.time() - age,
+    )
+
+
+class _AppDriver(FakeWebDriver):
+    """Fake Sauce Demo: the inventory shows when the session cookie holds the app's current token."""
+
+    def __init__(self, token: str = "token-1"):
+        super().__init__()
+        self.token = token
+        self.cookies: list[dict] = []
+
+    def _logged_in(self) -> bool:
+        return any(cookie["value"] == self.token for cookie in self.cookies)
+
+    def get_cookies(self) -> list[dict]:
+        self._record("get_cookies")
+        return list(self.cookies)
+
+    def add_cookie(self, cookie: dict) -> None:
+        self._record("add_cookie")
+        self.cookies.append(cookie)
+
+    def execute_script(self, script: str, *args):
+        if "dump(window.localStorage)" in script:
+            self._record("execute_script")
+            return {"origin": ORIGIN, "local": {}, "session": {}}
+        return super().execute_script(script, *args)
+
+    def find_elements(self, by: str, value: str) -> list[FakeElement]:
+        self._record("find_elements")
+        page = InventoryPage.title if self._logged_in() else LoginPage.username
+        return [FakeElement()] if (by, value) == page else []
+
+    def find_element(self, by: str, value: str) -> FakeElement:
+        found = self.find_elements(by, value)
+        if not found:
+            raise NoSuchElementException(f"no element for {(by, value)}")
+        return found[0]
+
+
+def _authenticate(cache: SessionCache, driver: _AppDriver, logins: list[str], url: str = INVENTORY_URL) -> bool:
+    def ui_login(d: _AppDriver) -> None:
+        logins.append(d.token)
+        d.cookies = [{"name": "session-username", "value": d.token, "path": "/"}]
+        d.current_url = url
+
+    return cache.authenticate(driver, "standard_user", url, login=ui_login, ready_locator=InventoryPage.title,
+                              login_form_locator=LoginPage.username, timeout=1)
+
+
+class TestSessionCache:
+
+    def test_saved_snapshot_is_loaded_by_a_new_cache(self, tmp_path):
+        SessionCache(tmp_path, ttl=60).save("standard_user", ORIGIN, _snapshot())
+        loaded = SessionCache(tmp_path, ttl=60).load("standard_user", ORIGIN)
+        assert loaded is not None
+        assert loaded.cookies[0]["value"] == "standard_user"
+        assert loaded.local_storage == {"cart-contents": "[]"}
+
+    def test_snapshots_are_kept_per_origin(self, tmp_path):
+        cache = SessionCache(tmp_path, ttl=60)
+        cache.save("standard_user", ORIGIN, _snapshot())
+        assert cache.load("standard_user", "https://staging.example.test") is None
+        assert SessionCache(tmp_path, ttl=60).load("standard_user", "https://staging.example.test") is None
+
+    def test_expired_snapshot_is_dropped(self, tmp_path):
+        cache = SessionCache(tmp_path, ttl=60)
+        cache.save("standard_user", ORIGIN, _snapshot(age=120))
+        assert cache.load("standard_user", ORIGIN) is None
+        assert not any(tmp_path.iterdir())
+
+    def test_storage_script_only_targets_the_snapshot_origin(self):
+        script = _snapshot().storage_script()
+        assert 'location.origin !== "https://example.test"' in script
+        assert '{"cart-contents": "[]"}' in script
+
+    def test_second_browser_gets_the_session_injected(self, tmp_path):
+        cache, logins = SessionCache(tmp_path, ttl=60), []
+        assert _authenticate(cache, _AppDriver(), logins) is False
+        driver = _AppDriver()
+        assert _authenticate(cache, driver, logins) is True
+        assert logins == ["token-1"]
+        assert "add_cookie" in driver.commands and driver.current_url == INVENTORY_URL
+
+    def test_rejected_session_is_dropped_and_the_ui_login_runs_again(self, tmp_path):
+        cache, logins = SessionCache(tmp_path, ttl=60), []
+        _authenticate(cache, _AppDriver(token="token-1"), logins)
+        # The app no longer accepts the cached cookie: the login form shows up after restoring.
+        assert _authenticate(cache, _AppDriver(token="token-2"), logins) is False
+        assert logins == ["token-1", "token-2"]
+        assert cache.load("standard_user", ORIGIN).cookies[0]["value"] == "token-2"
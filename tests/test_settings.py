@@ -0,0 +1,28 @@
+"""Lazily loaded, process-wide settings and the worker start-up benchmark parser."""
+
+from benchmarks.worker_startup import parse_importtime
+from core.config.browser_config import BrowserConfig, browser_config, get_browser_config
+from core.config.sauce_demo_env import SauceDemoEnv
+
+
+class TestSettings:
+
+    def test_settings_fixture_is_the_cached_instance(self, settings: BrowserConfig):
+        assert settings is get_browser_config()
+        assert browser_config.browser is settings.browser
+
+    def test_module_handle_writes_through_to_the_shared_instance(self, monkeypatch, settings: BrowserConfig):
+        monkeypatch.setattr(browser_config, "timing_top_n", 3)
+        assert settings.timing_top_n == 3
+
+    def test_sauce_demo_values_are_stripped_and_missing_ones_named(self):
+        config = BrowserConfig(_env_file=None, url=" https://example.test ", user="standard_user", **{"pass": ""})
+        assert config.missing_sauce_demo == ["PASS"]
+        config = BrowserConfig(_env_file=None, url="https://example.test", user=" u ", **{"pass": "p"})
+        assert config.sauce_demo == SauceDemoEnv("https://example.test", "u", "p")
+
+    def test_importtime_output_is_parsed_to_cumulative_microseconds(self):
+        stderr = ("import time: self [us] | cumulative | imported package\n"
+                  "import time:       120 |        120 |   selenium.types\n"
+                  "import time:       300 |        420 | selenium\n")
+        assert parse_importtime(stderr) == {"selenium.types": 120, "selenium": 420}
@@ -0,0 +1,52 @@
+"""Step timing split (wait / navigation / command) and aggregation."""
+
+import time
+
+from core.instrumentation.step_timings import StepTiming, StepTimings, summarize
+from tests.fake_webdriver import FakeWebDriver
+
+
+class TestStepTimings:
+
+    def test_wait_and_navigation_are_credited_to_enclosing_steps(self):
+        timings = StepTimings()
+        timings.enabled = True
+        driver = FakeWebDriver()
+        timings.instrument_navigation(driver)
+        timings.current_test = "tests/test_x.py::test_y"
+
+        with timings.step("LoginPage.login", category="page"):
+            driver.get("https://example.test/")
+            with timings.step("Actions.click", ("id", "login-button")):
+                timings.add_wait(0.25)
+                time.sleep(0.01)
+
+        navigation, click, page = timings.records
+        assert navigation.step == "WebDriver.get" and navigation.category == "navigation"
+        assert click.locator == "('id', 'login-button')" and click.wait == 0.25
+        assert page.wait == 0.25 and page.navigation == navigation.total
+        assert all(record.test == "tests/test_x.py::test_y" for record in timings.records)
+
+        timings.current_test = "tests/test_x.py::test_z"
+        with timings.step("Actions.click", ("id", "other")):
+            pass
+        assert timings.for_test("tests/test_x.py::test_y") == [navigation, click, page]
+        assert [record.locator for record in timings.for_test("tests/test_x.py::test_z")] == ["('id', 'other')"]
+
+    def test_summary_groups_by_step_and_locator(self):
+        timings = StepTimings()
+        timings.enabled = True
+        for _ in range(3):
+            with timings.step("Actions.click", ("id", "a")):
+                pass
+        with timings.step("Actions.click", ("id", "b")):
+            time.sleep(0.01)
+
+        summary = summarize(timings.records)
+        assert summary[0]["locator"] == "('id', 'b')"
+        assert {row["locator"]: row["count"] for row in summary} == {"('id', 'b')": 1, "('id', 'a')": 3}
+
+    def test_summary_p95_is_the_nearest_rank(self):
+        records = [StepTiming("t", "Actions.click", "('id', 'a')", "action", total, 0, 0, total)
+                   for total in range(1, 21)]
+        assert summarize(records)[0]["p95"] == 19
@@ -0,0 +1,90 @@
+"""Backoff schedule, WaitEngine polling and the observer strategy, exercised without a real browser."""
+
+import itertools
+
+import pytest
+from selenium.common import NoSuchElementException, TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+
+from core.actions import scripts
+from core.actions.wait_engine import BackoffSchedule, WaitEngine
+from core.actions.wait_strategy import WaitStrategy
+from tests.fake_webdriver import FakeElement, FakeWebDriver
+
+FAST = BackoffSchedule(first=0.001, factor=2.0, cap=0.004)
+TITLE = (By.CSS_SELECTOR, '[data-test="title"]')
+
+
+class _ObserverWebDriver(FakeWebDriver):
+    """Answers `scripts.WAIT_FOR_ELEMENT` with `result`, or raises it when it is an exception."""
+
+    def __init__(self, result):
+        super().__init__()
+        self.result = result
+        self.observer_args: tuple = ()
+
+    def execute_async_script(self, script: str, *args):
+        self._record("execute_async_script")
+        assert script is scripts.WAIT_FOR_ELEMENT
+        self.observer_args = args
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+class TestWaitEngine:
+
+    def test_backoff_intervals_grow_up_to_cap(self):
+        schedule = BackoffSchedule(first=0.05, factor=2.0, cap=0.3)
+        assert list(itertools.islice(schedule.intervals(), 5)) == [0.05, 0.1, 0.2, 0.3, 0.3]
+
+    def test_until_returns_first_truthy_value_and_records_polls(self):
+        engine = WaitEngine(FakeWebDriver(), WaitStrategy.BACKOFF, FAST)
+        answers = iter([None, NoSuchElementException(), "ready"])
+
+        def condition(driver):
+            answer = next(answers)
+            if isinstance(answer, Exception):
+                raise answer
+            return answer
+
+        assert engine.until(condition, timeout=1, label="three polls") == "ready"
+        record = engine.records[-1]
+        assert (record.label, record.polls, record.succeeded) == ("three polls", 3, True)
+
+    def test_until_times_out(self):
+        engine = WaitEngine(FakeWebDriver(), WaitStrategy.BACKOFF, FAST)
+        with pytest.raises(TimeoutException, match="never"):
+            engine.until(lambda driver: False, timeout=0.02, label="never")
+        assert engine.records[-1].succeeded is False
+
+    def test_observer_returns_the_element_from_one_script(self):
+        title = FakeElement("Products")
+        driver = _ObserverWebDriver(title)
+        engine = WaitEngine(driver, WaitStrategy.OBSERVER, FAST)
+        assert engine.element(TITLE, 2, clickable=True) is title
+        assert driver.observer_args == (*TITLE, True, 2000)
+        assert driver.commands == ["execute_async_script"]
+        record = engine.records[-1]
+        assert (record.strategy, record.polls, record.succeeded) == ("observer", 1, True)
+
+    def test_observer_script_returning_none_is_a_timeout(self):
+        engine = WaitEngine(_ObserverWebDriver(None), WaitStrategy.OBSERVER, FAST)
+        with pytest.raises(TimeoutException, match="visible"):
+            engine.element(TITLE, 0.05)
+        assert engine.records[-1].succeeded is False
+
+    def test_observer_falls_back_to_polling_when_the_script_fails(self):
+        driver = _ObserverWebDriver(WebDriverException("script timeout"))
+        driver.elements[TITLE] = FakeElement("Products")
+        engine = WaitEngine(driver, WaitStrategy.OBSERVER, FAST)
+        assert engine.element(TITLE, 1) is driver.elements[TITLE]
+        assert driver.commands[0] == "execute_async_script" and "find_element" in driver.commands
+        assert engine.records[-1].strategy == "backoff"
+
+    def test_records_are_kept_per_engine(self):
+        first = WaitEngine(FakeWebDriver(), WaitStrategy.BACKOFF, FAST)
+        second = WaitEngine(FakeWebDriver(), WaitStrategy.BACKOFF, FAST)
+        first.until(lambda driver: True, timeout=1, label="first only")
+        assert [record.label for record in first.records] == ["first only"]
+        assert not second.records